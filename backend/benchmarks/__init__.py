@@ -0,0 +1,6 @@
+"""
+Benchmarks of the tabulation, vote loading and serialization hot paths.
+
+Run from the backend directory with ``python -m benchmarks``; see
+benchmarks.runner for the options.
+"""
@@ -0,0 +1,189 @@
+"""
+The benchmarked hot paths, one group each: tabulation, serialization of
+results and ballots, and loading votes from the database.
+"""
+import gc
+import time
+from dataclasses import dataclass, field
+from statistics import mean, median
+from typing import Callable, List
+
+from rest_framework.renderers import JSONRenderer
+
+from benchmarks.electorates import ElectorateSpec, generate_electorate
+from benchmarks.suites import DB_MAX_VOTERS, PURE_PYTHON_MAX_VOTERS
+from ranked_choice.api.serializers import BallotDetailSerializer, BallotResultSerializer
+from ranked_choice.core.domain.items.ballot_item import BallotItem, ChoiceItem
+from ranked_choice.core.domain.items.packed_voters_item import PackedVotersItem
+from ranked_choice.core.domain.workflows.get_votes_workflow import (
+    calculate_ranked_choice_winner,
+    calculate_ranked_choice_winner_compressed,
+    calculate_ranked_choice_winner_vectorized,
+    get_votes_workflow,
+)
+from ranked_choice.core.repositories.ballot_repository import BallotRepository
+
+TABULATORS = {
+    'incremental': calculate_ranked_choice_winner,
+    'compressed': calculate_ranked_choice_winner_compressed,
+    'vectorized': calculate_ranked_choice_winner_vectorized,
+}
+PURE_PYTHON_TABULATORS = {'incremental', 'compressed'}
+
+
+@dataclass
+class BenchmarkResult:
+    group: str
+    name: str
+    electorate: str
+    voters: int
+    choices: int
+    times: List[float] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        return f'{self.group}/{self.name}/{self.electorate}'
+
+    def summary(self) -> dict:
+        return {
+            'group': self.group,
+            'name': self.name,
+            'electorate': self.electorate,
+            'voters': self.voters,
+            'choices': self.choices,
+            'repeat': len(self.times),
+            'min': min(self.times),
+            'median': median(self.times),
+            'mean': mean(self.times),
+        }
+
+
+def measure(fn: Callable[[], object], repeat: int) -> List[float]:
+    """
+    Wall-clock seconds of repeat calls of fn, with the garbage collector
+    paused while each call runs as timeit does.
+    """
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return times
+
+
+def choice_name_map(spec: ElectorateSpec) -> dict:
+    return {
+        choice_id: f'Choice {choice_id}' for choice_id in range(1, spec.choices + 1)
+    }
+
+
+def bench_tabulation(
+        spec: ElectorateSpec,
+        voters: PackedVotersItem,
+        repeat: int
+) -> List[BenchmarkResult]:
+    names = choice_name_map(spec)
+    results = []
+    for name, tabulator in TABULATORS.items():
+        if name in PURE_PYTHON_TABULATORS and spec.voters > PURE_PYTHON_MAX_VOTERS:
+            continue
+        result = BenchmarkResult(
+            'tabulation', name, spec.name, spec.voters, spec.choices
+        )
+        result.times = measure(
+            lambda tabulator=tabulator: tabulator(voters, names), repeat
+        )
+        results.append(result)
+    return results
+
+
+def bench_serialization(
+        spec: ElectorateSpec,
+        voters: PackedVotersItem,
+        repeat: int
+) -> List[BenchmarkResult]:
+    names = choice_name_map(spec)
+    ballot_result = calculate_ranked_choice_winner_vectorized(voters, names)
+    ballot = BallotItem(
+        id=1,
+        title='Benchmark ballot',
+        slug='benchmark-ballot',
+        choices=[
+            ChoiceItem(id=choice_id, name=name, description='')
+            for choice_id, name in names.items()
+        ]
+    )
+    renderer = JSONRenderer()
+
+    results = BenchmarkResult(
+        'serialization', 'results', spec.name, spec.voters, spec.choices
+    )
+    results.times = measure(
+        lambda: renderer.render(BallotResultSerializer(ballot_result).data), repeat
+    )
+    detail = BenchmarkResult(
+        'serialization', 'ballot', spec.name, spec.voters, spec.choices
+    )
+    detail.times = measure(
+        lambda: renderer.render(BallotDetailSerializer(ballot).data), repeat
+    )
+    return [results, detail]
+
+
+def bench_db(
+        spec: ElectorateSpec,
+        voters: PackedVotersItem,
+        repeat: int
+) -> List[BenchmarkResult]:
+    """
+    Times loading an imported electorate back: the packed vote rows, the
+    running ranking tallies, and the uncached results request end to end.
+    Expects a throwaway database, see runner.benchmark_database.
+    """
+    if spec.voters > DB_MAX_VOTERS:
+        return []
+
+    repository = BallotRepository()
+    slug = repository.create_ballot(
+        title=spec.name,
+        choices=[{'name': f'Choice {index}'} for index in range(spec.choices)]
+    )
+    ballot = repository.get_ballot_by_slug(slug)
+    # The same rankings as voters, over the ids of the ballot's choices
+    ballot_voters = generate_electorate(
+        spec, choice_ids=[choice.id for choice in ballot.choices], ballot_id=ballot.id
+    )
+
+    imported = BenchmarkResult('db', 'import', spec.name, spec.voters, spec.choices)
+    imported.times = measure(
+        lambda: repository.import_voters(
+            ballot.id,
+            zip(ballot_voters.names, ballot_voters.rankings(), strict=True)
+        ),
+        1
+    )
+
+    results = [imported]
+    for name, fn in (
+        ('get_votes_by_ballot_id',
+         lambda: repository.get_votes_by_ballot_id(ballot_id=ballot.id)),
+        ('get_ballot_profile',
+         lambda: repository.get_ballot_profile(ballot_id=ballot.id)),
+        ('get_votes_workflow', lambda: get_votes_workflow(slug=slug)),
+    ):
+        result = BenchmarkResult('db', name, spec.name, spec.voters, spec.choices)
+        result.times = measure(fn, repeat)
+        results.append(result)
+    return results
+
+
+GROUPS = {
+    'tabulation': bench_tabulation,
+    'serialization': bench_serialization,
+    'db': bench_db,
+}
@@ -0,0 +1,194 @@
+"""
+Run the benchmarks and record their timings.
+
+    python -m benchmarks [--profile quick|full] [--groups tabulation,db]
+                         [--only zipf] [--repeat 5] [--output PATH]
+                         [--compare BASELINE] [--threshold 0.2]
+
+Timings are written as JSON to benchmarks/results/ unless --output says
+otherwise. With --compare, each fastest run is checked against the same
+benchmark in a previous recording, and the run exits with status 1 when any
+is slower by more than the threshold.
+
+The db group creates a throwaway test database on the configured database
+server and drops it afterwards.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    from benchmarks.cases import GROUPS
+    from benchmarks.suites import PROFILES
+
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks', description='Benchmark the hot paths.'
+    )
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='quick')
+    parser.add_argument(
+        '--groups',
+        default=','.join(GROUPS),
+        help='Comma-separated groups to run, of: ' + ', '.join(GROUPS)
+    )
+    parser.add_argument(
+        '--only', help='Only run electorates whose name contains this text'
+    )
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', type=Path, help='Where to write the timings')
+    parser.add_argument(
+        '--compare', type=Path, help='Previous timings to check for regressions'
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.2,
+        help='Fraction a timing may grow by before it counts as a regression'
+    )
+    args = parser.parse_args(argv)
+
+    args.groups = [group for group in args.groups.split(',') if group]
+    unknown = set(args.groups) - set(GROUPS)
+    if unknown:
+        parser.error(f"unknown groups: {', '.join(sorted(unknown))}")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    return args
+
+
+@contextmanager
+def benchmark_database():
+    """
+    Point the default connection at a fresh test database for the duration.
+    """
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0)
+    try:
+        yield connection.vendor
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def environment(database: str) -> dict:
+    import numpy
+
+    return {
+        'recorded_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'numpy': numpy.__version__,
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'database': database,
+    }
+
+
+def compare(
+        results: List[dict],
+        baseline: List[dict],
+        threshold: float
+) -> List[str]:
+    """
+    The benchmarks whose fastest run grew by more than threshold, described.
+    The fastest run is the least disturbed by whatever else the machine was
+    doing.
+    """
+    def key(result):
+        return result['group'], result['name'], result['electorate']
+
+    previous: Dict[tuple, dict] = {key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get(key(result))
+        if before is None or before['min'] <= 0:
+            continue
+        ratio = result['min'] / before['min']
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{'/'.join(key(result))}: {before['min'] * 1000:.2f} ms -> "
+                f"{result['min'] * 1000:.2f} ms ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def run(args: argparse.Namespace) -> List[dict]:
+    from benchmarks.cases import GROUPS
+    from benchmarks.electorates import generate_electorate
+    from benchmarks.suites import PROFILES
+
+    specs = [
+        spec for spec in PROFILES[args.profile]()
+        if args.only is None or args.only in spec.name
+    ]
+    summaries = []
+    for spec in specs:
+        voters = generate_electorate(spec)
+        for group in args.groups:
+            for result in GROUPS[group](spec, voters, args.repeat):
+                summary = result.summary()
+                summaries.append(summary)
+                print(
+                    f"{result.group:<14} {result.name:<24} {result.electorate:<26} "
+                    f"median {summary['median'] * 1000:10.2f} ms"
+                    f"  min {summary['min'] * 1000:10.2f} ms",
+                    flush=True
+                )
+    return summaries
+
+
+def main(argv=None) -> None:
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ranked_choice.settings')
+    import django
+
+    django.setup()
+
+    args = parse_args(argv)
+    if 'db' in args.groups:
+        with benchmark_database() as database:
+            summaries = run(args)
+    else:
+        database = ''
+        summaries = run(args)
+
+    output = args.output or RESULTS_DIR / (
+        f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{args.profile}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        'environment': environment(database),
+        'profile': args.profile,
+        'results': summaries,
+    }, indent=2) + '\n')
+    print(f"Recorded {len(summaries)} timings in {output}")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())['results']
+        regressions = compare(summaries, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
@@ -0,0 +1,52 @@
+"""
+The electorates each benchmark profile covers.
+
+quick runs in well under a minute and suits checking a change locally.
+full spans 1k to 10M voters and 3 to 500 choices and needs several GB of
+memory at the top end.
+"""
+from typing import Callable, Dict, List
+
+from benchmarks.electorates import KINDS, ElectorateSpec
+
+# Voters above which the pure-Python tabulators are skipped; they take
+# minutes there and the vectorized tabulator is what runs in production
+PURE_PYTHON_MAX_VOTERS = 1_000_000
+
+# Voters above which the database load path is skipped
+DB_MAX_VOTERS = 1_000_000
+
+
+def quick() -> List[ElectorateSpec]:
+    specs = [
+        ElectorateSpec(kind, voters, 10)
+        for kind in KINDS
+        for voters in (1_000, 100_000)
+    ]
+    specs.append(ElectorateSpec('uniform', 10_000, 3))
+    specs.append(ElectorateSpec('zipf', 10_000, 500))
+    return specs
+
+
+def full() -> List[ElectorateSpec]:
+    specs = [
+        ElectorateSpec(kind, voters, 10)
+        for kind in KINDS
+        for voters in (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+    ]
+    specs += [
+        ElectorateSpec('uniform', voters, 3)
+        for voters in (1_000, 100_000, 10_000_000)
+    ]
+    specs += [
+        ElectorateSpec('zipf', voters, choices)
+        for choices in (50, 500)
+        for voters in (1_000, 100_000, 1_000_000)
+    ]
+    return specs
+
+
+PROFILES: Dict[str, Callable[[], List[ElectorateSpec]]] = {
+    'quick': quick,
+    'full': full,
+}
@@ -1,7 +1,17 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 
 
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'ranked_choice.api'
-    label = 'api'
\ No newline at end of file
+    label = 'api'
+
+    def ready(self):
+        from ranked_choice.api.renderers import orjson
+
+        if settings.FAST_JSON_RENDERER_ENABLED and orjson is None:
+            raise ImproperlyConfigured(
+                "FAST_JSON_RENDERER_ENABLED needs the orjson package"
+            )
@@ -0,0 +1,199 @@
+"""
+Async-native views: counterparts of the ballot fetch, vote submission and
+results views, returning the same JSON bodies, and the results stream.
+They are plain Django async views, since DRF views are sync only.
+"""
+import json
+
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponseNotAllowed, JsonResponse, StreamingHttpResponse
+from rest_framework import status
+
+from ranked_choice.api.conditional import result_shape
+from ranked_choice.api.renderers import ballot_result_matrix_payload
+from ranked_choice.api.serializers import (
+    BallotDetailSerializer,
+    BallotResultSerializer,
+    CreateVoterSerializer,
+)
+from ranked_choice.core.domain.workflows.create_vote_workflow import (
+    acreate_vote_workflow,
+)
+from ranked_choice.core.domain.workflows.get_ballot_workflow import (
+    aget_ballot_workflow,
+)
+from ranked_choice.core.domain.workflows.get_votes_workflow import (
+    aget_votes_workflow,
+)
+from ranked_choice.core.repositories.cached_ballot_repository import (
+    cached_ballot_repository,
+)
+from ranked_choice.core.repositories.results_cache import ResultsCache
+from ranked_choice.core.services.instrumentation import stage
+from ranked_choice.core.services.results_broadcaster import results_broadcaster
+
+
+async def get_ballot(request, slug):
+    """
+        Retrieve a ballot using its slug from the URL path.
+
+        Args:
+            request: The HTTP request object
+            slug: The unique identifier for the ballot
+
+        Returns:
+            JsonResponse with serialized ballot data or the appropriate error message
+        """
+    if request.method != 'GET':
+        return HttpResponseNotAllowed(['GET'])
+
+    try:
+        ballot_item = await aget_ballot_workflow(
+            slug=slug, ballot_repository=cached_ballot_repository
+        )
+
+        if ballot_item is None:
+            return JsonResponse(
+                {"error": "Ballot not found"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        with stage('serialize', count_queries=False):
+            data = BallotDetailSerializer(ballot_item).data
+
+        return JsonResponse(data, status=status.HTTP_200_OK)
+
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception:
+        return JsonResponse(
+            {"error": "Internal server error"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+async def create_vote(request):
+    """
+    Create a voter with their ranked votes on a ballot.
+    """
+    if request.method != 'POST':
+        return HttpResponseNotAllowed(['POST'])
+
+    try:
+        data = json.loads(request.body)
+    except ValueError:
+        return JsonResponse(
+            {"error": "Invalid JSON body"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    serializer = CreateVoterSerializer(data=data)
+
+    if not serializer.is_valid():
+        return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    name = serializer.validated_data['name']
+    ballot_id = serializer.validated_data['ballot_id']
+    votes = serializer.validated_data['votes']
+
+    try:
+        await acreate_vote_workflow(name=name, ballot_id=ballot_id, votes=votes)
+        results_broadcaster.notify(ballot_id)
+        return JsonResponse({"status": "success"}, status=status.HTTP_201_CREATED)
+
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception:
+        return JsonResponse(
+            {"error": "Internal server error"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+# Like the DRF views, which are exempt unless session authenticated;
+# csrf_exempt itself only wraps async views from Django 5.0
+create_vote.csrf_exempt = True
+
+
+async def get_votes(request, slug):
+    """
+        Retrieve votes for a ballot
+
+        Query parameters:
+            shape: rounds (the default) or matrix, as for the sync view
+
+        Args:
+            request: The HTTP request object
+            slug: The unique identifier for the ballot
+
+        Returns:
+            JsonResponse with serialized results or the appropriate error message
+        """
+    if request.method != 'GET':
+        return HttpResponseNotAllowed(['GET'])
+
+    try:
+        shape = result_shape(request.GET)
+        results = await aget_votes_workflow(slug=slug, results_cache=ResultsCache())
+
+        with stage('serialize', count_queries=False):
+            if shape == 'matrix':
+                data = ballot_result_matrix_payload(results)
+            else:
+                data = BallotResultSerializer(results).data
+
+        return JsonResponse(data, status=status.HTTP_200_OK)
+
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception:
+        return JsonResponse(
+            {"error": "Internal server error"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+async def stream_votes(request, slug):
+    """
+    Stream the results of a ballot as Server-Sent Events.
+
+    Sends a "result" event with the full result, then a "delta" event with
+    only what changed each time new votes are tabulated. Every viewer of a
+    ballot shares one tabulation.
+
+    Args:
+        request: The HTTP request object
+        slug: The unique identifier for the ballot
+
+    Only an ASGI server can serve the stream: under WSGI Django reads an
+    async iterator to its end before sending anything, and this one never
+    ends, so the view answers 501 instead.
+
+    Returns:
+        StreamingHttpResponse of text/event-stream, or a JSON error
+    """
+    if request.method != 'GET':
+        return HttpResponseNotAllowed(['GET'])
+
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse(
+            {"error": "Streaming results needs the ASGI application"},
+            status=status.HTTP_501_NOT_IMPLEMENTED
+        )
+
+    ballot = await aget_ballot_workflow(
+        slug=slug, ballot_repository=cached_ballot_repository
+    )
+    if ballot is None:
+        return JsonResponse(
+            {"error": "Ballot not found"},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    response = StreamingHttpResponse(
+        results_broadcaster.subscribe(ballot.id, ballot.slug),
+        content_type='text/event-stream'
+    )
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -0,0 +1,184 @@
+"""
+Validators and Cache-Control for conditional GETs of ballots and results.
+
+A ballot's definition only changes with its updated_at, and its results only
+with its votes_version. The ballot validators read updated_at from the
+in-memory ballot cache, so a warm ballot is validated and served without a
+query; results validators read votes_version with one query that skips the
+choices. A request whose copy is still current is answered 304 before the
+view loads anything else.
+"""
+import hashlib
+from datetime import datetime
+from functools import wraps
+from typing import List, Optional
+
+from django.conf import settings
+from django.utils.cache import patch_cache_control
+from rest_framework import status
+
+from ranked_choice.core.domain.items.ballot_item import BallotItem
+from ranked_choice.core.domain.items.ballot_version_item import BallotVersionItem
+from ranked_choice.core.domain.workflows.get_ballot_version_workflow import (
+    get_ballot_version_workflow,
+)
+from ranked_choice.core.domain.workflows.get_ballot_workflow import (
+    get_ballot_workflow,
+)
+from ranked_choice.core.domain.workflows.list_ballots_workflow import (
+    list_ballot_versions_workflow,
+)
+from ranked_choice.core.repositories.cached_ballot_repository import (
+    cached_ballot_repository,
+)
+from ranked_choice.core.repositories.results_cache import RESULTS_CACHE_KEY_PREFIX
+
+
+def list_page_params(query_params) -> tuple:
+    """
+    The (cursor, limit) of a ballot list request. A request with neither
+    lists every ballot, with a limit of None.
+
+    Raises:
+        ValueError: If the limit is not an integer
+    """
+    if 'limit' not in query_params and 'cursor' not in query_params:
+        return None, None
+    limit = query_params.get('limit', settings.BALLOT_LIST_PAGE_SIZE)
+    try:
+        limit = min(int(limit), settings.BALLOT_LIST_MAX_PAGE_SIZE)
+    except ValueError:
+        raise ValueError("Limit must be a positive integer") from None
+    return query_params.get('cursor'), limit
+
+
+# Shapes of a results response; the first is the default
+RESULT_SHAPES = ('rounds', 'matrix')
+
+
+def result_shape(query_params) -> str:
+    """
+    The shape of a results request.
+
+    Raises:
+        ValueError: If the shape is not one of RESULT_SHAPES
+    """
+    shape = query_params.get('shape', RESULT_SHAPES[0])
+    if shape not in RESULT_SHAPES:
+        raise ValueError(f"Shape must be one of {', '.join(RESULT_SHAPES)}")
+    return shape
+
+
+def request_ballot_version(request, slug: str) -> Optional[BallotVersionItem]:
+    """
+    The version of the requested ballot, read once per request however many
+    of the validators and the view ask for it.
+    """
+    if not hasattr(request, '_ballot_version'):
+        request._ballot_version = get_ballot_version_workflow(slug=slug)
+    return request._ballot_version
+
+
+def request_ballot(request, slug: str) -> Optional[BallotItem]:
+    """
+    The requested ballot from the in-memory ballot cache, read once per
+    request, so the validators and the view of a warm ballot share it
+    without a database round trip.
+    """
+    if not hasattr(request, '_ballot'):
+        request._ballot = get_ballot_workflow(
+            slug=slug, ballot_repository=cached_ballot_repository
+        )
+    return request._ballot
+
+
+def ballot_etag(request, slug: str) -> Optional[str]:
+    ballot = request_ballot(request, slug)
+    if ballot is None:
+        return None
+    return f'ballot:{ballot.id}:{ballot.updated_at.timestamp()}'
+
+
+def ballot_last_modified(request, slug: str) -> Optional[datetime]:
+    ballot = request_ballot(request, slug)
+    return ballot.updated_at if ballot is not None else None
+
+
+def results_etag(request, slug: str) -> Optional[str]:
+    version = request_ballot_version(request, slug)
+    if version is None:
+        return None
+    return f'{RESULTS_CACHE_KEY_PREFIX}:{version.id}:{version.votes_version}'
+
+
+def results_shape_etag(request, slug: str) -> Optional[str]:
+    etag = results_etag(request, slug)
+    try:
+        shape = result_shape(request.GET)
+    except ValueError:
+        # Left to the view to answer 400
+        return None
+    if etag is None or shape == RESULT_SHAPES[0]:
+        return etag
+    return f'{etag}:{shape}'
+
+
+def results_export_etag(request, slug: str) -> Optional[str]:
+    etag = results_etag(request, slug)
+    if etag is None:
+        return None
+    return f"{etag}:{request.GET.get('format', 'csv')}"
+
+
+def cast_vote_records_etag(request, slug: str) -> Optional[str]:
+    version = request_ballot_version(request, slug)
+    if version is None:
+        return None
+    return (
+        f"cvr:{version.id}:{version.votes_version}:"
+        f"{request.GET.get('format', 'ndjson')}"
+    )
+
+
+def ballot_list_etag(request) -> Optional[str]:
+    try:
+        cursor, limit = list_page_params(request.GET)
+        versions: List[BallotVersionItem] = list_ballot_versions_workflow(
+            cursor=cursor, limit=limit
+        )
+    except ValueError:
+        # Left to the view to answer 400
+        return None
+
+    digest = hashlib.sha256()
+    for version in versions:
+        digest.update(f'{version.id}:{version.updated_at.timestamp()};'.encode())
+    return f'ballots:{digest.hexdigest()}'
+
+
+def cache_response(max_age_setting: Optional[str] = None):
+    """
+    Decorator setting Cache-Control on 200 and 304 responses.
+
+    With max_age_setting, shared caches may serve the response for that
+    setting's number of seconds; without it they must revalidate every time,
+    which is cheap with an ETag.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            response = view(request, *args, **kwargs)
+            if response.status_code in (
+                status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED
+            ):
+                if max_age_setting is None:
+                    patch_cache_control(response, public=True, no_cache=True)
+                else:
+                    patch_cache_control(
+                        response,
+                        public=True,
+                        max_age=getattr(settings, max_age_setting)
+                    )
+            return response
+        return wrapper
+    return decorator
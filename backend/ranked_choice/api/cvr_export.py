@@ -0,0 +1,84 @@
+"""
+Streaming exports of the anonymized cast vote records of a ballot.
+
+A record is one voter's choice ids ordered by rank, numbered from 1; voter
+names are never exported. Records are listed in a random order fixed per
+votes version, so their numbers say nothing about when each vote was cast
+and an unchanged ballot exports the same bytes for its ETag. Records are
+encoded as they stream from the database and sent CVR_CHUNK_RECORDS at a
+time.
+"""
+import csv
+import hashlib
+import io
+from typing import Dict, Iterable, Iterator, Tuple
+
+from django.conf import settings
+
+from ranked_choice.api.results_export import ExportFormat
+from ranked_choice.core.domain.items.ballot_version_item import BallotVersionItem
+
+# Records encoded per chunk of the response
+CVR_CHUNK_RECORDS = 1000
+
+
+def cvr_shuffle_seed(version: BallotVersionItem) -> int:
+    """
+    The seed of the record order of a ballot at one votes version. Keyed by
+    SECRET_KEY so the order cannot be recomputed outside the server.
+    """
+    digest = hashlib.sha256(
+        f'{settings.SECRET_KEY}:cvr:{version.id}:{version.votes_version}'.encode()
+    ).digest()
+    return int.from_bytes(digest[:8], 'big')
+
+
+def ndjson_chunks(rankings: Iterable[Tuple[int, ...]]) -> Iterator[bytes]:
+    """
+    One {"record": n, "ranking": [choice ids]} JSON object per line.
+    """
+    lines = []
+    for record, ranking in enumerate(rankings, start=1):
+        # Only ints, so formatted directly instead of through json.dumps
+        lines.append(
+            f'{{"record":{record},"ranking":[{",".join(map(str, ranking))}]}}\n'
+        )
+        if len(lines) == CVR_CHUNK_RECORDS:
+            yield ''.join(lines).encode()
+            lines.clear()
+    if lines:
+        yield ''.join(lines).encode()
+
+
+def csv_chunks(rankings: Iterable[Tuple[int, ...]]) -> Iterator[bytes]:
+    """
+    One record,rank,choice_id row per vote; a record without votes has one
+    row with empty rank and choice_id.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+
+    def flush() -> bytes:
+        chunk = buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+    writer.writerow(('record', 'rank', 'choice_id'))
+    for record, ranking in enumerate(rankings, start=1):
+        if ranking:
+            writer.writerows(
+                (record, rank, choice_id)
+                for rank, choice_id in enumerate(ranking, start=1)
+            )
+        else:
+            writer.writerow((record, '', ''))
+        if record % CVR_CHUNK_RECORDS == 0:
+            yield flush()
+    yield flush()
+
+
+CVR_FORMATS: Dict[str, ExportFormat] = {
+    'ndjson': ExportFormat('application/x-ndjson', 'ndjson', ndjson_chunks),
+    'csv': ExportFormat('text/csv; charset=utf-8', 'csv', csv_chunks),
+}
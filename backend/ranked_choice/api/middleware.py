@@ -0,0 +1,46 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from ranked_choice.core.services.instrumentation import (
+    collect_request_timings,
+    server_timing,
+)
+
+
+class ServerTimingMiddleware:
+    """
+    Report the instrumented stages of each request in a Server-Timing
+    header, so browser dev tools show where the time of a slow request went.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        if not settings.SERVER_TIMING_ENABLED:
+            return self.get_response(request)
+
+        with collect_request_timings() as timings:
+            response = self.get_response(request)
+        return self._add_header(response, timings)
+
+    async def __acall__(self, request):
+        if not settings.SERVER_TIMING_ENABLED:
+            return await self.get_response(request)
+
+        with collect_request_timings() as timings:
+            response = await self.get_response(request)
+        return self._add_header(response, timings)
+
+    @staticmethod
+    def _add_header(response, timings):
+        if timings and not response.has_header('Server-Timing'):
+            response['Server-Timing'] = server_timing(timings)
+        return response
@@ -0,0 +1,14 @@
+from django.conf import settings
+from rest_framework.permissions import BasePermission
+
+
+class CanReadMetrics(BasePermission):
+    """
+    Let staff users, and scrapers at an address in METRICS_ALLOWED_IPS, read
+    the process metrics.
+    """
+
+    def has_permission(self, request, view) -> bool:
+        if request.user and request.user.is_staff:
+            return True
+        return request.META.get('REMOTE_ADDR') in settings.METRICS_ALLOWED_IPS
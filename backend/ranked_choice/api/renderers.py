@@ -0,0 +1,144 @@
+"""
+Fast JSON rendering of ballots and results.
+
+With FAST_JSON_RENDERER_ENABLED and orjson installed, the fetch views skip
+the DRF serializers: they hand OrjsonRenderer a FastJSONDict or
+FastJSONList holding the domain items' RoundItem and ChoiceItem dataclasses,
+which orjson encodes natively. The bytes match what JSONRenderer writes for
+the serializers' data, as the renderer tests check. Any other data, or a
+request for indented output, is rendered the JSONRenderer way.
+
+orjson is in the requirements; the app refuses to start with the setting on
+and orjson missing rather than quietly falling back.
+"""
+import json
+from typing import List
+
+from django.conf import settings
+from rest_framework.renderers import JSONRenderer
+
+from ranked_choice.api.serializers import BallotDetailSerializer, BallotResultSerializer
+from ranked_choice.core.domain.items.ballot_item import BallotItem, BallotResultItem
+from ranked_choice.core.domain.items.round_matrix_item import RoundMatrixItem
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONDict(dict):
+    """
+    A response body in a serializer's field order, for OrjsonRenderer.
+    """
+
+
+class FastJSONList(list):
+    """
+    A list of FastJSONDict response bodies, for OrjsonRenderer.
+    """
+
+
+def fast_json_enabled() -> bool:
+    return orjson is not None and settings.FAST_JSON_RENDERER_ENABLED
+
+
+def ballot_result_payload(result: BallotResultItem) -> FastJSONDict:
+    """
+    The body BallotResultSerializer gives result, with its RoundItems as is.
+    """
+    return FastJSONDict(
+        winner_id=result.winner_id,
+        winner_name=result.winner_name,
+        title=result.title,
+        rounds=result.rounds
+    )
+
+
+def ballot_result_matrix_payload(result: BallotResultItem) -> dict:
+    """
+    The result as a round matrix: the choices once, then per round the votes
+    of each choice in that order, the change in them since the round before
+    and the ids of the choices eliminated after it.
+    """
+    matrix = result.matrix or RoundMatrixItem()
+    width = len(matrix.choice_ids)
+    transfers = matrix.transfers()
+    return dict(
+        winner_id=result.winner_id,
+        winner_name=result.winner_name,
+        title=result.title,
+        choices=[
+            {'id': choice_id, 'name': name}
+            for choice_id, name in zip(
+                matrix.choice_ids, matrix.choice_names, strict=True
+            )
+        ],
+        rounds=[
+            matrix.round_votes(round_index).tolist()
+            for round_index in range(matrix.round_count)
+        ],
+        transfers=[
+            transfers[start:start + width].tolist()
+            for start in range(0, len(transfers), width or 1)
+        ],
+        eliminated=matrix.eliminated()
+    )
+
+
+def ballot_detail_payload(ballot: BallotItem) -> FastJSONDict:
+    """
+    The body BallotDetailSerializer gives ballot, with its ChoiceItems as is.
+    """
+    return FastJSONDict(
+        id=ballot.id,
+        title=ballot.title,
+        slug=ballot.slug,
+        description=ballot.description,
+        choices=ballot.choices
+    )
+
+
+def ballot_result_data(result: BallotResultItem, shape: str = 'rounds'):
+    if shape == 'matrix':
+        # Plain lists and dicts, so the serializers have nothing to add
+        payload = ballot_result_matrix_payload(result)
+        return FastJSONDict(payload) if fast_json_enabled() else payload
+    if fast_json_enabled():
+        return ballot_result_payload(result)
+    return BallotResultSerializer(result).data
+
+
+def ballot_detail_data(ballot: BallotItem):
+    if fast_json_enabled():
+        return ballot_detail_payload(ballot)
+    return BallotDetailSerializer(ballot).data
+
+
+def ballot_list_data(ballots: List[BallotItem]):
+    if fast_json_enabled():
+        return FastJSONList(map(ballot_detail_payload, ballots))
+    return BallotDetailSerializer(ballots, many=True).data
+
+
+class OrjsonRenderer(JSONRenderer):
+    """
+    JSONRenderer encoding FastJSONDict and FastJSONList bodies with orjson.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if not isinstance(data, (FastJSONDict, FastJSONList)):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or self.ensure_ascii or not self.compact:
+            # Formatting orjson cannot match; render its plain values instead
+            data = json.loads(orjson.dumps(data))
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # JSONRenderer escapes these to keep the output valid JavaScript
+        return (
+            orjson.dumps(data)
+            .replace('\u2028'.encode(), b'\\u2028')
+            .replace('\u2029'.encode(), b'\\u2029')
+        )
@@ -0,0 +1,188 @@
+"""
+Streaming exports of the round matrix of a result.
+
+Every format has one row per round and choice, with the columns in
+EXPORT_COLUMNS, read straight from the flat arrays of a RoundMatrixItem
+instead of through the rounds of the JSON result. CSV and Arrow are written
+one round at a time; Parquet keeps its footer at the end, so it is built
+whole before it is streamed. Arrow and Parquet need the optional pyarrow
+package.
+"""
+import csv
+import io
+from dataclasses import dataclass
+from itertools import repeat
+from typing import Callable, Dict, Iterator
+
+import numpy as np
+
+from ranked_choice.core.domain.items.round_matrix_item import RoundMatrixItem
+
+EXPORT_COLUMNS = ('round_index', 'choice_id', 'choice_name', 'votes', 'transfer')
+
+# Leading characters that make a spreadsheet read a cell as a formula
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+# Bytes of a built Parquet file sent per chunk
+PARQUET_CHUNK_SIZE = 64 * 1024
+
+
+class ExportFormatUnavailable(Exception):
+    """
+    Raised when a format needs a package that is not installed.
+    """
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    content_type: str
+    extension: str
+    write: Callable[..., Iterator[bytes]]
+
+
+def spreadsheet_safe(value: str) -> str:
+    """
+    value with a leading ' when a spreadsheet would read it as a formula.
+    """
+    return f"'{value}" if value.startswith(FORMULA_PREFIXES) else value
+
+
+def csv_chunks(matrix: RoundMatrixItem) -> Iterator[bytes]:
+    """
+    The matrix as CSV, a header and then one chunk per round. Choice names
+    come from whoever created the ballot, so any that a spreadsheet would
+    run as a formula are escaped.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+
+    def flush() -> bytes:
+        chunk = buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+    writer.writerow(EXPORT_COLUMNS)
+    yield flush()
+
+    width = len(matrix.choice_ids)
+    transfers = matrix.transfers()
+    choice_names = [spreadsheet_safe(name) for name in matrix.choice_names]
+    for round_index in range(matrix.round_count):
+        start = round_index * width
+        writer.writerows(zip(
+            repeat(round_index, width),
+            matrix.choice_ids,
+            choice_names,
+            matrix.votes[start:start + width],
+            transfers[start:start + width],
+            strict=True
+        ))
+        yield flush()
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ExportFormatUnavailable(
+            "This export format needs the pyarrow package"
+        ) from None
+    return pyarrow
+
+
+def _record_batches(pa, matrix: RoundMatrixItem) -> Iterator:
+    """
+    One record batch per round, over the matrix's own buffers.
+    """
+    schema = _schema(pa)
+    width = len(matrix.choice_ids)
+    choice_ids = pa.array(np.frombuffer(matrix.choice_ids, dtype=np.int64))
+    choice_names = pa.DictionaryArray.from_arrays(
+        pa.array(np.arange(width, dtype=np.int32)),
+        pa.array(matrix.choice_names, type=pa.string())
+    )
+    votes = np.frombuffer(matrix.votes, dtype=np.int64)
+    transfers = np.frombuffer(matrix.transfers(), dtype=np.int64)
+
+    for round_index in range(matrix.round_count):
+        start = round_index * width
+        yield pa.record_batch([
+            pa.array(np.full(width, round_index, dtype=np.int64)),
+            choice_ids,
+            choice_names,
+            pa.array(votes[start:start + width]),
+            pa.array(transfers[start:start + width]),
+        ], schema=schema)
+
+
+def _schema(pa):
+    return pa.schema([
+        ('round_index', pa.int64()),
+        ('choice_id', pa.int64()),
+        ('choice_name', pa.dictionary(pa.int32(), pa.string())),
+        ('votes', pa.int64()),
+        ('transfer', pa.int64()),
+    ])
+
+
+def arrow_chunks(matrix: RoundMatrixItem) -> Iterator[bytes]:
+    """
+    The matrix as an Arrow IPC stream, one record batch per round.
+
+    Raises:
+        ExportFormatUnavailable: If pyarrow is not installed
+    """
+    pa = _pyarrow()
+
+    def stream() -> Iterator[bytes]:
+        sink = io.BytesIO()
+
+        def flush() -> bytes:
+            chunk = sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+            return chunk
+
+        writer = pa.ipc.new_stream(sink, _schema(pa))
+        yield flush()
+        for batch in _record_batches(pa, matrix):
+            writer.write_batch(batch)
+            yield flush()
+        writer.close()
+        yield flush()
+
+    return stream()
+
+
+def parquet_chunks(matrix: RoundMatrixItem) -> Iterator[bytes]:
+    """
+    The matrix as a Parquet file, one row group per round.
+
+    Raises:
+        ExportFormatUnavailable: If pyarrow is not installed
+    """
+    pa = _pyarrow()
+    import pyarrow.parquet as pq
+
+    def stream() -> Iterator[bytes]:
+        sink = io.BytesIO()
+        with pq.ParquetWriter(sink, _schema(pa)) as writer:
+            for batch in _record_batches(pa, matrix):
+                writer.write_table(pa.Table.from_batches([batch]))
+        data = sink.getbuffer()
+        for start in range(0, len(data), PARQUET_CHUNK_SIZE):
+            yield bytes(data[start:start + PARQUET_CHUNK_SIZE])
+
+    return stream()
+
+
+EXPORT_FORMATS: Dict[str, ExportFormat] = {
+    'csv': ExportFormat('text/csv; charset=utf-8', 'csv', csv_chunks),
+    'arrow': ExportFormat(
+        'application/vnd.apache.arrow.stream', 'arrows', arrow_chunks
+    ),
+    'parquet': ExportFormat(
+        'application/vnd.apache.parquet', 'parquet', parquet_chunks
+    ),
+}
@@ -1,14 +1,49 @@
 from django.urls import path
 
-from . import views
+from . import async_views, views
 
 app_name = 'api'
 
 urlpatterns = [
     path('health/', views.health_check, name='health_check'),
+    path('metrics/', views.metrics, name='metrics'),
     path('ballots/', views.create_ballot, name='create_ballot'),
     path('ballots/all/', views.list_ballots, name='list_ballots'),
+    path('ballots/bulk/', views.create_ballots, name='create_ballots'),
     path('ballots/<slug:slug>/', views.get_ballot, name='get_ballot'),
+    path(
+        'ballots/<slug:slug>/cvr/',
+        views.export_cast_vote_records,
+        name='export_cast_vote_records'
+    ),
     path('ballots/results/<slug:slug>/', views.get_votes, name='get_votes'),
+    path(
+        'ballots/results/<slug:slug>/provisional/',
+        views.get_provisional_votes,
+        name='get_provisional_votes'
+    ),
+    path(
+        'ballots/results/<slug:slug>/export/',
+        views.export_results,
+        name='export_results'
+    ),
+    path(
+        'ballots/results/<slug:slug>/stream/',
+        async_views.stream_votes,
+        name='stream_votes'
+    ),
     path('vote/', views.create_vote, name='create_vote'),
+    path('vote/bulk/', views.create_votes, name='create_votes'),
+    # Async-native views, for ASGI deployments
+    path(
+        'async/ballots/<slug:slug>/',
+        async_views.get_ballot,
+        name='async_get_ballot'
+    ),
+    path(
+        'async/ballots/results/<slug:slug>/',
+        async_views.get_votes,
+        name='async_get_votes'
+    ),
+    path('async/vote/', async_views.create_vote, name='async_create_vote'),
 ]
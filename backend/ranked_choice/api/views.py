@@ -1,25 +1,67 @@
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import condition, require_GET
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
+from ranked_choice.api.conditional import (
+    ballot_etag,
+    ballot_last_modified,
+    ballot_list_etag,
+    cache_response,
+    cast_vote_records_etag,
+    list_page_params,
+    request_ballot,
+    request_ballot_version,
+    result_shape,
+    results_export_etag,
+    results_shape_etag,
+)
+from ranked_choice.api.cvr_export import CVR_FORMATS, cvr_shuffle_seed
+from ranked_choice.api.permissions import CanReadMetrics
+from ranked_choice.api.renderers import (
+    ballot_detail_data,
+    ballot_list_data,
+    ballot_result_data,
+)
+from ranked_choice.api.results_export import EXPORT_FORMATS, ExportFormatUnavailable
 from ranked_choice.api.serializers import (
-    BallotDetailSerializer,
-    BallotResultSerializer,
     CreateBallotSerializer,
     CreateVoterSerializer,
 )
+from ranked_choice.core.domain.items.ballot_cursor_item import BallotCursorItem
+from ranked_choice.core.domain.items.round_matrix_item import RoundMatrixItem
 from ranked_choice.core.domain.workflows.create_ballot_workflow import (
     create_ballot_workflow,
 )
+from ranked_choice.core.domain.workflows.create_ballots_workflow import (
+    create_ballots_workflow,
+)
 from ranked_choice.core.domain.workflows.create_vote_workflow import (
     create_vote_workflow,
 )
-from ranked_choice.core.domain.workflows.get_ballot_workflow import get_ballot_workflow
+from ranked_choice.core.domain.workflows.create_voters_workflow import (
+    create_voters_workflow,
+)
+from ranked_choice.core.domain.workflows.get_provisional_votes_workflow import (
+    get_provisional_votes_workflow,
+)
 from ranked_choice.core.domain.workflows.get_votes_workflow import get_votes_workflow
+from ranked_choice.core.domain.workflows.iter_cast_vote_records_workflow import (
+    iter_cast_vote_records_workflow,
+)
 from ranked_choice.core.domain.workflows.list_ballots_workflow import (
     list_ballots_workflow,
 )
+from ranked_choice.core.repositories.results_cache import ResultsCache
+from ranked_choice.core.services.instrumentation import metrics_registry, stage
+from ranked_choice.core.services.results_broadcaster import results_broadcaster
+from ranked_choice.core.services.vote_queue import get_vote_queue
+from ranked_choice.core.services.vote_queue_interface import VoteQueueFull
 
 
 @api_view(['GET'])
@@ -31,6 +73,19 @@ def health_check(request):
     return Response({"status": "ok"})
 
 
+@api_view(['GET'])
+@permission_classes([CanReadMetrics])
+def metrics(request):
+    """
+    Expose the stage timings and cache counters of this process in the
+    Prometheus text format.
+    """
+    return HttpResponse(
+        metrics_registry.render(),
+        content_type='text/plain; version=0.0.4; charset=utf-8'
+    )
+
+
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def create_ballot(request):
@@ -64,6 +119,41 @@ def create_ballot(request):
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def create_ballots(request):
+    """
+    Create many ballots with their choices in a single transaction.
+    Expects a JSON list of ballots in the same shape as create_ballot, and
+    returns the created ballots with their choice ids.
+    """
+    serializer = CreateBallotSerializer(
+        data=request.data,
+        many=True,
+        allow_empty=False,
+        max_length=settings.BULK_BALLOT_MAX_BALLOTS
+    )
+
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        ballot_items = create_ballots_workflow(ballots=serializer.validated_data)
+        return Response(
+            ballot_list_data(ballot_items), status=status.HTTP_201_CREATED
+        )
+
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception:
+        return Response(
+            {"error": "Internal server error"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@cache_response('BALLOT_CACHE_MAX_AGE_SECONDS')
+@condition(etag_func=ballot_etag, last_modified_func=ballot_last_modified)
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def get_ballot(request, slug):
@@ -78,7 +168,7 @@ def get_ballot(request, slug):
             Response with serialized ballot data or the appropriate error message
         """
     try:
-        ballot_item = get_ballot_workflow(slug=slug)
+        ballot_item = request_ballot(request, slug)
 
         if ballot_item is None:
             return Response(
@@ -86,9 +176,10 @@ def get_ballot(request, slug):
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        serializer = BallotDetailSerializer(ballot_item)
+        with stage('serialize'):
+            data = ballot_detail_data(ballot_item)
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(data, status=status.HTTP_200_OK)
 
     except ValueError as e:
         return Response(
@@ -117,8 +208,12 @@ def create_vote(request):
     ballot_id = serializer.validated_data['ballot_id']
     votes = serializer.validated_data['votes']
 
+    if settings.VOTE_QUEUE_ENABLED:
+        return _queue_vote(name=name, ballot_id=ballot_id, votes=votes)
+
     try:
         create_vote_workflow(name=name, ballot_id=ballot_id, votes=votes)
+        results_broadcaster.notify(ballot_id)
         return Response({"status": "success"}, status=status.HTTP_201_CREATED)
 
     except ValueError as e:
@@ -130,11 +225,93 @@ def create_vote(request):
         )
 
 
+def _queue_vote(name, ballot_id, votes):
+    """
+    Hand a vote to the write-behind queue.
+
+    Answers 201 once the vote's batch is committed when acks are durable,
+    202 when the vote is only queued, and 503 when the queue is full.
+    """
+    try:
+        future = create_vote_workflow(
+            name=name,
+            ballot_id=ballot_id,
+            votes=votes,
+            vote_queue=get_vote_queue()
+        )
+        if future is not None and settings.VOTE_QUEUE_DURABLE_ACK:
+            future.result(timeout=settings.VOTE_QUEUE_ACK_TIMEOUT_SECONDS)
+        elif future is not None:
+            return Response({"status": "queued"}, status=status.HTTP_202_ACCEPTED)
+        return Response({"status": "success"}, status=status.HTTP_201_CREATED)
+
+    except VoteQueueFull as e:
+        response = Response(
+            {"error": str(e)},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+        response['Retry-After'] = '1'
+        return response
+    except FutureTimeoutError:
+        # Still queued, so the vote will be written; it just was not in time
+        return Response({"status": "queued"}, status=status.HTTP_202_ACCEPTED)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception:
+        return Response(
+            {"error": "Internal server error"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def create_votes(request):
+    """
+    Create many voters with their votes in a single transaction.
+    Expects a JSON list of voters in the same shape as create_vote.
+    """
+    serializer = CreateVoterSerializer(
+        data=request.data,
+        many=True,
+        allow_empty=False,
+        max_length=settings.BULK_VOTE_MAX_VOTERS
+    )
+
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        created = create_voters_workflow(voters=serializer.validated_data)
+        for ballot_id in {voter['ballot_id'] for voter in serializer.validated_data}:
+            results_broadcaster.notify(ballot_id)
+        return Response(
+            {"status": "success", "created": created},
+            status=status.HTTP_201_CREATED
+        )
+
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception:
+        return Response(
+            {"error": "Internal server error"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@cache_response()
+@condition(etag_func=ballot_list_etag)
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def list_ballots(request):
     """
-    Retrieve all ballots.
+    Retrieve every ballot, or a page of them when either query parameter is
+    given.
+
+    Query parameters:
+        cursor: Opaque cursor from the X-Next-Cursor header of a previous page
+        limit: Page size, BALLOT_LIST_PAGE_SIZE by default and capped at
+            BALLOT_LIST_MAX_PAGE_SIZE
 
     Args:
         request: The HTTP request object
@@ -143,9 +320,16 @@ def list_ballots(request):
         Response with serialized list of ballots or the appropriate error message
     """
     try:
-        ballot_items = list_ballots_workflow()
-        serializer = BallotDetailSerializer(ballot_items, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        cursor, limit = list_page_params(request.query_params)
+
+        ballot_items = list_ballots_workflow(cursor=cursor, limit=limit)
+        with stage('serialize'):
+            data = ballot_list_data(ballot_items)
+        response = Response(data, status=status.HTTP_200_OK)
+        if len(ballot_items) == limit:
+            next_cursor = BallotCursorItem.from_ballot(ballot_items[-1])
+            response['X-Next-Cursor'] = next_cursor.encode()
+        return response
 
     except ValueError as e:
         return Response(
@@ -158,12 +342,19 @@ def list_ballots(request):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
+
+@cache_response()
+@condition(etag_func=results_shape_etag)
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def get_votes(request, slug):
     """
         Retrieve votes for a ballot
 
+        Query parameters:
+            shape: rounds (the default), one item per round and choice, or
+                matrix, the choices once and an array of votes per round
+
         Args:
             request: The HTTP request object
             slug: The unique identifier for the ballot
@@ -172,7 +363,8 @@ def get_votes(request, slug):
             Response with serialized ballot data or the appropriate error message
         """
     try:
-        results = get_votes_workflow(slug=slug)
+        shape = result_shape(request.query_params)
+        results = get_votes_workflow(slug=slug, results_cache=ResultsCache())
 
         if results is None:
             return Response(
@@ -180,9 +372,10 @@ def get_votes(request, slug):
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        serializer = BallotResultSerializer(results)
+        with stage('serialize'):
+            data = ballot_result_data(results, shape)
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(data, status=status.HTTP_200_OK)
 
     except ValueError as e:
         return Response(
@@ -194,3 +387,146 @@ def get_votes(request, slug):
             {"error": "Internal server error", "error_details": str(e)},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
+
+
+# A plain Django view: DRF would take the format query parameter as a
+# renderer override
+@cache_response()
+@condition(etag_func=cast_vote_records_etag)
+@require_GET
+def export_cast_vote_records(request, slug):
+    """
+        Stream the anonymized cast vote records of a ballot
+
+        Query parameters:
+            format: ndjson (the default) or csv
+
+        Args:
+            request: The HTTP request object
+            slug: The unique identifier for the ballot
+
+        Returns:
+            StreamingHttpResponse with one record per voter, or a JSON error
+        """
+    export_format = CVR_FORMATS.get(request.GET.get('format', 'ndjson'))
+    if export_format is None:
+        return JsonResponse(
+            {"error": f"Format must be one of {', '.join(CVR_FORMATS)}"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    try:
+        version = request_ballot_version(request, slug)
+        if version is None:
+            return JsonResponse(
+                {"error": "Ballot not found"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+    except Exception:
+        return JsonResponse(
+            {"error": "Internal server error"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+    response = StreamingHttpResponse(
+        export_format.write(iter_cast_vote_records_workflow(
+            ballot_id=version.id, shuffle_seed=cvr_shuffle_seed(version)
+        )),
+        content_type=export_format.content_type
+    )
+    response['Content-Disposition'] = (
+        f'attachment; filename="{slug}-cvr.{export_format.extension}"'
+    )
+    return response
+
+
+# A plain Django view: DRF would take the format query parameter as a
+# renderer override
+@cache_response()
+@condition(etag_func=results_export_etag)
+@require_GET
+def export_results(request, slug):
+    """
+        Stream the round-by-round tallies of a ballot as a file
+
+        Query parameters:
+            format: csv (the default), arrow or parquet
+
+        Args:
+            request: The HTTP request object
+            slug: The unique identifier for the ballot
+
+        Returns:
+            StreamingHttpResponse with one row per round and choice, or a JSON
+            error
+        """
+    export_format = EXPORT_FORMATS.get(request.GET.get('format', 'csv'))
+    if export_format is None:
+        return JsonResponse(
+            {"error": f"Format must be one of {', '.join(EXPORT_FORMATS)}"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    try:
+        if request_ballot_version(request, slug) is None:
+            return JsonResponse(
+                {"error": "Ballot not found"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        results = get_votes_workflow(slug=slug, results_cache=ResultsCache())
+        chunks = export_format.write(results.matrix or RoundMatrixItem())
+
+    except ExportFormatUnavailable as e:
+        return JsonResponse(
+            {"error": str(e)},
+            status=status.HTTP_501_NOT_IMPLEMENTED
+        )
+    except Exception:
+        return JsonResponse(
+            {"error": "Internal server error"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+    response = StreamingHttpResponse(chunks, content_type=export_format.content_type)
+    response['Content-Disposition'] = (
+        f'attachment; filename="{slug}-results.{export_format.extension}"'
+    )
+    return response
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def get_provisional_votes(request, slug):
+    """
+        Retrieve provisional results for an open ballot from its running tallies
+
+        Query parameters:
+            shape: rounds (the default) or matrix, as for get_votes
+
+        Args:
+            request: The HTTP request object
+            slug: The unique identifier for the ballot
+
+        Returns:
+            Response with serialized ballot data or the appropriate error message
+        """
+    try:
+        shape = result_shape(request.query_params)
+        results = get_provisional_votes_workflow(slug=slug)
+
+        with stage('serialize'):
+            data = ballot_result_data(results, shape)
+
+        return Response(data, status=status.HTTP_200_OK)
+
+    except ValueError as e:
+        return Response(
+            {"error": str(e)},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    except Exception:
+        return Response(
+            {"error": "Internal server error"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
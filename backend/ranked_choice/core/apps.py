@@ -1,7 +1,28 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'ranked_choice.core'
-    label = 'core'
\ No newline at end of file
+    label = 'core'
+
+    def ready(self):
+        from ranked_choice.core.models import Ballot, Choice
+        from ranked_choice.core.repositories.cached_ballot_repository import (
+            cached_ballot_repository,
+            invalidate_cached_ballot,
+        )
+        from ranked_choice.core.services.instrumentation import (
+            cache_stats_metrics,
+            metrics_registry,
+        )
+
+        # Keep the in-memory ballot cache from serving edited ballots
+        for model in (Ballot, Choice):
+            post_save.connect(invalidate_cached_ballot, sender=model)
+            post_delete.connect(invalidate_cached_ballot, sender=model)
+
+        metrics_registry.add_collector(
+            lambda: cache_stats_metrics('ballot', cached_ballot_repository.stats())
+        )
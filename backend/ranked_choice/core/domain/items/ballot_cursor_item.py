@@ -0,0 +1,46 @@
+import binascii
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from dataclasses import dataclass
+from datetime import datetime
+
+from ranked_choice.core.domain.items.ballot_item import BallotItem
+
+
+@dataclass(frozen=True)
+class BallotCursorItem:
+    """
+    Domain item representing a position in the ballot list.
+    Ballots are listed by (created_at, id); a cursor points at the last ballot
+    of a page and the next page starts right after it.
+    """
+    created_at: datetime
+    id: int
+
+    @classmethod
+    def from_ballot(cls, ballot: BallotItem) -> 'BallotCursorItem':
+        return cls(created_at=ballot.created_at, id=ballot.id)
+
+    def encode(self) -> str:
+        """
+        Encode the cursor as an opaque URL-safe token.
+        """
+        raw = f'{self.created_at.isoformat()}|{self.id}'.encode()
+        return urlsafe_b64encode(raw).decode().rstrip('=')
+
+    @classmethod
+    def decode(cls, token: str) -> 'BallotCursorItem':
+        """
+        Decode a token produced by encode.
+
+        Raises:
+            ValueError: If the token is not a valid cursor
+        """
+        try:
+            raw = urlsafe_b64decode(token + '=' * (-len(token) % 4)).decode()
+            created_at, ballot_id = raw.rsplit('|', 1)
+            return cls(
+                created_at=datetime.fromisoformat(created_at),
+                id=int(ballot_id)
+            )
+        except (ValueError, binascii.Error, UnicodeDecodeError) as e:
+            raise ValueError("Invalid cursor") from e
@@ -1,6 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import List, Optional
 
+from ranked_choice.core.domain.items.round_matrix_item import RoundMatrixItem
+
 
 @dataclass
 class RoundItem:
@@ -15,6 +18,9 @@ class BallotResultItem:
     winner_name: str
     rounds: List[RoundItem]
     title: str = ""
+    # The tallies of rounds again, as columns for exports; derived from
+    # rounds, so left out of comparisons
+    matrix: Optional[RoundMatrixItem] = field(default=None, compare=False)
 
 
 @dataclass
@@ -37,6 +43,9 @@ class BallotItem:
     slug: str
     description: Optional[str] = None
     choices: List[ChoiceItem] = None
+    votes_version: int = 0
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     def __post_init__(self):
         if self.choices is None:
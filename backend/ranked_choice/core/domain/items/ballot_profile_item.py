@@ -0,0 +1,29 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Tuple
+
+
+@dataclass
+class BallotProfileItem:
+    """
+    Domain item representing a weighted ballot profile.
+    Maps each distinct ranking (choice ids ordered by preference) to the
+    number of voters who cast it, in the order the rankings were first cast.
+    """
+    rankings: Dict[Tuple[int, ...], int] = field(default_factory=dict)
+
+    @property
+    def total_votes(self) -> int:
+        return sum(self.rankings.values())
+
+    def add(self, ranking: Tuple[int, ...], count: int = 1) -> None:
+        self.rankings[ranking] = self.rankings.get(ranking, 0) + count
+
+    @classmethod
+    def from_rankings(
+            cls,
+            rankings: Iterable[Tuple[int, ...]]
+    ) -> 'BallotProfileItem':
+        profile = cls()
+        for ranking in rankings:
+            profile.add(ranking)
+        return profile
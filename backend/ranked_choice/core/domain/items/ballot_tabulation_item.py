@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+from ranked_choice.core.domain.items.ballot_item import BallotResultItem
+
+
+@dataclass
+class BallotTabulationItem:
+    """
+    Domain item representing one ballot recomputed by a batch tabulation,
+    with the seconds spent loading its votes and tabulating them.
+    """
+    ballot_id: int
+    slug: str
+    votes_version: int
+    total_votes: int
+    load_seconds: float
+    tabulate_seconds: float
+    result: BallotResultItem
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class BallotVersionItem:
+    """
+    Domain item representing what a ballot's representations depend on.
+    A ballot's definition only changes with updated_at and its results only
+    with votes_version, so these are enough to validate a cached copy.
+    """
+    id: int
+    votes_version: int
+    updated_at: datetime
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CacheStatsItem:
+    """
+    Domain item representing the counters of an in-process cache.
+    Evictions count entries dropped to stay within max_size; expirations
+    count entries found past their time to live.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    max_size: int
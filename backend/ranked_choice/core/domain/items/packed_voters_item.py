@@ -0,0 +1,107 @@
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from itertools import islice
+from operator import itemgetter
+from typing import Iterable, Iterator, List, Tuple
+
+from ranked_choice.core.domain.items.voter_item import VoteItem, VoterItem
+
+
+@dataclass(eq=False)
+class PackedVotersItem(Sequence):
+    """
+    Domain item holding the voters of one ballot in a compact CSR layout.
+
+    The votes of voter i are choice_ids[offsets[i]:offsets[i + 1]], ordered by
+    rank, with their ranks at the same positions in ranks. A million voters
+    take a few flat int arrays instead of millions of VoteItem objects.
+
+    Behaves as a read-only sequence of VoterItems, built on access.
+    """
+    ballot_id: int
+    names: List[str] = field(default_factory=list)
+    ranks: array = field(default_factory=lambda: array('i'))
+    choice_ids: array = field(default_factory=lambda: array('i'))
+    offsets: array = field(default_factory=lambda: array('q', [0]))
+
+    def append(self, name: str, votes: Iterable[Tuple[int, int]]) -> None:
+        """
+        Add a voter with (rank, choice id) votes.
+        Votes sharing a rank keep the order in which they were given.
+        """
+        for rank, choice_id in sorted(votes, key=itemgetter(0)):
+            self.ranks.append(rank)
+            self.choice_ids.append(choice_id)
+        self.names.append(name)
+        self.offsets.append(len(self.choice_ids))
+
+    def lengths(self) -> array:
+        """
+        Number of votes of each voter, in cast order.
+        """
+        offsets = self.offsets
+        return array('i', (offsets[i + 1] - offsets[i] for i in range(len(self))))
+
+    def rankings(self) -> Iterator[Tuple[int, ...]]:
+        """
+        Yield each voter's choice ids ordered by rank.
+        """
+        choice_ids = iter(self.choice_ids)
+        offsets = self.offsets
+        for index in range(len(self)):
+            yield tuple(islice(choice_ids, offsets[index + 1] - offsets[index]))
+
+    @classmethod
+    def from_voters(
+            cls,
+            ballot_id: int,
+            voter_items: Iterable[VoterItem]
+    ) -> 'PackedVotersItem':
+        packed = cls(ballot_id=ballot_id)
+        for voter in voter_items:
+            packed.append(
+                voter.name, ((vote.rank, vote.choice_id) for vote in voter.votes)
+            )
+        return packed
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('voter index out of range')
+
+        start, stop = self.offsets[index], self.offsets[index + 1]
+        return VoterItem(
+            name=self.names[index],
+            ballot_id=self.ballot_id,
+            votes=[
+                VoteItem(rank=rank, choice_id=choice_id)
+                for rank, choice_id in zip(
+                    self.ranks[start:stop], self.choice_ids[start:stop], strict=True
+                )
+            ]
+        )
+
+    def __iter__(self) -> Iterator[VoterItem]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PackedVotersItem):
+            return (
+                self.ballot_id == other.ballot_id
+                and self.names == other.names
+                and self.ranks == other.ranks
+                and self.choice_ids == other.choice_ids
+                and self.offsets == other.offsets
+            )
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
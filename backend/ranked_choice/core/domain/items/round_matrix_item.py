@@ -0,0 +1,91 @@
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+
+@dataclass
+class RoundMatrixItem:
+    """
+    Domain item holding the tallies of every round of a result as a dense
+    round x choice matrix.
+
+    Row r of the matrix is votes[r * len(choice_ids):(r + 1) * len(choice_ids)],
+    with the choices in the order they first appear in the rounds. A choice
+    with no ballots in a round, such as one already eliminated, has 0 votes.
+    """
+    choice_ids: array = field(default_factory=lambda: array('q'))
+    choice_names: List[str] = field(default_factory=list)
+    votes: array = field(default_factory=lambda: array('q'))
+
+    @property
+    def round_count(self) -> int:
+        return len(self.votes) // len(self.choice_ids) if self.choice_ids else 0
+
+    def round_votes(self, round_index: int) -> array:
+        """
+        The votes of each choice in one round.
+        """
+        width = len(self.choice_ids)
+        return self.votes[round_index * width:(round_index + 1) * width]
+
+    def transfers(self) -> array:
+        """
+        The change in each choice's votes since the round before, in the
+        layout of votes. Every transfer of the first round is 0.
+        """
+        width = len(self.choice_ids)
+        votes = self.votes
+        transfers = array('q', [0]) * min(width, len(votes))
+        transfers.extend(
+            votes[index] - votes[index - width]
+            for index in range(width, len(votes))
+        )
+        return transfers
+
+    def eliminated(self) -> List[List[int]]:
+        """
+        The ids of the choices eliminated after each round: those with votes
+        in a round and none in the next. The last round eliminates none.
+        """
+        if not self.choice_ids:
+            return []
+        width = len(self.choice_ids)
+        votes = self.votes
+        eliminated = [
+            [
+                self.choice_ids[column] for column in range(width)
+                if votes[start + column] and not votes[start + width + column]
+            ]
+            for start in range(0, len(votes) - width, width)
+        ]
+        eliminated.append([])
+        return eliminated
+
+    @classmethod
+    def from_rounds(
+            cls,
+            rounds: List[Dict[int, int]],
+            choice_name_map: Dict[int, str]
+    ) -> 'RoundMatrixItem':
+        """
+        Build the matrix from a tabulation's per-round {choice id: votes}.
+        """
+        columns: Dict[int, int] = {}
+        for round_dict in rounds:
+            for choice_id in round_dict:
+                columns.setdefault(choice_id, len(columns))
+
+        votes = array('q', [0]) * (len(rounds) * len(columns))
+        for round_index, round_dict in enumerate(rounds):
+            start = round_index * len(columns)
+            for choice_id, count in round_dict.items():
+                votes[start + columns[choice_id]] = count
+
+        return cls(
+            choice_ids=array('q', columns),
+            choice_names=[
+                choice_name_map.get(choice_id, f"Unknown ({choice_id})")
+                for choice_id in columns
+            ],
+            votes=votes
+        )
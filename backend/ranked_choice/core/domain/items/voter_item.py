@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class VoteItem:
     """
     Domain item representing a vote
@@ -10,11 +10,11 @@ class VoteItem:
     choice_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class VoterItem:
     """
     Domain item representing a voter
     """
     name: str
     ballot_id: int
-    votes: list[VoteItem]
\ No newline at end of file
+    votes: list[VoteItem]
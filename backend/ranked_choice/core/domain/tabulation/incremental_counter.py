@@ -0,0 +1,93 @@
+from itertools import repeat
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from ranked_choice.core.domain.tabulation.round_counter_interface import (
+    RoundCounterInterface,
+)
+
+
+class IncrementalRoundCounter(RoundCounterInterface):
+    """
+    Round counter that keeps a pointer to each ballot's top active preference.
+
+    Ballots are stacked in a pile per choice. Eliminating a choice only walks
+    that choice's pile and moves each ballot to its next active preference, so
+    a whole election costs roughly one step per transferred vote instead of a
+    full re-count of every ballot in every round.
+
+    A ballot may carry a weight, so identical rankings can be stacked once
+    with the number of voters who cast them.
+    """
+
+    def __init__(
+            self,
+            rankings: Iterable[Sequence[int]],
+            weights: Optional[Iterable[int]] = None
+    ):
+        """
+        Args:
+            rankings: Choice ids of each ballot ordered by preference, in cast order
+            weights: Optional number of voters behind each ranking, defaults to one
+        """
+        self._rankings: List[Sequence[int]] = []
+        self._weights: List[int] = []
+        self._positions: List[int] = []
+        self._piles: Dict[int, List[int]] = {}
+        self._tallies: Dict[int, int] = {}
+        self._first_ballot: Dict[int, int] = {}
+        self._eliminated: Set[int] = set()
+        self._choice_ids: Set[int] = set()
+        self._total_votes = 0
+
+        weights = repeat(1) if weights is None else weights
+        for index, (ranking, weight) in enumerate(zip(rankings, weights, strict=False)):
+            self._rankings.append(ranking)
+            self._weights.append(weight)
+            self._positions.append(0)
+            self._choice_ids.update(ranking)
+            self._total_votes += weight
+            if ranking:
+                self._stack(index, ranking[0])
+
+    @property
+    def choice_ids(self) -> Set[int]:
+        return self._choice_ids
+
+    @property
+    def total_votes(self) -> int:
+        return self._total_votes
+
+    def count_round(self) -> Dict[int, int]:
+        ordered = sorted(self._piles, key=self._first_ballot.__getitem__)
+        return {choice_id: self._tallies[choice_id] for choice_id in ordered}
+
+    def eliminate(self, choice_id: int) -> None:
+        self._eliminated.add(choice_id)
+        self._first_ballot.pop(choice_id, None)
+        self._tallies.pop(choice_id, None)
+        for index in self._piles.pop(choice_id, []):
+            self._advance(index)
+
+    def _advance(self, index: int) -> None:
+        ranking = self._rankings[index]
+        position = self._positions[index] + 1
+        while position < len(ranking) and ranking[position] in self._eliminated:
+            position += 1
+
+        self._positions[index] = position
+        if position < len(ranking):
+            self._stack(index, ranking[position])
+
+    def _stack(self, index: int, choice_id: int) -> None:
+        weight = self._weights[index]
+        pile = self._piles.get(choice_id)
+        if pile is None:
+            self._piles[choice_id] = [index]
+            self._tallies[choice_id] = weight
+            self._first_ballot[choice_id] = index
+            return
+
+        pile.append(index)
+        self._tallies[choice_id] += weight
+        if index < self._first_ballot[choice_id]:
+            self._first_ballot[choice_id] = index
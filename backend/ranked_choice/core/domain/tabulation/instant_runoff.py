@@ -0,0 +1,128 @@
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from ranked_choice.core.domain.items.ballot_item import BallotResultItem, RoundItem
+from ranked_choice.core.domain.items.packed_voters_item import PackedVotersItem
+from ranked_choice.core.domain.items.round_matrix_item import RoundMatrixItem
+from ranked_choice.core.domain.items.voter_item import VoterItem
+from ranked_choice.core.domain.tabulation.round_counter_interface import (
+    RoundCounterInterface,
+)
+
+
+def map_rounds_to_round_items(
+        rounds: List[Dict[int, int]],
+        choice_name_map: Dict[int, str]
+) -> List[RoundItem]:
+    result = []
+    for round_index, round_dict in enumerate(rounds):
+        for choice_id, votes in round_dict.items():
+            name = choice_name_map.get(choice_id, f"Unknown ({choice_id})")
+            result.append(RoundItem(name=name, votes=votes, round_index=round_index))
+    return result
+
+
+def voter_rankings(voter_items: Iterable[VoterItem]) -> Iterator[Tuple[int, ...]]:
+    """
+    Yield each voter's choice ids ordered by rank.
+    Votes sharing a rank keep the order in which they were cast.
+    """
+    if isinstance(voter_items, PackedVotersItem):
+        yield from voter_items.rankings()
+        return
+
+    by_rank = attrgetter('rank')
+    for voter in voter_items:
+        yield tuple(vote.choice_id for vote in sorted(voter.votes, key=by_rank))
+
+
+def _build_result(
+        winner_id: int,
+        rounds: List[Dict[int, int]],
+        choice_name_map: Dict[int, str]
+) -> BallotResultItem:
+    return BallotResultItem(
+        winner_id=winner_id,
+        winner_name=choice_name_map.get(winner_id, "Unknown"),
+        rounds=map_rounds_to_round_items(rounds, choice_name_map),
+        title="",
+        matrix=RoundMatrixItem.from_rounds(rounds, choice_name_map)
+    )
+
+
+def run_instant_runoff(
+        counter: RoundCounterInterface,
+        choice_name_map: Dict[int, str]
+) -> BallotResultItem:
+    """
+    Run an instant-runoff election over the given round counter.
+
+    Each round is counted, checked for a majority winner and, failing that,
+    the choice with the fewest votes is eliminated. Ties are broken in favour
+    of the choice whose first backing ballot was cast earliest.
+
+    Args:
+        counter: Tabulation state for the election
+        choice_name_map: Mapping of choice id to choice name
+
+    Returns:
+        BallotResultItem: The winner and the per-round tallies
+    """
+    if counter.total_votes == 0:
+        return BallotResultItem(
+            winner_id=-1,
+            winner_name="No votes found",
+            rounds=[],
+            title=""
+        )
+
+    rounds = []
+    remaining_choices = set(counter.choice_ids)
+    majority_threshold = counter.total_votes / 2
+
+    while remaining_choices:
+        vote_counts = counter.count_round()
+        if not vote_counts:
+            break
+
+        rounds.append(vote_counts)
+        max_votes = max(vote_counts.values())
+        winners = [
+            choice_id for choice_id, count
+            in vote_counts.items()
+            if count == max_votes
+        ]
+
+        if max_votes > majority_threshold or len(remaining_choices) <= 1:
+            return _build_result(winners[0], rounds, choice_name_map)
+
+        min_votes = min(vote_counts.values())
+        losers = [
+            choice_id for choice_id, count
+            in vote_counts.items()
+            if count == min_votes
+        ]
+
+        if len(losers) == len(vote_counts) and len(remaining_choices) <= 2:
+            return _build_result(winners[0], rounds, choice_name_map)
+
+        loser = losers[0]
+        remaining_choices.remove(loser)
+        counter.eliminate(loser)
+
+    if rounds:
+        last_round = rounds[-1]
+        max_votes = max(last_round.values())
+        winners = [
+            choice_id for choice_id, count
+            in last_round.items()
+            if count == max_votes
+        ]
+        return _build_result(winners[0], rounds, choice_name_map)
+
+    return BallotResultItem(
+        winner_id=-1,
+        winner_name="No winner",
+        rounds=[],
+        title=""
+    )
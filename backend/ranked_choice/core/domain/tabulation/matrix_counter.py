@@ -0,0 +1,129 @@
+from itertools import chain
+from typing import Dict, Iterable, Sequence, Set
+
+import numpy as np
+
+from ranked_choice.core.domain.tabulation.round_counter_interface import (
+    RoundCounterInterface,
+)
+
+UNRANKED = np.iinfo(np.int32).max
+EXHAUSTED = -1
+
+
+class MatrixRoundCounter(RoundCounterInterface):
+    """
+    Round counter backed by a dense ballots x choices rank matrix.
+
+    Cell (ballot, column) holds the preference position of that choice on the
+    ballot, or UNRANKED. A ballot's top active preference is the masked argmin
+    of its row over the active columns, and the first round is a bincount of
+    those tops. Eliminating a choice re-runs the argmin only for the rows that
+    were sitting on it and bincounts them into the running tallies.
+    """
+
+    def __init__(self, flat_choice_ids: np.ndarray, lengths: np.ndarray):
+        """
+        Args:
+            flat_choice_ids: Every ballot's ranking concatenated, in cast order
+            lengths: Number of choices ranked on each ballot
+        """
+        lengths = np.asarray(lengths, dtype=np.int64)
+        flat_choice_ids = np.asarray(flat_choice_ids, dtype=np.int64)
+        self._total_votes = len(lengths)
+        self._columns = np.unique(flat_choice_ids)
+        column_count = len(self._columns)
+
+        rows = np.repeat(np.arange(self._total_votes), lengths)
+        starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+        positions = (np.arange(len(flat_choice_ids)) - starts).astype(np.int32)
+
+        self._matrix = np.full(
+            (self._total_votes, column_count), UNRANKED, dtype=np.int32
+        )
+        # A choice ranked twice on one ballot counts at its best position
+        np.minimum.at(
+            self._matrix, (rows, self._column_indexes(flat_choice_ids)), positions
+        )
+
+        self._active = np.ones(column_count, dtype=bool)
+        self._tops = self._top_active_columns(self._matrix)
+        self._tallies = np.zeros(column_count, dtype=np.int64)
+        self._first_rows = np.full(column_count, self._total_votes, dtype=np.int64)
+        self._stack(np.arange(self._total_votes), self._tops)
+
+    @classmethod
+    def from_rankings(
+            cls,
+            rankings: Iterable[Sequence[int]]
+    ) -> 'MatrixRoundCounter':
+        """
+        Build a counter from choice ids of each ballot ordered by preference.
+        """
+        rankings = list(rankings)
+        lengths = np.fromiter(map(len, rankings), dtype=np.int64, count=len(rankings))
+        flat_choice_ids = np.fromiter(
+            chain.from_iterable(rankings), dtype=np.int64, count=int(lengths.sum())
+        )
+        return cls(flat_choice_ids, lengths)
+
+    @property
+    def choice_ids(self) -> Set[int]:
+        return {int(choice_id) for choice_id in self._columns}
+
+    @property
+    def total_votes(self) -> int:
+        return self._total_votes
+
+    def count_round(self) -> Dict[int, int]:
+        columns = np.flatnonzero(self._tallies)
+        ordered = columns[np.argsort(self._first_rows[columns], kind='stable')]
+        return {
+            int(self._columns[column]): int(self._tallies[column])
+            for column in ordered
+        }
+
+    def eliminate(self, choice_id: int) -> None:
+        column = int(np.searchsorted(self._columns, choice_id))
+        if column >= len(self._columns) or self._columns[column] != choice_id:
+            return
+
+        self._active[column] = False
+        self._tallies[column] = 0
+        moved_rows = np.flatnonzero(self._tops == column)
+        if len(moved_rows):
+            moved_tops = self._top_active_columns(self._matrix[moved_rows])
+            self._tops[moved_rows] = moved_tops
+            self._stack(moved_rows, moved_tops)
+
+    def _column_indexes(self, choice_ids: np.ndarray) -> np.ndarray:
+        if not len(self._columns):
+            return np.zeros(0, dtype=np.int64)
+
+        # Choices of one ballot are usually created together, so their ids
+        # span a narrow range that a lookup table maps faster than a search
+        low = self._columns[0]
+        span = int(self._columns[-1] - low) + 1
+        if span > 4 * len(self._columns) + 1024:
+            return np.searchsorted(self._columns, choice_ids)
+
+        lookup = np.zeros(span, dtype=np.int64)
+        lookup[self._columns - low] = np.arange(len(self._columns))
+        return lookup[choice_ids - low]
+
+    def _top_active_columns(self, matrix: np.ndarray) -> np.ndarray:
+        if not matrix.shape[1]:
+            return np.full(len(matrix), EXHAUSTED, dtype=np.int32)
+
+        masked = np.where(self._active, matrix, UNRANKED)
+        tops = masked.argmin(axis=1).astype(np.int32)
+        exhausted = masked[np.arange(len(masked)), tops] == UNRANKED
+        tops[exhausted] = EXHAUSTED
+        return tops
+
+    def _stack(self, rows: np.ndarray, tops: np.ndarray) -> None:
+        counted = tops != EXHAUSTED
+        rows = rows[counted]
+        tops = tops[counted]
+        self._tallies += np.bincount(tops, minlength=len(self._columns))
+        np.minimum.at(self._first_rows, tops, rows)
@@ -0,0 +1,47 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Set
+
+
+class RoundCounterInterface(ABC):
+    """
+    Abstract base class for instant-runoff round counters.
+    A counter owns the tabulation state of a single election and is driven
+    round by round by run_instant_runoff.
+    """
+
+    @property
+    @abstractmethod
+    def choice_ids(self) -> Set[int]:
+        """
+        Every choice id ranked on at least one ballot.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def total_votes(self) -> int:
+        """
+        Number of ballots cast, including ballots that rank nothing.
+        """
+        pass
+
+    @abstractmethod
+    def count_round(self) -> Dict[int, int]:
+        """
+        Count the current round.
+
+        Returns:
+            Dict[int, int]: Votes per choice id for every choice holding at least
+            one vote, ordered by the first ballot (in cast order) backing it
+        """
+        pass
+
+    @abstractmethod
+    def eliminate(self, choice_id: int) -> None:
+        """
+        Eliminate a choice and move its ballots to their next active preference.
+
+        Args:
+            choice_id: The id of the choice to eliminate
+        """
+        pass
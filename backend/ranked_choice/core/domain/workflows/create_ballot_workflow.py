@@ -4,8 +4,24 @@ from ranked_choice.core.repositories.ballot_repository import (
     BallotRepository,
     BallotRepositoryInterface,
 )
+from ranked_choice.core.services.instrumentation import instrumented
+from ranked_choice.core.services.query_budget import query_budget
 
 
+def validate_ballot(title: str, choices: List[dict]) -> None:
+    """
+    Raises:
+        ValueError: If the title is empty or choices is empty
+    """
+    if not title:
+        raise ValueError("Ballot title cannot be empty")
+
+    if not choices:
+        raise ValueError("Choices cannot be empty")
+
+
+@instrumented()
+@query_budget(2)
 def create_ballot_workflow(
     title: str,
     choices: List[dict],
@@ -27,12 +43,7 @@ def create_ballot_workflow(
     Raises:
         ValueError: If the title is empty or choices is empty
     """
-    # Validate inputs
-    if not title:
-        raise ValueError("Ballot title cannot be empty")
-
-    if not choices:
-        raise ValueError("Choices cannot be empty")
+    validate_ballot(title, choices)
 
     repository = ballot_repository or BallotRepository()
 
@@ -0,0 +1,43 @@
+from typing import List, Optional
+
+from ranked_choice.core.domain.items.ballot_item import BallotItem
+from ranked_choice.core.domain.workflows.create_ballot_workflow import validate_ballot
+from ranked_choice.core.repositories.ballot_repository import (
+    BallotRepository,
+    BallotRepositoryInterface,
+    create_ballots_queries,
+)
+from ranked_choice.core.services.instrumentation import instrumented
+from ranked_choice.core.services.query_budget import query_budget
+
+
+@instrumented(rows=len)
+@query_budget(lambda arguments: create_ballots_queries(arguments['ballots']))
+def create_ballots_workflow(
+    ballots: List[dict],
+    ballot_repository: Optional[BallotRepositoryInterface] = None
+) -> List[BallotItem]:
+    """
+    Workflow to create many ballots at once.
+
+    Args:
+        ballots: List of ballots, each with a title, choices and optional
+            description
+        ballot_repository: Optional repository instance for dependency injection
+
+    Returns:
+        List[BallotItem]: The created ballots with their choices, in order
+
+    Raises:
+        ValueError: If there are no ballots, or any ballot has an empty title
+            or no choices; no ballot is created then
+    """
+    if not ballots:
+        raise ValueError("Ballots cannot be empty")
+
+    for ballot in ballots:
+        validate_ballot(ballot.get('title'), ballot.get('choices'))
+
+    repository = ballot_repository or BallotRepository()
+
+    return repository.create_ballots(ballots=ballots)
@@ -1,12 +1,50 @@
+from concurrent.futures import Future
 from typing import List, Optional
 
 from ranked_choice.core.repositories.ballot_repository import BallotRepository
 from ranked_choice.core.repositories.ballot_repository_interface import (
     BallotRepositoryInterface,
 )
+from ranked_choice.core.services.instrumentation import instrumented
+from ranked_choice.core.services.query_budget import query_budget
+from ranked_choice.core.services.vote_queue_interface import VoteQueueInterface
 
 
+@instrumented()
+@query_budget(4)
 def create_vote_workflow(
+        name: str,
+        ballot_id: int,
+        votes: List[dict],
+        ballot_repository: Optional[BallotRepositoryInterface] = None,
+        vote_queue: Optional[VoteQueueInterface] = None
+) -> Optional[Future]:
+    """
+    Create a voter with their ranked votes.
+
+    With a vote queue the voter is queued instead of written, and the
+    returned future resolves once its batch is committed.
+    """
+    if len(votes) == 0:
+        return None
+
+    if vote_queue is not None:
+        return vote_queue.submit({
+            'name': name,
+            'ballot_id': ballot_id,
+            'votes': votes,
+        })
+
+    ballot_repository = ballot_repository or BallotRepository()
+    ballot_repository.create_voter(
+        name=name,
+        ballot_id=ballot_id,
+        votes=votes
+    )
+
+
+@instrumented()
+async def acreate_vote_workflow(
         name: str,
         ballot_id: int,
         votes: List[dict],
@@ -16,8 +54,8 @@ def create_vote_workflow(
         return
 
     ballot_repository = ballot_repository or BallotRepository()
-    ballot_repository.create_voter(
+    await ballot_repository.acreate_voter(
         name=name,
         ballot_id=ballot_id,
         votes=votes
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,35 @@
+from typing import List, Optional
+
+from ranked_choice.core.repositories.ballot_repository import (
+    BallotRepository,
+    create_voters_queries,
+)
+from ranked_choice.core.repositories.ballot_repository_interface import (
+    BallotRepositoryInterface,
+)
+from ranked_choice.core.services.instrumentation import instrumented
+from ranked_choice.core.services.query_budget import query_budget
+
+
+@instrumented(rows=lambda created: created)
+@query_budget(lambda arguments: create_voters_queries(arguments['voters']))
+def create_voters_workflow(
+        voters: List[dict],
+        ballot_repository: Optional[BallotRepositoryInterface] = None
+) -> int:
+    """
+    Workflow to create many voters at once.
+
+    Args:
+        voters: List of voters, each with a name, ballot_id and votes
+        ballot_repository: Optional repository instance for dependency injection
+
+    Returns:
+        int: The number of voters created; voters without votes are skipped
+    """
+    voters = [voter for voter in voters if voter['votes']]
+    if not voters:
+        return 0
+
+    ballot_repository = ballot_repository or BallotRepository()
+    return ballot_repository.create_voters(voters=voters)
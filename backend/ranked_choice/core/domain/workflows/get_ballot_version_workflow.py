@@ -0,0 +1,30 @@
+from typing import Optional
+
+from ranked_choice.core.domain.items.ballot_version_item import BallotVersionItem
+from ranked_choice.core.repositories.ballot_repository import (
+    BallotRepository,
+    BallotRepositoryInterface,
+)
+from ranked_choice.core.services.instrumentation import instrumented
+from ranked_choice.core.services.query_budget import query_budget
+
+
+@instrumented()
+@query_budget(1)
+def get_ballot_version_workflow(
+    slug: str,
+    ballot_repository: Optional[BallotRepositoryInterface] = None
+) -> Optional[BallotVersionItem]:
+    """
+    Workflow to get the version of a ballot, for validating cached copies.
+
+    Args:
+        slug: The slug of the ballot
+        ballot_repository: Optional repository instance for dependency injection
+
+    Returns:
+        BallotVersionItem: The version of the ballot, None if not found
+    """
+    repository = ballot_repository or BallotRepository()
+
+    return repository.get_ballot_version(slug=slug)
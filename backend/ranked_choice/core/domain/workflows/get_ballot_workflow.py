@@ -5,8 +5,12 @@ from ranked_choice.core.repositories.ballot_repository import (
     BallotRepository,
     BallotRepositoryInterface,
 )
+from ranked_choice.core.services.instrumentation import instrumented
+from ranked_choice.core.services.query_budget import query_budget
 
 
+@instrumented()
+@query_budget(2)
 def get_ballot_workflow(
     slug: str,
     ballot_repository: Optional[BallotRepositoryInterface] = None
@@ -26,3 +30,23 @@ def get_ballot_workflow(
     repository = ballot_repository or BallotRepository()
 
     return repository.get_ballot_by_slug(slug=slug)
+
+
+@instrumented()
+async def aget_ballot_workflow(
+    slug: str,
+    ballot_repository: Optional[BallotRepositoryInterface] = None
+) -> Optional[BallotItem]:
+    """
+    Async workflow to get a ballot by its slug.
+
+    Args:
+        slug: The slug of the ballot
+        ballot_repository: Optional repository instance for dependency injection
+
+    Returns:
+        BallotItem: The ballot item with the given slug, None if not found
+    """
+    repository = ballot_repository or BallotRepository()
+
+    return await repository.aget_ballot_by_slug(slug=slug)
@@ -0,0 +1,56 @@
+from typing import Optional
+
+from ranked_choice.core.domain.items.ballot_item import BallotResultItem
+from ranked_choice.core.domain.workflows.get_votes_workflow import (
+    calculate_profile_winner,
+)
+from ranked_choice.core.repositories.ballot_repository import BallotRepository
+from ranked_choice.core.repositories.ballot_repository_interface import (
+    BallotRepositoryInterface,
+)
+from ranked_choice.core.services.instrumentation import instrumented, stage
+from ranked_choice.core.services.query_budget import query_budget
+
+
+@instrumented()
+@query_budget(3)
+def get_provisional_votes_workflow(
+    slug: str,
+    ballot_repository: Optional[BallotRepositoryInterface] = None
+) -> BallotResultItem:
+    """
+    Workflow to tabulate the provisional results of an open ballot.
+
+    Tabulates the running ranking tallies kept as votes are cast, so the
+    cost depends on the number of distinct rankings, not on the number of
+    votes. The first round holds the first-preference counts.
+
+    Args:
+        slug: The slug of the ballot
+        ballot_repository: Optional repository instance for dependency injection
+
+    Returns:
+        BallotResultItem: The provisional winner and the per-round tallies
+    """
+    ballot_repository = ballot_repository or BallotRepository()
+    ballot = ballot_repository.get_ballot_by_slug(slug=slug)
+    if not ballot:
+        return BallotResultItem(
+            winner_id=-1,
+            winner_name="No ballot found",
+            rounds=[],
+            title=""
+        )
+
+    with stage('get_ballot_profile') as timing:
+        profile = ballot_repository.get_ballot_profile(ballot_id=ballot.id)
+        timing.rows = len(profile.rankings)
+
+    choice_name_map = {choice.id: choice.name for choice in ballot.choices}
+
+    with stage('tabulate') as timing:
+        result = calculate_profile_winner(profile, choice_name_map)
+        timing.rows = len(profile.rankings)
+    result.title = ballot.title
+
+    return result
@@ -1,32 +1,72 @@
-from collections import defaultdict
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional
 
-from ranked_choice.core.domain.items.ballot_item import BallotResultItem, RoundItem
+import numpy as np
+from asgiref.sync import sync_to_async
+
+from ranked_choice.core.domain.items.ballot_item import BallotResultItem
+from ranked_choice.core.domain.items.ballot_profile_item import BallotProfileItem
+from ranked_choice.core.domain.items.packed_voters_item import PackedVotersItem
 from ranked_choice.core.domain.items.voter_item import VoterItem
+from ranked_choice.core.domain.tabulation.incremental_counter import (
+    IncrementalRoundCounter,
+)
+from ranked_choice.core.domain.tabulation.instant_runoff import (
+    run_instant_runoff,
+    voter_rankings,
+)
+from ranked_choice.core.domain.tabulation.matrix_counter import MatrixRoundCounter
 from ranked_choice.core.repositories.ballot_repository import BallotRepository
 from ranked_choice.core.repositories.ballot_repository_interface import (
     BallotRepositoryInterface,
 )
+from ranked_choice.core.repositories.results_cache_interface import (
+    ResultsCacheInterface,
+)
+from ranked_choice.core.services.instrumentation import instrumented, stage
+from ranked_choice.core.services.query_budget import query_budget
 
+# Below this many voters building the rank matrix costs more than it saves
+VECTORIZED_TABULATION_MIN_VOTERS = 20_000
 
-def map_rounds_to_round_items(
-        rounds: List[Dict[int, int]],
-        choice_name_map: Dict[int, str]
-) -> List[RoundItem]:
-    result = []
-    for round_index, round_dict in enumerate(rounds):
-        for choice_id, votes in round_dict.items():
-            name = choice_name_map.get(choice_id, f"Unknown ({choice_id})")
-            result.append(RoundItem(name=name, votes=votes, round_index=round_index))
-    return result
+Tabulator = Callable[[Iterable[VoterItem], Dict[int, str]], BallotResultItem]
 
 
+@instrumented()
+@query_budget(4)
 def get_votes_workflow(
     slug: str,
-    ballot_repository: Optional[BallotRepositoryInterface] = None
+    ballot_repository: Optional[BallotRepositoryInterface] = None,
+    tabulator: Optional[Tabulator] = None,
+    results_cache: Optional[ResultsCacheInterface] = None
 ) -> BallotResultItem:
+    """
+    Workflow to tabulate the results of a ballot.
+
+    Args:
+        slug: The slug of the ballot
+        ballot_repository: Optional repository instance for dependency injection
+        tabulator: Optional tabulator, picked by electorate size when omitted
+        results_cache: Optional store of results keyed by the ballot's
+            votes version; when given, tabulation only runs after new votes
+
+    Returns:
+        BallotResultItem: The winner and the per-round tallies
+    """
     ballot_repository = ballot_repository or BallotRepository()
-    ballot = ballot_repository.get_ballot_by_slug(slug=slug)
+
+    if results_cache:
+        # A cache hit only needs the votes version, not the choices
+        with stage('results_cache'):
+            version = ballot_repository.get_ballot_version(slug=slug)
+            cached = None if version is None else results_cache.get_result(
+                version.id, version.votes_version
+            )
+        if cached is not None:
+            return cached
+
+    with stage('get_ballot_by_slug') as timing:
+        ballot = ballot_repository.get_ballot_by_slug(slug=slug)
+        timing.rows = len(ballot.choices) if ballot else 0
     if not ballot:
         return BallotResultItem(
             winner_id=-1,
@@ -35,111 +75,174 @@ def get_votes_workflow(
             title=""
         )
 
-    voter_items = ballot_repository.get_votes_by_ballot_id(ballot_id=ballot.id)
+    with stage('get_votes_by_ballot_id') as timing:
+        voter_items = ballot_repository.get_votes_by_ballot_id(ballot_id=ballot.id)
+        timing.rows = len(voter_items)
 
     choice_name_map = {choice.id: choice.name for choice in ballot.choices}
 
-    result = calculate_ranked_choice_winner(voter_items, choice_name_map)
+    tabulator = tabulator or select_tabulator(voter_items)
+    with stage('tabulate') as timing:
+        result = tabulator(voter_items, choice_name_map)
+        timing.rows = len(voter_items)
     result.title = ballot.title
 
+    if results_cache:
+        results_cache.set_result(ballot.id, ballot.votes_version, result)
+
     return result
 
 
-def calculate_ranked_choice_winner(
-        voter_items: List[VoterItem],
-        choice_name_map: Dict[int, str]
+@instrumented()
+async def aget_votes_workflow(
+    slug: str,
+    ballot_repository: Optional[BallotRepositoryInterface] = None,
+    tabulator: Optional[Tabulator] = None,
+    results_cache: Optional[ResultsCacheInterface] = None
 ) -> BallotResultItem:
-    if not voter_items:
+    """
+    Async workflow to tabulate the results of a ballot.
+
+    Same as get_votes_workflow, with tabulation run in a worker thread so
+    the event loop keeps serving other requests meanwhile.
+
+    Args:
+        slug: The slug of the ballot
+        ballot_repository: Optional repository instance for dependency injection
+        tabulator: Optional tabulator, picked by electorate size when omitted
+        results_cache: Optional store of results keyed by the ballot's
+            votes version; when given, tabulation only runs after new votes
+
+    Returns:
+        BallotResultItem: The winner and the per-round tallies
+    """
+    ballot_repository = ballot_repository or BallotRepository()
+    with stage('get_ballot_by_slug', count_queries=False) as timing:
+        ballot = await ballot_repository.aget_ballot_by_slug(slug=slug)
+        timing.rows = len(ballot.choices) if ballot else 0
+    if not ballot:
         return BallotResultItem(
             winner_id=-1,
-            winner_name="No votes found",
+            winner_name="No ballot found",
             rounds=[],
             title=""
         )
 
-    rounds = []
-    all_choices = set()
-    eliminated_choices = set()
+    if results_cache:
+        with stage('results_cache', count_queries=False):
+            cached = await results_cache.aget_result(ballot.id, ballot.votes_version)
+        if cached is not None:
+            return cached
 
-    for voter in voter_items:
-        for vote in voter.votes:
-            all_choices.add(vote.choice_id)
+    with stage('get_votes_by_ballot_id', count_queries=False) as timing:
+        voter_items = await ballot_repository.aget_votes_by_ballot_id(
+            ballot_id=ballot.id
+        )
+        timing.rows = len(voter_items)
 
-    remaining_choices = all_choices.copy()
+    choice_name_map = {choice.id: choice.name for choice in ballot.choices}
 
-    while remaining_choices:
-        vote_counts = defaultdict(int)
-        for voter in voter_items:
-            active_votes = sorted(
-                [v for v in voter.votes if v.choice_id in remaining_choices],
-                key=lambda v: v.rank
-            )
-            if active_votes:
-                top_vote = active_votes[0]
-                vote_counts[top_vote.choice_id] += 1
-
-        if not vote_counts:
-            break
-
-        rounds.append(dict(vote_counts))
-        total_votes = len(voter_items)
-        majority_threshold = total_votes / 2
-        max_votes = max(vote_counts.values())
-        winners = [
-            choice_id for choice_id, count
-            in vote_counts.items()
-            if count == max_votes
-        ]
-
-        if max_votes > majority_threshold or len(remaining_choices) <= 1:
-            winner_id = winners[0]
-            return BallotResultItem(
-                winner_id=winner_id,
-                winner_name=choice_name_map.get(winner_id, "Unknown"),
-                rounds=map_rounds_to_round_items(rounds, choice_name_map),
-                title=""
-            )
+    tabulator = tabulator or select_tabulator(voter_items)
+    with stage('tabulate', count_queries=False) as timing:
+        result = await sync_to_async(tabulator, thread_sensitive=False)(
+            voter_items, choice_name_map
+        )
+        timing.rows = len(voter_items)
+    result.title = ballot.title
 
-        min_votes = min(vote_counts.values())
-        losers = [
-            choice_id for choice_id, count
-            in vote_counts.items()
-            if count == min_votes
-        ]
-
-        if len(losers) == len(vote_counts) and len(remaining_choices) <= 2:
-            winner_id = winners[0]
-            return BallotResultItem(
-                winner_id=winner_id,
-                winner_name=choice_name_map.get(winner_id, "Unknown"),
-                rounds=map_rounds_to_round_items(rounds, choice_name_map),
-                title=""
-            )
+    if results_cache:
+        await results_cache.aset_result(ballot.id, ballot.votes_version, result)
 
-        loser = losers[0]
-        remaining_choices.remove(loser)
-        eliminated_choices.add(loser)
-
-    if rounds:
-        last_round = rounds[-1]
-        if last_round:
-            max_votes = max(last_round.values())
-            winners = [
-                choice_id for choice_id, count
-                in last_round.items()
-                if count == max_votes
-            ]
-            winner_id = winners[0]
-            return BallotResultItem(
-                winner_id=winner_id,
-                winner_name=choice_name_map.get(winner_id, "Unknown"),
-                rounds=map_rounds_to_round_items(rounds, choice_name_map),
-                title=""
-            )
+    return result
+
+
+def calculate_ranked_choice_winner(
+        voter_items: Iterable[VoterItem],
+        choice_name_map: Dict[int, str]
+) -> BallotResultItem:
+    """
+    Tabulate an instant-runoff election with the incremental round counter.
+
+    Args:
+        voter_items: The voters of the ballot, in cast order
+        choice_name_map: Mapping of choice id to choice name
+
+    Returns:
+        BallotResultItem: The winner and the per-round tallies
+    """
+    counter = IncrementalRoundCounter(voter_rankings(voter_items))
+    return run_instant_runoff(counter, choice_name_map)
+
+
+def calculate_ranked_choice_winner_vectorized(
+        voter_items: Iterable[VoterItem],
+        choice_name_map: Dict[int, str]
+) -> BallotResultItem:
+    """
+    Tabulate an instant-runoff election over a NumPy rank matrix.
+    Produces the same result as calculate_ranked_choice_winner.
+
+    Args:
+        voter_items: The voters of the ballot, in cast order
+        choice_name_map: Mapping of choice id to choice name
+
+    Returns:
+        BallotResultItem: The winner and the per-round tallies
+    """
+    if isinstance(voter_items, PackedVotersItem):
+        counter = MatrixRoundCounter(
+            voter_items.choice_ids, np.diff(voter_items.offsets)
+        )
+    else:
+        counter = MatrixRoundCounter.from_rankings(voter_rankings(voter_items))
+    return run_instant_runoff(counter, choice_name_map)
+
+
+def calculate_ranked_choice_winner_compressed(
+        voter_items: Iterable[VoterItem],
+        choice_name_map: Dict[int, str]
+) -> BallotResultItem:
+    """
+    Collapse the voters into a weighted ballot profile before tabulating.
+    Produces the same result as calculate_ranked_choice_winner, with memory
+    and per-round work divided by how often rankings repeat.
+
+    Args:
+        voter_items: The voters of the ballot, in cast order
+        choice_name_map: Mapping of choice id to choice name
 
-    return BallotResultItem(
-        winner_id=-1,
-        winner_name="No winner",
-        rounds=map_rounds_to_round_items(rounds, choice_name_map),
-        title=""
+    Returns:
+        BallotResultItem: The winner and the per-round tallies
+    """
+    profile = BallotProfileItem.from_rankings(voter_rankings(voter_items))
+    return calculate_profile_winner(profile, choice_name_map)
+
+
+def calculate_profile_winner(
+        profile: BallotProfileItem,
+        choice_name_map: Dict[int, str]
+) -> BallotResultItem:
+    """
+    Tabulate an instant-runoff election over a weighted ballot profile.
+
+    Args:
+        profile: Distinct rankings with the number of voters who cast each
+        choice_name_map: Mapping of choice id to choice name
+
+    Returns:
+        BallotResultItem: The winner and the per-round tallies
+    """
+    counter = IncrementalRoundCounter(
+        profile.rankings.keys(),
+        profile.rankings.values()
     )
+    return run_instant_runoff(counter, choice_name_map)
+
+
+def select_tabulator(voter_items: List[VoterItem]) -> Tabulator:
+    """
+    Pick the tabulator best suited to the size of the electorate.
+    """
+    if len(voter_items) >= VECTORIZED_TABULATION_MIN_VOTERS:
+        return calculate_ranked_choice_winner_vectorized
+    return calculate_ranked_choice_winner
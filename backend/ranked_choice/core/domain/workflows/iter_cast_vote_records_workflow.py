@@ -0,0 +1,40 @@
+from typing import Iterator, Optional, Tuple
+
+from ranked_choice.core.repositories.ballot_repository import (
+    BallotRepository,
+    BallotRepositoryInterface,
+)
+from ranked_choice.core.services.instrumentation import stage
+
+
+def iter_cast_vote_records_workflow(
+    ballot_id: int,
+    shuffle_seed: int,
+    ballot_repository: Optional[BallotRepositoryInterface] = None
+) -> Iterator[Tuple[int, ...]]:
+    """
+    Workflow to stream the cast vote records of a ballot, without voter
+    names and in a random order, so that knowing when someone voted does not
+    point to their record.
+
+    Records are read as they are consumed, so the whole run is timed as one
+    stage without a query count: its queries happen between yields.
+
+    Args:
+        ballot_id: The id of the ballot
+        shuffle_seed: Seed of the order of the records; the same seed gives
+            the same order for the same votes
+        ballot_repository: Optional repository instance for dependency injection
+
+    Returns:
+        Iterator over each voter's choice ids ordered by rank
+    """
+    repository = ballot_repository or BallotRepository()
+
+    with stage('cast_vote_records', count_queries=False) as timing:
+        timing.rows = 0
+        for ranking in repository.iter_rankings_by_ballot_id(
+                ballot_id=ballot_id, shuffle_seed=shuffle_seed
+        ):
+            timing.rows += 1
+            yield ranking
@@ -1,24 +1,76 @@
 from typing import List, Optional
 
+from ranked_choice.core.domain.items.ballot_cursor_item import BallotCursorItem
 from ranked_choice.core.domain.items.ballot_item import BallotItem
+from ranked_choice.core.domain.items.ballot_version_item import BallotVersionItem
 from ranked_choice.core.repositories.ballot_repository import (
     BallotRepository,
     BallotRepositoryInterface,
 )
+from ranked_choice.core.services.instrumentation import instrumented
+from ranked_choice.core.services.query_budget import query_budget
 
 
+@instrumented(rows=len)
+@query_budget(2)
 def list_ballots_workflow(
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
     ballot_repository: Optional[BallotRepositoryInterface] = None
 ) -> List[BallotItem]:
     """
-    Workflow to list all ballots.
+    Workflow to list ballots, one page at a time.
 
     Args:
+        cursor: Optional opaque cursor from a previous page
+        limit: Optional maximum number of ballots to return
         ballot_repository: Optional repository instance for dependency injection
 
     Returns:
-        List[BallotItem]: A list of all ballot items
+        List[BallotItem]: A page of ballot items ordered by creation
+
+    Raises:
+        ValueError: If the cursor is invalid or the limit is not positive
+    """
+    if limit is not None and limit < 1:
+        raise ValueError("Limit must be a positive integer")
+
+    repository = ballot_repository or BallotRepository()
+
+    return repository.list_ballots(
+        cursor=BallotCursorItem.decode(cursor) if cursor else None,
+        limit=limit
+    )
+
+
+@instrumented(rows=len)
+@query_budget(1)
+def list_ballot_versions_workflow(
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    ballot_repository: Optional[BallotRepositoryInterface] = None
+) -> List[BallotVersionItem]:
     """
+    Workflow to list the versions of the ballots on a page of
+    list_ballots_workflow, without loading their choices.
+
+    Args:
+        cursor: Optional opaque cursor from a previous page
+        limit: Optional maximum number of ballots to return
+        ballot_repository: Optional repository instance for dependency injection
+
+    Returns:
+        List[BallotVersionItem]: The versions of a page of ballots
+
+    Raises:
+        ValueError: If the cursor is invalid or the limit is not positive
+    """
+    if limit is not None and limit < 1:
+        raise ValueError("Limit must be a positive integer")
+
     repository = ballot_repository or BallotRepository()
 
-    return repository.list_ballots()
\ No newline at end of file
+    return repository.list_ballot_versions(
+        cursor=BallotCursorItem.decode(cursor) if cursor else None,
+        limit=limit
+    )
@@ -0,0 +1,138 @@
+import os
+from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    wait,
+)
+from multiprocessing import get_context
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ranked_choice.core.domain.items.ballot_item import BallotItem, BallotResultItem
+from ranked_choice.core.domain.items.ballot_tabulation_item import (
+    BallotTabulationItem,
+)
+from ranked_choice.core.domain.tabulation.packed_rankings import (
+    tabulate_packed_rankings,
+)
+from ranked_choice.core.repositories.ballot_repository import BallotRepository
+from ranked_choice.core.repositories.ballot_repository_interface import (
+    BallotRepositoryInterface,
+)
+from ranked_choice.core.repositories.results_cache_interface import (
+    ResultsCacheInterface,
+)
+from ranked_choice.core.services.instrumentation import instrumented
+
+# Ballots loaded ahead of the workers, per worker, to keep them busy
+# without holding every ballot's votes in memory at once
+PENDING_BALLOTS_PER_WORKER = 2
+
+
+@instrumented(rows=len)
+def tabulate_many_workflow(
+    ballot_ids: Iterable[int],
+    max_workers: Optional[int] = None,
+    ballot_repository: Optional[BallotRepositoryInterface] = None,
+    results_cache: Optional[ResultsCacheInterface] = None
+) -> List[BallotTabulationItem]:
+    """
+    Workflow to recompute the results of many ballots across a process pool.
+
+    Votes are read in this process and shipped to the workers as the flat
+    int arrays of a PackedVotersItem; the workers only tabulate and never
+    touch the database.
+
+    Args:
+        ballot_ids: The ids of the ballots to recompute
+        max_workers: Optional number of worker processes, defaults to the
+            number of CPUs; 1 tabulates in this process without a pool
+        ballot_repository: Optional repository instance for dependency injection
+        results_cache: Optional store to warm with the recomputed results
+
+    Returns:
+        List[BallotTabulationItem]: One item per ballot found, in the order
+            of ballot_ids, with its result and per-ballot timing
+    """
+    repository = ballot_repository or BallotRepository()
+    ballot_ids = list(ballot_ids)
+    workers = max_workers or os.cpu_count() or 1
+
+    if workers == 1:
+        tabulated = [
+            (ballot, load_seconds, total_votes, *tabulate_packed_rankings(*job))
+            for ballot, load_seconds, total_votes, job
+            in _load_ballots(ballot_ids, repository)
+        ]
+    else:
+        tabulated = _tabulate_in_pool(
+            _load_ballots(ballot_ids, repository), workers
+        )
+
+    items = {}
+    for ballot, load_seconds, total_votes, result, tabulate_seconds in tabulated:
+        result.title = ballot.title
+        if results_cache:
+            results_cache.set_result(ballot.id, ballot.votes_version, result)
+        items[ballot.id] = BallotTabulationItem(
+            ballot_id=ballot.id,
+            slug=ballot.slug,
+            votes_version=ballot.votes_version,
+            total_votes=total_votes,
+            load_seconds=load_seconds,
+            tabulate_seconds=tabulate_seconds,
+            result=result
+        )
+
+    return [items[ballot_id] for ballot_id in ballot_ids if ballot_id in items]
+
+
+def _load_ballots(
+        ballot_ids: List[int],
+        repository: BallotRepositoryInterface
+) -> Iterator[Tuple[BallotItem, float, int, tuple]]:
+    """
+    Yield (ballot, load seconds, total votes, tabulation job) per ballot found.
+    """
+    for ballot_id in ballot_ids:
+        started = perf_counter()
+        ballot = repository.get_ballot_by_id(ballot_id=ballot_id)
+        if ballot is None:
+            continue
+
+        voters = repository.get_votes_by_ballot_id(ballot_id=ballot.id)
+        choice_name_map = {choice.id: choice.name for choice in ballot.choices}
+        yield (
+            ballot,
+            perf_counter() - started,
+            len(voters),
+            (voters.choice_ids, voters.lengths(), choice_name_map)
+        )
+
+
+def _tabulate_in_pool(
+        ballots: Iterator[Tuple[BallotItem, float, int, tuple]],
+        workers: int
+) -> List[Tuple[BallotItem, float, int, BallotResultItem, float]]:
+    tabulated = []
+    pending: Dict = {}
+
+    def collect(return_when):
+        done, _ = wait(pending, return_when=return_when)
+        for future in done:
+            result, tabulate_seconds = future.result()
+            tabulated.append((*pending.pop(future), result, tabulate_seconds))
+
+    # Spawned workers start clean instead of inheriting a forked copy of
+    # this process's open database connections
+    with ProcessPoolExecutor(workers, mp_context=get_context('spawn')) as executor:
+        for ballot, load_seconds, total_votes, job in ballots:
+            future = executor.submit(tabulate_packed_rankings, *job)
+            pending[future] = (ballot, load_seconds, total_votes)
+            if len(pending) >= workers * PENDING_BALLOTS_PER_WORKER:
+                collect(FIRST_COMPLETED)
+        if pending:
+            collect(ALL_COMPLETED)
+
+    return tabulated
@@ -0,0 +1,126 @@
+import argparse
+import csv
+import json
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ranked_choice.core.repositories.ballot_repository import (
+    IMPORT_BATCH_SIZE,
+    BallotRepository,
+)
+
+FORMATS = ('csv', 'ndjson')
+
+
+def positive_int(value: str) -> int:
+    """
+    Parse a command line integer that must be at least 1.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def read_csv_ballots(path: Path) -> Iterator[Tuple[int, str, List[str]]]:
+    """
+    Yield (line number, voter name, choice names) from a CSV file.
+    The first row is a header; each following row holds the voter name and
+    then the names of the choices in order of preference.
+    """
+    with path.open(newline='', encoding='utf-8') as handle:
+        reader = csv.reader(handle)
+        next(reader, None)
+        for row in reader:
+            if not row:
+                continue
+            yield reader.line_num, row[0], [name for name in row[1:] if name]
+
+
+def read_ndjson_ballots(path: Path) -> Iterator[Tuple[int, str, List[str]]]:
+    """
+    Yield (line number, voter name, choice names) from an NDJSON file.
+    Each line is an object with a "name" and a "ranking" list of choice names.
+    """
+    with path.open(encoding='utf-8') as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                yield line_number, record['name'], record['ranking']
+            except (ValueError, KeyError, TypeError) as e:
+                raise CommandError(f"Line {line_number}: invalid record ({e})") from e
+
+
+def resolve_rankings(
+        ballots: Iterator[Tuple[int, str, List[str]]],
+        choice_ids: Dict[str, int]
+) -> Iterator[Tuple[str, List[int]]]:
+    """
+    Map each voter's choice names to choice ids.
+    Voters without a ranking are skipped, as create_vote_workflow does.
+    """
+    for line_number, name, choice_names in ballots:
+        if not choice_names:
+            continue
+        try:
+            yield name, [choice_ids[choice_name] for choice_name in choice_names]
+        except KeyError as e:
+            raise CommandError(
+                f"Line {line_number}: unknown choice {e.args[0]!r}"
+            ) from e
+
+
+class Command(BaseCommand):
+    help = 'Import ranked ballots from a CSV or NDJSON file into a ballot'
+
+    def add_arguments(self, parser):
+        parser.add_argument('slug', help='Slug of the ballot to import into')
+        parser.add_argument('file', type=Path, help='CSV or NDJSON file of ballots')
+        parser.add_argument(
+            '--format',
+            choices=FORMATS,
+            help='File format, inferred from the file extension when omitted'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=positive_int,
+            default=IMPORT_BATCH_SIZE,
+            help='Number of voters written per COPY'
+        )
+
+    def handle(self, *args, **options):
+        path = options['file']
+        if not path.is_file():
+            raise CommandError(f"File not found: {path}")
+
+        file_format = options['format'] or path.suffix.lstrip('.').lower()
+        if file_format == 'jsonl':
+            file_format = 'ndjson'
+        if file_format not in FORMATS:
+            raise CommandError(
+                f"Cannot tell the format of {path.name}, pass --format"
+            )
+
+        repository = BallotRepository()
+        ballot = repository.get_ballot_by_slug(slug=options['slug'])
+        if ballot is None:
+            raise CommandError(f"Ballot not found: {options['slug']}")
+
+        reader = read_csv_ballots if file_format == 'csv' else read_ndjson_ballots
+        choice_ids = {choice.name: choice.id for choice in ballot.choices}
+        imported = repository.import_voters(
+            ballot_id=ballot.id,
+            voters=resolve_rankings(reader(path), choice_ids),
+            batch_size=options['batch_size']
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {imported} voters into {ballot.slug}"
+        ))
@@ -0,0 +1,60 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ranked_choice.core.domain.workflows.tabulate_many_workflow import (
+    tabulate_many_workflow,
+)
+from ranked_choice.core.repositories.ballot_repository import BallotRepository
+from ranked_choice.core.repositories.results_cache import ResultsCache
+
+
+class Command(BaseCommand):
+    help = 'Recompute and cache the results of many ballots across worker processes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'ballot_ids',
+            nargs='*',
+            type=int,
+            help='Ids of the ballots to recompute, every ballot when omitted'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            help='Number of worker processes, defaults to the number of CPUs'
+        )
+        parser.add_argument(
+            '--no-cache',
+            action='store_true',
+            help='Report the results without storing them in the results cache'
+        )
+
+    def handle(self, *args, **options):
+        if options['workers'] is not None and options['workers'] < 1:
+            raise CommandError("--workers must be at least 1")
+
+        repository = BallotRepository()
+        ballot_ids = options['ballot_ids'] or repository.list_ballot_ids()
+
+        items = tabulate_many_workflow(
+            ballot_ids,
+            max_workers=options['workers'],
+            ballot_repository=repository,
+            results_cache=None if options['no_cache'] else ResultsCache()
+        )
+
+        for item in items:
+            self.stdout.write(
+                f"{item.slug}: {item.total_votes} votes, "
+                f"loaded in {item.load_seconds * 1000:.1f} ms, "
+                f"tabulated in {item.tabulate_seconds * 1000:.1f} ms, "
+                f"winner {item.result.winner_name}"
+            )
+
+        missing = set(ballot_ids) - {item.ballot_id for item in items}
+        for ballot_id in sorted(missing):
+            self.stderr.write(self.style.WARNING(f"Ballot not found: {ballot_id}"))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Recomputed {len(items)} ballots in "
+            f"{sum(item.tabulate_seconds for item in items):.3f} s of tabulation"
+        ))
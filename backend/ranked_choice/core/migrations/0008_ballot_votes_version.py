@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-18 01:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_remove_vote_ballot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ballot',
+            name='votes_version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
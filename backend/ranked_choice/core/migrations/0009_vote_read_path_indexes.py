@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-18 01:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_ballot_votes_version'),
+    ]
+
+    # The composite indexes are created before the single-column foreign key
+    # indexes they make redundant are dropped, so lookups never lose an index
+    operations = [
+        migrations.AddIndex(
+            model_name='vote',
+            index=models.Index(fields=['voter', 'rank', 'id'], include=('choice',), name='votes_voter_rank_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='voter',
+            index=models.Index(fields=['ballot', 'id'], include=('name',), name='voters_ballot_id_idx'),
+        ),
+        migrations.AlterField(
+            model_name='vote',
+            name='voter',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='votes', to='core.voter'),
+        ),
+        migrations.AlterField(
+            model_name='voter',
+            name='ballot',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='voters', to='core.ballot'),
+        ),
+    ]
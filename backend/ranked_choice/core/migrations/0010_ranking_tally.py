@@ -0,0 +1,67 @@
+# Generated by Django 4.2.30 on 2026-10-18 01:26
+
+from itertools import groupby
+from operator import itemgetter
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_ranking_tallies(apps, schema_editor):
+    """
+    Tally the rankings already cast, one ballot at a time, in the order
+    each ranking was first cast.
+    """
+    Ballot = apps.get_model('core', 'Ballot')
+    Voter = apps.get_model('core', 'Voter')
+    RankingTally = apps.get_model('core', 'RankingTally')
+
+    for ballot_id in Ballot.objects.order_by('id').values_list('id', flat=True):
+        rows = (
+            Voter.objects
+            .filter(ballot_id=ballot_id)
+            .order_by('id', 'votes__rank', 'votes__id')
+            .values_list('id', 'votes__choice_id')
+            .iterator(chunk_size=2000)
+        )
+        counts = {}
+        for _voter_id, voter_rows in groupby(rows, key=itemgetter(0)):
+            signature = ','.join(
+                str(choice_id) for _, choice_id in voter_rows if choice_id is not None
+            )
+            counts[signature] = counts.get(signature, 0) + 1
+
+        RankingTally.objects.bulk_create(
+            [
+                RankingTally(ballot_id=ballot_id, signature=signature, count=count)
+                for signature, count in counts.items()
+            ],
+            batch_size=1000
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_vote_read_path_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RankingTally',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('signature', models.TextField(blank=True)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('ballot', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='ranking_tallies', to='core.ballot')),
+            ],
+            options={
+                'db_table': 'ranking_tallies',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='rankingtally',
+            constraint=models.UniqueConstraint(fields=('ballot', 'signature'), name='ranking_tallies_ballot_signature_uniq'),
+        ),
+        migrations.RunPython(backfill_ranking_tallies, migrations.RunPython.noop),
+    ]
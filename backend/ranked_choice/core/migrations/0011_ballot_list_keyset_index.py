@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-18 02:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_ranking_tally'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ballot',
+            index=models.Index(fields=['created_at', 'id'], name='ballots_created_id_idx'),
+        ),
+    ]
@@ -6,17 +6,27 @@ class Ballot(models.Model):
     Ballot model for storing ballot information.
     Uses an auto-incrementing integer primary key,
     timestamps, and includes slug and title fields.
+    votes_version is bumped whenever votes are cast so that
+    cached results can be keyed by it.
     """
     id = models.AutoField(primary_key=True)
     slug = models.SlugField(unique=True)
     title = models.CharField(max_length=255)
     description = models.TextField(null=True, blank=True)
+    votes_version = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         app_label = 'core'
         db_table = 'ballots'
+        indexes = [
+            # Keyset pages of the ballot list, in (created_at, id) order
+            models.Index(
+                fields=['created_at', 'id'],
+                name='ballots_created_id_idx',
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -55,7 +65,8 @@ class Voter(models.Model):
     ballot = models.ForeignKey(
         Ballot,
         on_delete=models.CASCADE,
-        related_name='voters'
+        related_name='voters',
+        db_index=False,
     )
     name = models.CharField(max_length=255)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -64,6 +75,14 @@ class Voter(models.Model):
     class Meta:
         app_label = 'core'
         db_table = 'voters'
+        indexes = [
+            # Range scan of a ballot's voters in id order, name read from the index
+            models.Index(
+                fields=['ballot', 'id'],
+                include=['name'],
+                name='voters_ballot_id_idx',
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -77,7 +96,8 @@ class Vote(models.Model):
     voter = models.ForeignKey(
         Voter,
         on_delete=models.CASCADE,
-        related_name='votes'
+        related_name='votes',
+        db_index=False,
     )
     rank = models.PositiveIntegerField()
     choice = models.ForeignKey(
@@ -90,6 +110,47 @@ class Vote(models.Model):
     class Meta:
         app_label = 'core'
         db_table = 'votes'
+        indexes = [
+            # A voter's votes in rank order, choice read from the index
+            models.Index(
+                fields=['voter', 'rank', 'id'],
+                include=['choice'],
+                name='votes_voter_rank_idx',
+            ),
+        ]
 
     def __str__(self):
-        return f"Vote for {self.choice.name} by {self.voter.name}"
\ No newline at end of file
+        return f"Vote for {self.choice.name} by {self.voter.name}"
+
+
+class RankingTally(models.Model):
+    """
+    RankingTally model counting the voters of a ballot who cast each
+    distinct ranking. signature holds the ranked choice ids joined by
+    commas, empty for a voter who ranked nothing. Rows are kept in the
+    order each ranking was first cast so provisional results can be
+    tabulated from this table alone.
+    """
+    id = models.AutoField(primary_key=True)
+    ballot = models.ForeignKey(
+        Ballot,
+        on_delete=models.CASCADE,
+        related_name='ranking_tallies',
+        db_index=False,
+    )
+    signature = models.TextField(blank=True)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        app_label = 'core'
+        db_table = 'ranking_tallies'
+        constraints = [
+            # Also serves lookups of a ballot's tallies
+            models.UniqueConstraint(
+                fields=['ballot', 'signature'],
+                name='ranking_tallies_ballot_signature_uniq',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.count} x [{self.signature}]"
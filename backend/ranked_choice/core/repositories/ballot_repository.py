@@ -1,15 +1,100 @@
+import csv
+import io
+import random
 import uuid
-from typing import List, Optional
+from array import array
+from itertools import chain, groupby, islice
+from operator import itemgetter
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 
+from django.db import connection, transaction
+from django.db.models import (
+    AutoField,
+    BooleanField,
+    F,
+    Model,
+    Prefetch,
+    QuerySet,
+)
+from django.db.models.expressions import RawSQL
+from django.utils import timezone
 from django.utils.text import slugify
 
+from ranked_choice.core.domain.items.ballot_cursor_item import BallotCursorItem
 from ranked_choice.core.domain.items.ballot_item import BallotItem, ChoiceItem
+from ranked_choice.core.domain.items.ballot_profile_item import BallotProfileItem
+from ranked_choice.core.domain.items.ballot_version_item import BallotVersionItem
+from ranked_choice.core.domain.items.packed_voters_item import PackedVotersItem
 from ranked_choice.core.domain.items.voter_item import VoteItem, VoterItem
-from ranked_choice.core.models import Ballot, Choice, Vote, Voter
+from ranked_choice.core.models import Ballot, Choice, RankingTally, Vote, Voter
 from ranked_choice.core.repositories.ballot_repository_interface import (
     BallotRepositoryInterface,
 )
 
+# Rows fetched per round trip when streaming votes from a server-side cursor
+VOTE_CHUNK_SIZE = 2000
+
+# Rows written per INSERT statement by bulk_create
+BULK_CREATE_BATCH_SIZE = 1000
+
+# Voters buffered per COPY when importing ballots
+IMPORT_BATCH_SIZE = 10000
+
+
+def ballot_slug(title: str) -> str:
+    unique_id = str(uuid.uuid4())[:8]
+    return f'{slugify(title)}-{unique_id}'
+
+
+def bulk_create_batches(model: Type[Model], rows: int) -> int:
+    """
+    The number of INSERT statements bulk_create writes rows of model in,
+    which the database's limit on query parameters may raise.
+    """
+    fields = [
+        field for field in model._meta.concrete_fields
+        if not isinstance(field, AutoField)
+    ]
+    batch_size = min(
+        BULK_CREATE_BATCH_SIZE,
+        max(connection.ops.bulk_batch_size(fields, range(rows)), 1)
+    )
+    return -(-rows // batch_size)
+
+
+def create_ballots_queries(ballots: List[dict]) -> int:
+    """
+    The number of queries create_ballots runs for ballots.
+    """
+    choices = sum(len(ballot['choices']) for ballot in ballots)
+    return bulk_create_batches(Ballot, len(ballots)) + bulk_create_batches(
+        Choice, choices
+    )
+
+
+def create_voters_queries(voters: List[dict]) -> int:
+    """
+    The most queries create_voters runs for voters: their inserts, the
+    ranking tally ids reserved on PostgreSQL, the ranking tallies of at most
+    one new ranking per voter, and one update of the votes versions.
+    """
+    votes = sum(len(voter['votes']) for voter in voters)
+    return (
+        bulk_create_batches(Voter, len(voters))
+        + bulk_create_batches(Vote, votes)
+        + -(-len(voters) // BULK_CREATE_BATCH_SIZE)
+        + 2
+    )
+
 
 def build_choices(ballot) -> List[ChoiceItem]:
     choices = Choice.objects.filter(ballot=ballot)
@@ -24,6 +109,168 @@ def build_choices(ballot) -> List[ChoiceItem]:
     return choice_items
 
 
+def build_ballot_item(ballot: Ballot, choice_items: List[ChoiceItem]) -> BallotItem:
+    return BallotItem(
+        id=ballot.id,
+        title=ballot.title,
+        slug=ballot.slug,
+        description=ballot.description,
+        choices=choice_items,
+        votes_version=ballot.votes_version,
+        created_at=ballot.created_at,
+        updated_at=ballot.updated_at
+    )
+
+
+def page_ballots(
+        ballots: QuerySet,
+        cursor: Optional[BallotCursorItem] = None,
+        limit: Optional[int] = None
+) -> QuerySet:
+    """
+    The page of ballots after cursor, found by keyset on (created_at, id) so
+    deep pages cost the same as the first.
+
+    The cursor is compared as one row value, which the ballots_created_id_idx
+    index answers with a single range scan; the equivalent OR of two
+    comparisons is not.
+    """
+    ballots = ballots.order_by('created_at', 'id')
+    if cursor is not None:
+        quote = connection.ops.quote_name
+        table = quote(Ballot._meta.db_table)
+        ballots = ballots.filter(RawSQL(
+            f'({table}.{quote("created_at")}, {table}.{quote("id")}) > (%s, %s)',
+            (
+                connection.ops.adapt_datetimefield_value(cursor.created_at),
+                cursor.id,
+            ),
+            output_field=BooleanField()
+        ))
+    if limit is not None:
+        ballots = ballots[:limit]
+    return ballots
+
+
+def ballot_vote_rows(ballot_id: int) -> QuerySet:
+    """
+    (voter id, voter name, rank, choice id) rows of a ballot, ordered by voter
+    and rank. Served by the voters_ballot_id_idx and votes_voter_rank_idx
+    indexes without touching either table.
+    """
+    return (
+        Voter.objects
+        .filter(ballot_id=ballot_id)
+        .order_by('id', 'votes__rank', 'votes__id')
+        .values_list('id', 'name', 'votes__rank', 'votes__choice_id')
+    )
+
+
+def bump_votes_version(*ballot_ids: int) -> None:
+    Ballot.objects.filter(id__in=ballot_ids).update(
+        votes_version=F('votes_version') + 1
+    )
+
+
+def ranking_signature(ranking: Sequence[int]) -> str:
+    return ','.join(map(str, ranking))
+
+
+def parse_ranking_signature(signature: str) -> Tuple[int, ...]:
+    return tuple(map(int, signature.split(','))) if signature else ()
+
+
+def add_ranking_tallies(profiles: Dict[int, BallotProfileItem]) -> None:
+    """
+    Add the counts of each ballot's profile to its ranking tallies.
+
+    Each batch is one INSERT ... ON CONFLICT DO UPDATE that increments the
+    existing rows, so concurrent voters never overwrite each other's counts.
+    On PostgreSQL rows are written in (ballot_id, signature) order, so
+    concurrent writers take their row locks in the same order and cannot
+    deadlock. Their ids are reserved from the table's sequence first, in the
+    order each profile saw its rankings, so new rankings still sort by when
+    they were first cast.
+    """
+    rows = [
+        (ballot_id, ranking_signature(ranking), count)
+        for ballot_id, profile in profiles.items()
+        for ranking, count in profile.rankings.items()
+    ]
+    table = RankingTally._meta.db_table
+    columns = "ballot_id, signature, count"
+    placeholders = "(%s, %s, %s)"
+    with connection.cursor() as cursor:
+        # SQLite serialises its writers, so there the rows keep their cast
+        # order and take their ids from it
+        if connection.vendor == 'postgresql':
+            cursor.execute(
+                f"SELECT nextval(pg_get_serial_sequence('{table}', 'id')) "
+                "FROM generate_series(1, %s)",
+                [len(rows)]
+            )
+            rows = sorted(
+                (
+                    (tally_id, *row)
+                    for (tally_id,), row in zip(cursor.fetchall(), rows, strict=True)
+                ),
+                key=itemgetter(1, 2)
+            )
+            columns = "id, " + columns
+            placeholders = "(%s, %s, %s, %s)"
+        for start in range(0, len(rows), BULK_CREATE_BATCH_SIZE):
+            batch = rows[start:start + BULK_CREATE_BATCH_SIZE]
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) VALUES "
+                + ", ".join([placeholders] * len(batch))
+                + " ON CONFLICT (ballot_id, signature) "
+                f"DO UPDATE SET count = {table}.count + EXCLUDED.count",
+                list(chain.from_iterable(batch))
+            )
+
+
+def copy_voters(
+        ballot_id: int,
+        voters: Sequence[Tuple[str, Sequence[int]]]
+) -> None:
+    """
+    Write a batch of voters and their votes with PostgreSQL COPY FROM STDIN.
+    Voter ids are reserved from the table's sequence up front so votes can
+    reference them without reading anything back.
+    """
+    now = timezone.now().isoformat()
+    voters_buffer = io.StringIO()
+    votes_buffer = io.StringIO()
+    voters_writer = csv.writer(voters_buffer)
+    votes_writer = csv.writer(votes_buffer)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT nextval(pg_get_serial_sequence('voters', 'id')) "
+            "FROM generate_series(1, %s)",
+            [len(voters)]
+        )
+        voter_ids = [row[0] for row in cursor.fetchall()]
+
+        for voter_id, (name, choice_ids) in zip(voter_ids, voters, strict=True):
+            voters_writer.writerow([voter_id, ballot_id, name, now, now])
+            for rank, choice_id in enumerate(choice_ids, start=1):
+                votes_writer.writerow([voter_id, rank, choice_id, now, now])
+
+        voters_buffer.seek(0)
+        votes_buffer.seek(0)
+        cursor.copy_expert(
+            "COPY voters (id, ballot_id, name, created_at, updated_at) "
+            "FROM STDIN WITH (FORMAT csv)",
+            voters_buffer
+        )
+        cursor.copy_expert(
+            "COPY votes (voter_id, rank, choice_id, created_at, updated_at) "
+            "FROM STDIN WITH (FORMAT csv)",
+            votes_buffer
+        )
+
+
 class BallotRepository(BallotRepositoryInterface):
     """
     Django implementation of the ballot repository.
@@ -47,24 +294,62 @@ class BallotRepository(BallotRepositoryInterface):
         Returns:
             str: The slug of the created ballot
         """
-        unique_id = str(uuid.uuid4())[:8]
-        slug = f'{slugify(title)}-{unique_id}'
+        return self.create_ballots([{
+            'title': title,
+            'choices': choices,
+            'description': description,
+        }])[0].slug
 
-        ballot = Ballot.objects.create(
-            title=title,
-            slug=slug,
-            description=description
-        )
+    def create_ballots(self, ballots: List[dict]) -> List[BallotItem]:
+        """
+        Create many ballots and their choices in one transaction.
 
-        # Create the choices
-        for choice in choices:
-            Choice.objects.create(
-                ballot=ballot,
-                name=choice['name'],
-                description=choice.get('description', '')
+        Ballots and choices are each written with bulk_create, so the number
+        of queries does not grow with the number of ballots or choices, and
+        the ids the database assigned are read back from the inserts.
+
+        Args:
+            ballots: List of ballots, each with a title, choices and optional
+                description
+
+        Returns:
+            List[BallotItem]: The created ballots with their choices, in order
+        """
+        with transaction.atomic():
+            created = Ballot.objects.bulk_create(
+                [
+                    Ballot(
+                        title=ballot['title'],
+                        slug=ballot_slug(ballot['title']),
+                        description=ballot.get('description')
+                    )
+                    for ballot in ballots
+                ],
+                batch_size=BULK_CREATE_BATCH_SIZE
+            )
+            choices = Choice.objects.bulk_create(
+                [
+                    Choice(
+                        ballot=ballot,
+                        name=choice['name'],
+                        description=choice.get('description', '')
+                    )
+                    for ballot, data in zip(created, ballots, strict=True)
+                    for choice in data['choices']
+                ],
+                batch_size=BULK_CREATE_BATCH_SIZE
             )
 
-        return slug
+        choice_items = {ballot.id: [] for ballot in created}
+        for choice in choices:
+            choice_items[choice.ballot_id].append(ChoiceItem(
+                id=choice.id,
+                name=choice.name,
+                description=choice.description
+            ))
+        return [
+            build_ballot_item(ballot, choice_items[ballot.id]) for ballot in created
+        ]
 
     def get_ballot_by_slug(self, slug: str) -> Optional[BallotItem]:
         """
@@ -78,39 +363,138 @@ class BallotRepository(BallotRepositoryInterface):
         """
         try:
             ballot = Ballot.objects.get(slug=slug)
-            choice_items = build_choices(ballot)
-
-            return BallotItem(
-                id=ballot.id,
-                title=ballot.title,
-                slug=ballot.slug,
-                description=ballot.description,
-                choices=choice_items
-            )
+            return build_ballot_item(ballot, build_choices(ballot))
+        except Ballot.DoesNotExist:
+            return None
+
+    def get_ballot_by_id(self, ballot_id: int) -> Optional[BallotItem]:
+        """
+        Get a ballot by its id.
+
+        Args:
+            ballot_id: The id of the ballot to retrieve
+
+        Returns:
+            The BallotItem object if found, None otherwise
+        """
+        try:
+            ballot = Ballot.objects.get(id=ballot_id)
+            return build_ballot_item(ballot, build_choices(ballot))
         except Ballot.DoesNotExist:
             return None
 
-    def list_ballots(self) -> List[BallotItem]:
+    def get_votes_version(self, ballot_id: int) -> Optional[int]:
         """
-        List all ballots.
+        Get the votes version of a ballot, without loading its choices.
+
+        Args:
+            ballot_id: The id of the ballot
 
         Returns:
-            A list of all BallotItem objects
+            The votes version if the ballot exists, None otherwise
+        """
+        return (
+            Ballot.objects
+            .filter(id=ballot_id)
+            .values_list('votes_version', flat=True)
+            .first()
+        )
+
+    def list_ballot_ids(self) -> List[int]:
         """
-        ballots = Ballot.objects.all()
-        ballot_items = []
+        List the id of every ballot, ordered by (created_at, id).
 
-        for ballot in ballots:
-            choice_items = build_choices(ballot)
-            ballot_items.append(BallotItem(
-                id=ballot.id,
-                title=ballot.title,
-                slug=ballot.slug,
-                description=ballot.description,
-                choices=choice_items
+        Returns:
+            A list of ballot ids
+        """
+        return list(
+            Ballot.objects.order_by('created_at', 'id').values_list('id', flat=True)
+        )
+
+    def list_ballots(
+            self,
+            cursor: Optional[BallotCursorItem] = None,
+            limit: Optional[int] = None
+    ) -> List[BallotItem]:
+        """
+        List ballots ordered by creation, one page at a time.
+
+        Choices of every ballot on the page are loaded with one prefetch query,
+        and pages are found by keyset on (created_at, id) so deep pages cost
+        the same as the first.
+
+        Args:
+            cursor: Optional position to list from, exclusive
+            limit: Optional maximum number of ballots to return
+
+        Returns:
+            A list of BallotItem objects
+        """
+        ballots = (
+            Ballot.objects
+            .only(
+                'id', 'title', 'slug', 'description',
+                'votes_version', 'created_at', 'updated_at',
+            )
+            .prefetch_related(Prefetch(
+                'choices',
+                queryset=Choice.objects.only(
+                    'id', 'ballot_id', 'name', 'description'
+                ).order_by('id')
             ))
+        )
+
+        return [
+            build_ballot_item(ballot, [
+                ChoiceItem(
+                    id=choice.id,
+                    name=choice.name,
+                    description=choice.description
+                )
+                for choice in ballot.choices.all()
+            ])
+            for ballot in page_ballots(ballots, cursor, limit)
+        ]
+
+    def get_ballot_version(self, slug: str) -> Optional[BallotVersionItem]:
+        """
+        Get the version of a ballot by its slug, without loading its choices.
+
+        Args:
+            slug: The slug of the ballot
 
-        return ballot_items
+        Returns:
+            The BallotVersionItem if the ballot exists, None otherwise
+        """
+        row = (
+            Ballot.objects
+            .filter(slug=slug)
+            .values_list('id', 'votes_version', 'updated_at')
+            .first()
+        )
+        return BallotVersionItem(*row) if row is not None else None
+
+    def list_ballot_versions(
+            self,
+            cursor: Optional[BallotCursorItem] = None,
+            limit: Optional[int] = None
+    ) -> List[BallotVersionItem]:
+        """
+        List the versions of the ballots on a page of list_ballots, without
+        loading their choices.
+
+        Args:
+            cursor: Optional position to list from, exclusive
+            limit: Optional maximum number of ballots to return
+
+        Returns:
+            A list of BallotVersionItem objects
+        """
+        ballots = Ballot.objects.values_list('id', 'votes_version', 'updated_at')
+        return [
+            BallotVersionItem(*row)
+            for row in page_ballots(ballots, cursor, limit)
+        ]
 
     def create_voter(
             self,
@@ -118,34 +502,305 @@ class BallotRepository(BallotRepositoryInterface):
             ballot_id: int,
             votes: List[dict]
     ) -> None:
-        voter = Voter.objects.create(
-            name=name,
-            ballot_id=ballot_id,
-        )
-        for vote in votes:
-            Vote.objects.create(
-                voter=voter,
-                rank=vote['rank'],
-                choice_id=vote['choice_id']
+        self.create_voters([{
+            'name': name,
+            'ballot_id': ballot_id,
+            'votes': votes,
+        }])
+
+    def create_voters(self, voters: List[dict]) -> int:
+        """
+        Create many voters and their votes in one transaction.
+
+        Voters and votes are each written with batched multi-row INSERTs, then
+        the ranking tallies and votes version of every affected ballot are
+        updated once.
+
+        Args:
+            voters: List of voters, each with a name, ballot_id and votes
+
+        Returns:
+            int: The number of voters created
+        """
+        with transaction.atomic():
+            voter_models = Voter.objects.bulk_create(
+                [
+                    Voter(name=voter['name'], ballot_id=voter['ballot_id'])
+                    for voter in voters
+                ],
+                batch_size=BULK_CREATE_BATCH_SIZE
+            )
+            Vote.objects.bulk_create(
+                [
+                    Vote(
+                        voter_id=voter_model.id,
+                        rank=vote['rank'],
+                        choice_id=vote['choice_id']
+                    )
+                    for voter_model, voter in zip(voter_models, voters, strict=True)
+                    for vote in voter['votes']
+                ],
+                batch_size=BULK_CREATE_BATCH_SIZE
             )
+            profiles: Dict[int, BallotProfileItem] = {}
+            for voter in voters:
+                profiles.setdefault(voter['ballot_id'], BallotProfileItem()).add(
+                    tuple(
+                        vote['choice_id']
+                        for vote in sorted(voter['votes'], key=itemgetter('rank'))
+                    )
+                )
+            add_ranking_tallies(profiles)
+            bump_votes_version(*profiles)
 
+        return len(voter_models)
 
-    def get_votes_by_ballot_id(self, ballot_id: int) -> List[VoterItem]:
-        voter_items = []
-        voters = Voter.objects.filter(ballot_id=ballot_id)
-        for voter in voters:
-            votes = Vote.objects.filter(voter_id=voter.id)
-            vote_items = []
-            for vote in votes:
-                vote_items.append(VoteItem(
-                    rank=vote.rank,
-                    choice_id=vote.choice_id
-                ))
-
-            voter_items.append(VoterItem(
-                name=voter.name,
-                ballot_id=ballot_id,
-                votes=vote_items
+    def import_voters(
+            self,
+            ballot_id: int,
+            voters: Iterable[Tuple[str, Sequence[int]]],
+            batch_size: int = IMPORT_BATCH_SIZE
+    ) -> int:
+        """
+        Import a stream of voters into a ballot in one transaction.
+
+        On PostgreSQL each batch is written with COPY FROM STDIN; other
+        databases fall back to bulk_create. Only one batch is held in memory.
+
+        Args:
+            ballot_id: The id of the ballot
+            voters: Iterable of (name, choice ids ordered by preference)
+            batch_size: Number of voters buffered per write
+
+        Returns:
+            int: The number of voters imported
+        """
+        voters = iter(voters)
+        imported = 0
+        with transaction.atomic():
+            while batch := list(islice(voters, batch_size)):
+                if connection.vendor == 'postgresql':
+                    copy_voters(ballot_id, batch)
+                    add_ranking_tallies({
+                        ballot_id: BallotProfileItem.from_rankings(
+                            tuple(choice_ids) for _, choice_ids in batch
+                        )
+                    })
+                else:
+                    self.create_voters([
+                        {
+                            'name': name,
+                            'ballot_id': ballot_id,
+                            'votes': [
+                                {'rank': rank, 'choice_id': choice_id}
+                                for rank, choice_id in enumerate(choice_ids, start=1)
+                            ],
+                        }
+                        for name, choice_ids in batch
+                    ])
+                imported += len(batch)
+            bump_votes_version(ballot_id)
+
+        return imported
+
+    def get_votes_by_ballot_id(self, ballot_id: int) -> PackedVotersItem:
+        """
+        Load the voters of a ballot into a compact PackedVotersItem.
+
+        Rows from the same ordered query as iter_votes_by_ballot_id are packed
+        straight into flat arrays, without building a VoteItem per vote.
+
+        Args:
+            ballot_id: The id of the ballot
+
+        Returns:
+            PackedVotersItem with the voters in the order they were created
+        """
+        packed = PackedVotersItem(ballot_id=ballot_id)
+        rows = ballot_vote_rows(ballot_id).iterator(chunk_size=VOTE_CHUNK_SIZE)
+        for (_voter_id, name), voter_rows in groupby(rows, key=itemgetter(0, 1)):
+            packed.append(name, (
+                (rank, choice_id)
+                for _, _, rank, choice_id in voter_rows
+                if choice_id is not None
             ))
+        return packed
+
+    def get_ballot_profile(self, ballot_id: int) -> BallotProfileItem:
+        """
+        Get the running ranking tallies of a ballot, without reading its votes.
+
+        Args:
+            ballot_id: The id of the ballot
 
-        return voter_items
+        Returns:
+            BallotProfileItem with the rankings in the order first cast
+        """
+        return BallotProfileItem(rankings={
+            parse_ranking_signature(signature): count
+            for signature, count in (
+                RankingTally.objects
+                .filter(ballot_id=ballot_id)
+                .order_by('id')
+                .values_list('signature', 'count')
+            )
+        })
+
+    def iter_votes_by_ballot_id(
+            self,
+            ballot_id: int,
+            chunk_size: int = VOTE_CHUNK_SIZE
+    ) -> Iterator[VoterItem]:
+        """
+        Stream the voters of a ballot with a single ordered query.
+
+        Rows are read from a server-side cursor chunk_size at a time and grouped
+        into VoterItems as they arrive, so memory stays bounded by one chunk.
+        Voters without votes are included with an empty list of votes.
+
+        Args:
+            ballot_id: The id of the ballot
+            chunk_size: Number of rows fetched per round trip
+
+        Returns:
+            Iterator over VoterItems in the order the voters were created
+        """
+        rows = ballot_vote_rows(ballot_id).iterator(chunk_size=chunk_size)
+        for (_voter_id, name), voter_rows in groupby(rows, key=itemgetter(0, 1)):
+            yield VoterItem(
+                name=name,
+                ballot_id=ballot_id,
+                votes=[
+                    VoteItem(rank=rank, choice_id=choice_id)
+                    for _, _, rank, choice_id in voter_rows
+                    if choice_id is not None
+                ]
+            )
+
+    def iter_rankings_by_ballot_id(
+            self,
+            ballot_id: int,
+            chunk_size: int = VOTE_CHUNK_SIZE,
+            shuffle_seed: Optional[int] = None
+    ) -> Iterator[Tuple[int, ...]]:
+        """
+        Stream each voter's choice ids ordered by rank, without their names.
+
+        Reads only (voter id, choice id) rows from a server-side cursor
+        chunk_size at a time, so memory stays bounded by one chunk however
+        many voters the ballot has. Voters without votes yield an empty
+        ranking.
+
+        With shuffle_seed, the voter ids alone are read and shuffled, and the
+        votes of chunk_size voters at a time are read in that order, so
+        memory holds one id per voter.
+
+        Args:
+            ballot_id: The id of the ballot
+            chunk_size: Number of rows fetched per round trip
+            shuffle_seed: Optional seed of a random order to stream voters in
+
+        Returns:
+            Iterator over rankings in the order the voters were created, or
+            in the order shuffle_seed fixes
+        """
+        if shuffle_seed is not None:
+            yield from self._iter_shuffled_rankings(
+                ballot_id, chunk_size, shuffle_seed
+            )
+            return
+
+        rows = (
+            Voter.objects
+            .filter(ballot_id=ballot_id)
+            .order_by('id', 'votes__rank', 'votes__id')
+            .values_list('id', 'votes__choice_id')
+            .iterator(chunk_size=chunk_size)
+        )
+        for _voter_id, voter_rows in groupby(rows, key=itemgetter(0)):
+            yield tuple(
+                choice_id for _, choice_id in voter_rows if choice_id is not None
+            )
+
+    @staticmethod
+    def _iter_shuffled_rankings(
+            ballot_id: int,
+            chunk_size: int,
+            shuffle_seed: int
+    ) -> Iterator[Tuple[int, ...]]:
+        voter_ids = array('q', (
+            Voter.objects
+            .filter(ballot_id=ballot_id)
+            .order_by('id')
+            .values_list('id', flat=True)
+            .iterator(chunk_size=chunk_size)
+        ))
+        random.Random(shuffle_seed).shuffle(voter_ids)
+
+        for start in range(0, len(voter_ids), chunk_size):
+            chunk = voter_ids[start:start + chunk_size]
+            rankings: Dict[int, List[int]] = {voter_id: [] for voter_id in chunk}
+            rows = (
+                Vote.objects
+                .filter(voter_id__in=chunk)
+                .order_by('voter_id', 'rank', 'id')
+                .values_list('voter_id', 'choice_id')
+            )
+            for voter_id, choice_id in rows:
+                rankings[voter_id].append(choice_id)
+            for voter_id in chunk:
+                yield tuple(rankings[voter_id])
+
+    async def aget_ballot_by_slug(self, slug: str) -> Optional[BallotItem]:
+        """
+        Get a ballot by its slug with the async ORM.
+
+        Args:
+            slug: The slug of the ballot to retrieve
+
+        Returns:
+            The BallotItem object if found, None otherwise
+        """
+        try:
+            ballot = await Ballot.objects.aget(slug=slug)
+        except Ballot.DoesNotExist:
+            return None
+
+        choice_items = [
+            ChoiceItem(id=choice.id, name=choice.name, description=choice.description)
+            async for choice in Choice.objects.filter(ballot=ballot)
+        ]
+        return build_ballot_item(ballot, choice_items)
+
+    async def aget_votes_by_ballot_id(self, ballot_id: int) -> PackedVotersItem:
+        """
+        Load the voters of a ballot into a compact PackedVotersItem with the
+        async ORM, packing rows as get_votes_by_ballot_id does.
+
+        Args:
+            ballot_id: The id of the ballot
+
+        Returns:
+            PackedVotersItem with the voters in the order they were created
+        """
+        packed = PackedVotersItem(ballot_id=ballot_id)
+        voter_key, name, votes = None, None, []
+        # values() rather than the values_list() of ballot_vote_rows: Django
+        # 4.2 runs a values_list() query eagerly, in the async context
+        rows = (
+            Voter.objects
+            .filter(ballot_id=ballot_id)
+            .order_by('id', 'votes__rank', 'votes__id')
+            .values('id', 'name', 'votes__rank', 'votes__choice_id')
+            .aiterator(chunk_size=VOTE_CHUNK_SIZE)
+        )
+        async for row in rows:
+            if row['id'] != voter_key:
+                if voter_key is not None:
+                    packed.append(name, votes)
+                voter_key, name, votes = row['id'], row['name'], []
+            if row['votes__choice_id'] is not None:
+                votes.append((row['votes__rank'], row['votes__choice_id']))
+        if voter_key is not None:
+            packed.append(name, votes)
+        return packed
@@ -1,7 +1,15 @@
+import random
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from operator import attrgetter
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
 
+from asgiref.sync import sync_to_async
+
+from ranked_choice.core.domain.items.ballot_cursor_item import BallotCursorItem
 from ranked_choice.core.domain.items.ballot_item import BallotItem
+from ranked_choice.core.domain.items.ballot_profile_item import BallotProfileItem
+from ranked_choice.core.domain.items.ballot_version_item import BallotVersionItem
+from ranked_choice.core.domain.items.packed_voters_item import PackedVotersItem
 from ranked_choice.core.domain.items.voter_item import VoterItem
 
 
@@ -31,6 +39,20 @@ class BallotRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def create_ballots(self, ballots: List[dict]) -> List[BallotItem]:
+        """
+        Create many ballots and their choices in one transaction.
+
+        Args:
+            ballots: List of ballots, each with a title, choices and optional
+                description
+
+        Returns:
+            List[BallotItem]: The created ballots with their choices, in order
+        """
+        pass
+
     @abstractmethod
     def get_ballot_by_slug(self, slug: str) -> Optional[BallotItem]:
         """
@@ -45,12 +67,88 @@ class BallotRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def list_ballots(self) -> List[BallotItem]:
+    def get_ballot_by_id(self, ballot_id: int) -> Optional[BallotItem]:
+        """
+        Get a ballot by its id.
+
+        Args:
+            ballot_id: The id of the ballot to retrieve
+
+        Returns:
+            The BallotItem object if found, None otherwise
+        """
+        pass
+
+    @abstractmethod
+    def get_votes_version(self, ballot_id: int) -> Optional[int]:
+        """
+        Get the votes version of a ballot, without loading its choices.
+
+        Args:
+            ballot_id: The id of the ballot
+
+        Returns:
+            The votes version if the ballot exists, None otherwise
+        """
+        pass
+
+    @abstractmethod
+    def list_ballot_ids(self) -> List[int]:
         """
-        List all ballots.
+        List the id of every ballot, ordered by (created_at, id).
 
         Returns:
-            A list of all BallotItem objects
+            A list of ballot ids
+        """
+        pass
+
+    @abstractmethod
+    def list_ballots(
+            self,
+            cursor: Optional[BallotCursorItem] = None,
+            limit: Optional[int] = None
+    ) -> List[BallotItem]:
+        """
+        List ballots ordered by (created_at, id).
+
+        Args:
+            cursor: Optional position to list from, exclusive
+            limit: Optional maximum number of ballots to return
+
+        Returns:
+            A list of BallotItem objects
+        """
+        pass
+
+    @abstractmethod
+    def get_ballot_version(self, slug: str) -> Optional[BallotVersionItem]:
+        """
+        Get the version of a ballot by its slug, without loading its choices.
+
+        Args:
+            slug: The slug of the ballot
+
+        Returns:
+            The BallotVersionItem if the ballot exists, None otherwise
+        """
+        pass
+
+    @abstractmethod
+    def list_ballot_versions(
+            self,
+            cursor: Optional[BallotCursorItem] = None,
+            limit: Optional[int] = None
+    ) -> List[BallotVersionItem]:
+        """
+        List the versions of the ballots on a page of list_ballots, without
+        loading their choices.
+
+        Args:
+            cursor: Optional position to list from, exclusive
+            limit: Optional maximum number of ballots to return
+
+        Returns:
+            A list of BallotVersionItem objects
         """
         pass
 
@@ -73,15 +171,144 @@ class BallotRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def get_votes_by_ballot_id(self, ballot_id: int) -> List[VoterItem]:
+    def create_voters(self, voters: List[dict]) -> int:
+        """
+        Create many voters and their votes in one transaction.
+
+        Args:
+            voters: List of voters, each with a name, ballot_id and votes
+
+        Returns:
+            int: The number of voters created
+        """
+        pass
+
+    @abstractmethod
+    def import_voters(
+            self,
+            ballot_id: int,
+            voters: Iterable[Tuple[str, Sequence[int]]],
+            batch_size: int = 10000
+    ) -> int:
+        """
+        Import a stream of voters into a ballot in one transaction.
+
+        Args:
+            ballot_id: The id of the ballot
+            voters: Iterable of (name, choice ids ordered by preference)
+            batch_size: Number of voters buffered per write
+
+        Returns:
+            int: The number of voters imported
+        """
+        pass
+
+    @abstractmethod
+    def get_votes_by_ballot_id(self, ballot_id: int) -> PackedVotersItem:
         """
         Get votes by ballot id.
 
         Args:
-            slug: The slug of the ballot to retrieve
+            ballot_id: The id of the ballot
 
         Returns:
-            The BallotItem object if found, None otherwise
-            :param ballot_id:
+            PackedVotersItem with the voters in the order they were created
+        """
+        pass
+
+    @abstractmethod
+    def get_ballot_profile(self, ballot_id: int) -> BallotProfileItem:
+        """
+        Get the running ranking tallies of a ballot, without reading its votes.
+
+        Args:
+            ballot_id: The id of the ballot
+
+        Returns:
+            BallotProfileItem with the rankings in the order first cast
+        """
+        pass
+
+    @abstractmethod
+    def iter_votes_by_ballot_id(
+            self,
+            ballot_id: int,
+            chunk_size: int = 2000
+    ) -> Iterator[VoterItem]:
+        """
+        Stream the voters of a ballot without loading them all into memory.
+
+        Args:
+            ballot_id: The id of the ballot
+            chunk_size: Number of rows fetched per round trip
+
+        Returns:
+            Iterator over VoterItems in the order the voters were created
         """
         pass
+
+    def iter_rankings_by_ballot_id(
+            self,
+            ballot_id: int,
+            chunk_size: int = 2000,
+            shuffle_seed: Optional[int] = None
+    ) -> Iterator[Tuple[int, ...]]:
+        """
+        Stream each voter's choice ids ordered by rank, without their names.
+        Derived from iter_votes_by_ballot_id unless an implementation
+        overrides it; this default holds every ranking to shuffle them.
+
+        Args:
+            ballot_id: The id of the ballot
+            chunk_size: Number of rows fetched per round trip
+            shuffle_seed: Optional seed of a random order to stream voters in
+
+        Returns:
+            Iterator over rankings in the order the voters were created, or
+            in the order shuffle_seed fixes
+        """
+        by_rank = attrgetter('rank')
+        rankings = (
+            tuple(vote.choice_id for vote in sorted(voter.votes, key=by_rank))
+            for voter in self.iter_votes_by_ballot_id(
+                ballot_id=ballot_id, chunk_size=chunk_size
+            )
+        )
+        if shuffle_seed is None:
+            yield from rankings
+            return
+
+        rankings = list(rankings)
+        random.Random(shuffle_seed).shuffle(rankings)
+        yield from rankings
+
+    async def aget_ballot_by_slug(self, slug: str) -> Optional[BallotItem]:
+        """
+        Async counterpart of get_ballot_by_slug.
+        Runs the sync method in a thread unless an implementation overrides it.
+        """
+        return await sync_to_async(self.get_ballot_by_slug)(slug=slug)
+
+    async def acreate_voter(
+            self,
+            name: str,
+            ballot_id: int,
+            votes: List[dict]
+    ) -> None:
+        """
+        Async counterpart of create_voter.
+        Runs the sync method in a thread unless an implementation overrides it.
+        The database repository keeps it that way: the voter, its votes, the
+        ranking tallies and the votes version are written in one transaction,
+        which Django's async ORM cannot open.
+        """
+        await sync_to_async(self.create_voter)(
+            name=name, ballot_id=ballot_id, votes=votes
+        )
+
+    async def aget_votes_by_ballot_id(self, ballot_id: int) -> PackedVotersItem:
+        """
+        Async counterpart of get_votes_by_ballot_id.
+        Runs the sync method in a thread unless an implementation overrides it.
+        """
+        return await sync_to_async(self.get_votes_by_ballot_id)(ballot_id=ballot_id)
@@ -0,0 +1,249 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+
+from ranked_choice.core.domain.items.ballot_cursor_item import BallotCursorItem
+from ranked_choice.core.domain.items.ballot_item import BallotItem
+from ranked_choice.core.domain.items.ballot_profile_item import BallotProfileItem
+from ranked_choice.core.domain.items.ballot_version_item import BallotVersionItem
+from ranked_choice.core.domain.items.cache_stats_item import CacheStatsItem
+from ranked_choice.core.domain.items.packed_voters_item import PackedVotersItem
+from ranked_choice.core.domain.items.voter_item import VoterItem
+from ranked_choice.core.models import Ballot
+from ranked_choice.core.repositories.ballot_repository import BallotRepository
+from ranked_choice.core.repositories.ballot_repository_interface import (
+    BallotRepositoryInterface,
+)
+
+
+class CachedBallotRepository(BallotRepositoryInterface):
+    """
+    Ballot repository that keeps recently read ballots in memory.
+
+    get_ballot_by_slug and aget_ballot_by_slug are served from a bounded LRU
+    cache whose entries expire after ttl seconds; every other method is
+    passed through to the wrapped repository. Missing ballots are not cached.
+
+    Ballot definitions do not change once created, but the votes_version of
+    a cached BallotItem may lag by up to ttl seconds, so results must be keyed
+    by get_votes_version or get_ballot_version instead.
+    """
+
+    def __init__(
+            self,
+            repository: Optional[BallotRepositoryInterface] = None,
+            max_size: int = 1024,
+            ttl: float = 60,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            repository: Optional repository to wrap, defaults to BallotRepository
+            max_size: Most ballots kept before the least recently used is evicted
+            ttl: Seconds a ballot is served from memory before it is read again
+            clock: Optional source of monotonic seconds, for tests
+        """
+        self.repository = repository or BallotRepository()
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: 'OrderedDict[str, Tuple[float, BallotItem]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def stats(self) -> CacheStatsItem:
+        with self._lock:
+            return CacheStatsItem(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+                max_size=self.max_size
+            )
+
+    def invalidate(self, slug: str) -> None:
+        """
+        Drop the cached ballot with this slug, if any.
+        """
+        with self._lock:
+            self._entries.pop(slug, None)
+
+    def invalidate_ballot(self, ballot_id: int) -> None:
+        """
+        Drop the cached ballot with this id, if any.
+        """
+        with self._lock:
+            for slug, (_, ballot) in list(self._entries.items()):
+                if ballot.id == ballot_id:
+                    del self._entries[slug]
+
+    def clear(self) -> None:
+        """
+        Drop every cached ballot. Counters are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def get_ballot_by_slug(self, slug: str) -> Optional[BallotItem]:
+        ballot = self._get(slug)
+        if ballot is None:
+            ballot = self.repository.get_ballot_by_slug(slug=slug)
+            self._put(slug, ballot)
+        return ballot
+
+    async def aget_ballot_by_slug(self, slug: str) -> Optional[BallotItem]:
+        ballot = self._get(slug)
+        if ballot is None:
+            ballot = await self.repository.aget_ballot_by_slug(slug=slug)
+            self._put(slug, ballot)
+        return ballot
+
+    def _get(self, slug: str) -> Optional[BallotItem]:
+        with self._lock:
+            entry = self._entries.get(slug)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, ballot = entry
+            if self._clock() >= expires_at:
+                del self._entries[slug]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(slug)
+            self._hits += 1
+            return ballot
+
+    def _put(self, slug: str, ballot: Optional[BallotItem]) -> None:
+        if ballot is None:
+            return
+        with self._lock:
+            self._entries[slug] = (self._clock() + self.ttl, ballot)
+            self._entries.move_to_end(slug)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def create_ballot(
+            self,
+            title: str,
+            choices: List[dict],
+            description: Optional[str] = None
+    ) -> str:
+        return self.repository.create_ballot(
+            title=title, choices=choices, description=description
+        )
+
+    def create_ballots(self, ballots: List[dict]) -> List[BallotItem]:
+        return self.repository.create_ballots(ballots=ballots)
+
+    def get_ballot_by_id(self, ballot_id: int) -> Optional[BallotItem]:
+        return self.repository.get_ballot_by_id(ballot_id=ballot_id)
+
+    def get_votes_version(self, ballot_id: int) -> Optional[int]:
+        return self.repository.get_votes_version(ballot_id=ballot_id)
+
+    def list_ballot_ids(self) -> List[int]:
+        return self.repository.list_ballot_ids()
+
+    def list_ballots(
+            self,
+            cursor: Optional[BallotCursorItem] = None,
+            limit: Optional[int] = None
+    ) -> List[BallotItem]:
+        return self.repository.list_ballots(cursor=cursor, limit=limit)
+
+    def get_ballot_version(self, slug: str) -> Optional[BallotVersionItem]:
+        return self.repository.get_ballot_version(slug=slug)
+
+    def list_ballot_versions(
+            self,
+            cursor: Optional[BallotCursorItem] = None,
+            limit: Optional[int] = None
+    ) -> List[BallotVersionItem]:
+        return self.repository.list_ballot_versions(cursor=cursor, limit=limit)
+
+    def create_voter(
+            self,
+            name: str,
+            ballot_id: int,
+            votes: List[dict]
+    ) -> None:
+        self.repository.create_voter(name=name, ballot_id=ballot_id, votes=votes)
+
+    def create_voters(self, voters: List[dict]) -> int:
+        return self.repository.create_voters(voters=voters)
+
+    def import_voters(
+            self,
+            ballot_id: int,
+            voters: Iterable[Tuple[str, Sequence[int]]],
+            batch_size: int = 10000
+    ) -> int:
+        return self.repository.import_voters(
+            ballot_id=ballot_id, voters=voters, batch_size=batch_size
+        )
+
+    def get_votes_by_ballot_id(self, ballot_id: int) -> PackedVotersItem:
+        return self.repository.get_votes_by_ballot_id(ballot_id=ballot_id)
+
+    def get_ballot_profile(self, ballot_id: int) -> BallotProfileItem:
+        return self.repository.get_ballot_profile(ballot_id=ballot_id)
+
+    def iter_votes_by_ballot_id(
+            self,
+            ballot_id: int,
+            chunk_size: int = 2000
+    ) -> Iterator[VoterItem]:
+        return self.repository.iter_votes_by_ballot_id(
+            ballot_id=ballot_id, chunk_size=chunk_size
+        )
+
+    def iter_rankings_by_ballot_id(
+            self,
+            ballot_id: int,
+            chunk_size: int = 2000,
+            shuffle_seed: Optional[int] = None
+    ) -> Iterator[Tuple[int, ...]]:
+        return self.repository.iter_rankings_by_ballot_id(
+            ballot_id=ballot_id, chunk_size=chunk_size, shuffle_seed=shuffle_seed
+        )
+
+    async def acreate_voter(
+            self,
+            name: str,
+            ballot_id: int,
+            votes: List[dict]
+    ) -> None:
+        await self.repository.acreate_voter(
+            name=name, ballot_id=ballot_id, votes=votes
+        )
+
+    async def aget_votes_by_ballot_id(self, ballot_id: int) -> PackedVotersItem:
+        return await self.repository.aget_votes_by_ballot_id(ballot_id=ballot_id)
+
+
+# Shared by the ballot views of this process
+cached_ballot_repository = CachedBallotRepository(
+    max_size=settings.BALLOT_MEMORY_CACHE_SIZE,
+    ttl=settings.BALLOT_MEMORY_CACHE_TTL_SECONDS
+)
+
+
+def invalidate_cached_ballot(sender, instance, **kwargs) -> None:
+    """
+    Signal receiver dropping the cached copy of a saved or deleted ballot,
+    or of the ballot of a saved or deleted choice.
+    """
+    cached_ballot_repository.invalidate_ballot(
+        instance.id if sender is Ballot else instance.ballot_id
+    )
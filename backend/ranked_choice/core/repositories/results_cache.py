@@ -0,0 +1,64 @@
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+from ranked_choice.core.domain.items.ballot_item import BallotResultItem
+from ranked_choice.core.repositories.results_cache_interface import (
+    ResultsCacheInterface,
+)
+
+# Bump when BallotResultItem changes shape so old pickles are never read back
+RESULTS_CACHE_KEY_PREFIX = 'ballot-results:v2'
+
+
+class ResultsCache(ResultsCacheInterface):
+    """
+    Django cache implementation of the results cache.
+    Uses the cache alias named by settings.RESULTS_CACHE_ALIAS.
+    """
+
+    def __init__(self, alias: Optional[str] = None):
+        self.cache = caches[alias or settings.RESULTS_CACHE_ALIAS]
+
+    def get_result(
+            self,
+            ballot_id: int,
+            votes_version: int
+    ) -> Optional[BallotResultItem]:
+        return self.cache.get(self._key(ballot_id, votes_version))
+
+    def set_result(
+            self,
+            ballot_id: int,
+            votes_version: int,
+            result: BallotResultItem
+    ) -> None:
+        self.cache.set(
+            self._key(ballot_id, votes_version),
+            result,
+            timeout=settings.RESULTS_CACHE_TIMEOUT
+        )
+
+    async def aget_result(
+            self,
+            ballot_id: int,
+            votes_version: int
+    ) -> Optional[BallotResultItem]:
+        return await self.cache.aget(self._key(ballot_id, votes_version))
+
+    async def aset_result(
+            self,
+            ballot_id: int,
+            votes_version: int,
+            result: BallotResultItem
+    ) -> None:
+        await self.cache.aset(
+            self._key(ballot_id, votes_version),
+            result,
+            timeout=settings.RESULTS_CACHE_TIMEOUT
+        )
+
+    @staticmethod
+    def _key(ballot_id: int, votes_version: int) -> str:
+        return f'{RESULTS_CACHE_KEY_PREFIX}:{ballot_id}:{votes_version}'
@@ -0,0 +1,73 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from asgiref.sync import sync_to_async
+
+from ranked_choice.core.domain.items.ballot_item import BallotResultItem
+
+
+class ResultsCacheInterface(ABC):
+    """
+    Abstract base class for a store of computed ballot results.
+    Results are keyed by ballot id and the ballot's votes version, so an entry
+    can never go stale: casting a vote bumps the version and the next read
+    misses.
+    """
+
+    @abstractmethod
+    def get_result(
+            self,
+            ballot_id: int,
+            votes_version: int
+    ) -> Optional[BallotResultItem]:
+        """
+        Get the stored result of a ballot.
+
+        Args:
+            ballot_id: The id of the ballot
+            votes_version: The votes version the result was computed at
+
+        Returns:
+            The BallotResultItem if stored, None otherwise
+        """
+        pass
+
+    @abstractmethod
+    def set_result(
+            self,
+            ballot_id: int,
+            votes_version: int,
+            result: BallotResultItem
+    ) -> None:
+        """
+        Store the result of a ballot.
+
+        Args:
+            ballot_id: The id of the ballot
+            votes_version: The votes version the result was computed at
+            result: The computed result
+        """
+        pass
+
+    async def aget_result(
+            self,
+            ballot_id: int,
+            votes_version: int
+    ) -> Optional[BallotResultItem]:
+        """
+        Async counterpart of get_result.
+        Runs the sync method in a thread unless an implementation overrides it.
+        """
+        return await sync_to_async(self.get_result)(ballot_id, votes_version)
+
+    async def aset_result(
+            self,
+            ballot_id: int,
+            votes_version: int,
+            result: BallotResultItem
+    ) -> None:
+        """
+        Async counterpart of set_result.
+        Runs the sync method in a thread unless an implementation overrides it.
+        """
+        await sync_to_async(self.set_result)(ballot_id, votes_version, result)
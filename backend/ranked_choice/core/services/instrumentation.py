@@ -0,0 +1,292 @@
+"""
+Lightweight timing of the hot paths.
+
+A stage records its wall time, the database queries run inside it and,
+when it sets one, a row count. Every stage is added to the process-wide
+metrics_registry, and to the timings of the current request when a request
+is being collected (see ranked_choice.api.middleware.ServerTimingMiddleware).
+Stages nest; a query counts towards every stage it ran in.
+"""
+import functools
+import inspect
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection
+
+from ranked_choice.core.domain.items.cache_stats_item import CacheStatsItem
+
+# Upper bounds in seconds of the stage duration histogram buckets
+DURATION_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10
+)
+
+METRIC_PREFIX = 'ranked_choice'
+
+
+@dataclass
+class StageTiming:
+    """
+    What one run of a stage cost. queries is None when they were not
+    counted, as in async stages whose queries run on other threads.
+    """
+    name: str
+    seconds: float = 0.0
+    queries: Optional[int] = 0
+    rows: Optional[int] = None
+
+
+_request_timings: ContextVar[Optional[List[StageTiming]]] = ContextVar(
+    'request_timings', default=None
+)
+
+
+@dataclass
+class _StageMetrics:
+    count: int = 0
+    seconds: float = 0.0
+    buckets: List[int] = field(
+        default_factory=lambda: [0] * len(DURATION_BUCKETS)
+    )
+    queries: int = 0
+    rows: int = 0
+
+
+class MetricsRegistry:
+    """
+    Per-process totals of every stage, rendered in the Prometheus text
+    format. Each worker process keeps its own, so scrape every worker or
+    sum them in the query.
+    """
+
+    def __init__(self):
+        self._stages: Dict[str, _StageMetrics] = {}
+        self._collectors: List[Callable[[], List[str]]] = []
+        self._lock = threading.Lock()
+
+    def observe(self, timing: StageTiming) -> None:
+        index = bisect_left(DURATION_BUCKETS, timing.seconds)
+        with self._lock:
+            metrics = self._stages.setdefault(timing.name, _StageMetrics())
+            metrics.count += 1
+            metrics.seconds += timing.seconds
+            if index < len(DURATION_BUCKETS):
+                metrics.buckets[index] += 1
+            metrics.queries += timing.queries or 0
+            metrics.rows += timing.rows or 0
+
+    def add_collector(self, collector: Callable[[], List[str]]) -> None:
+        """
+        Add a callable returning extra exposition lines, such as gauges read
+        from another component, to every render.
+        """
+        self._collectors.append(collector)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+
+    def render(self) -> str:
+        with self._lock:
+            stages = sorted(
+                (name, _StageMetrics(
+                    count=metrics.count,
+                    seconds=metrics.seconds,
+                    buckets=list(metrics.buckets),
+                    queries=metrics.queries,
+                    rows=metrics.rows
+                ))
+                for name, metrics in self._stages.items()
+            )
+
+        duration = f'{METRIC_PREFIX}_stage_duration_seconds'
+        queries = f'{METRIC_PREFIX}_stage_queries_total'
+        rows = f'{METRIC_PREFIX}_stage_rows_total'
+        lines = [
+            f'# HELP {duration} Wall time of each instrumented stage.',
+            f'# TYPE {duration} histogram',
+        ]
+        for name, metrics in stages:
+            cumulative = 0
+            for bound, count in zip(DURATION_BUCKETS, metrics.buckets, strict=True):
+                cumulative += count
+                lines.append(
+                    f'{duration}_bucket{{stage="{name}",le="{bound}"}} {cumulative}'
+                )
+            lines += [
+                f'{duration}_bucket{{stage="{name}",le="+Inf"}} {metrics.count}',
+                f'{duration}_sum{{stage="{name}"}} {metrics.seconds:.6f}',
+                f'{duration}_count{{stage="{name}"}} {metrics.count}',
+            ]
+        lines += [
+            f'# HELP {queries} Database queries run inside each stage.',
+            f'# TYPE {queries} counter',
+        ]
+        lines += [
+            f'{queries}{{stage="{name}"}} {metrics.queries}'
+            for name, metrics in stages
+        ]
+        lines += [
+            f'# HELP {rows} Rows loaded or written by each stage.',
+            f'# TYPE {rows} counter',
+        ]
+        lines += [
+            f'{rows}{{stage="{name}"}} {metrics.rows}' for name, metrics in stages
+        ]
+        for collector in self._collectors:
+            lines += collector()
+        return '\n'.join(lines) + '\n'
+
+
+metrics_registry = MetricsRegistry()
+
+
+def cache_stats_metrics(cache: str, stats: CacheStatsItem) -> List[str]:
+    """
+    Exposition lines for the counters of an in-process cache.
+    """
+    lines = []
+    for counter in ('hits', 'misses', 'evictions', 'expirations'):
+        metric = f'{METRIC_PREFIX}_cache_{counter}_total'
+        lines += [
+            f'# TYPE {metric} counter',
+            f'{metric}{{cache="{cache}"}} {getattr(stats, counter)}',
+        ]
+    for gauge in ('size', 'max_size'):
+        metric = f'{METRIC_PREFIX}_cache_{gauge}'
+        lines += [
+            f'# TYPE {metric} gauge',
+            f'{metric}{{cache="{cache}"}} {getattr(stats, gauge)}',
+        ]
+    return lines
+
+
+@contextmanager
+def collect_request_timings() -> Iterator[List[StageTiming]]:
+    """
+    Collect the timings of every stage run in this context, in the order
+    they finished.
+    """
+    timings: List[StageTiming] = []
+    token = _request_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _request_timings.reset(token)
+
+
+def _record(timing: StageTiming) -> None:
+    metrics_registry.observe(timing)
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.append(timing)
+
+
+@contextmanager
+def stage(name: str, count_queries: bool = True) -> Iterator[StageTiming]:
+    """
+    Time the enclosed block as a stage. Set rows on the yielded timing to
+    record how many rows the stage handled.
+    """
+    timing = StageTiming(name=name, queries=0 if count_queries else None)
+    if not settings.INSTRUMENTATION_ENABLED:
+        yield timing
+        return
+
+    def count_query(execute, sql, params, many, context):
+        timing.queries += 1
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        if count_queries:
+            with connection.execute_wrapper(count_query):
+                yield timing
+        else:
+            yield timing
+    finally:
+        timing.seconds = time.perf_counter() - start
+        _record(timing)
+
+
+def instrumented(name: Optional[str] = None, rows: Optional[Callable] = None):
+    """
+    Decorator timing each call of a sync or async function as a stage.
+
+    Args:
+        name: Optional stage name, defaults to the function name without a
+            _workflow suffix
+        rows: Optional function of the return value giving the row count
+    """
+    def decorator(fn):
+        stage_name = name or fn.__name__.removesuffix('_workflow')
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                # Queries of async code run on other threads' connections
+                with stage(stage_name, count_queries=False) as timing:
+                    result = await fn(*args, **kwargs)
+                    timing.rows = _count_rows(rows, result)
+                    return result
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with stage(stage_name) as timing:
+                result = fn(*args, **kwargs)
+                timing.rows = _count_rows(rows, result)
+                return result
+        return wrapper
+    return decorator
+
+
+def _count_rows(rows: Optional[Callable], result) -> Optional[int]:
+    # A result the row counter cannot measure is left uncounted rather than
+    # failing the call it was timing
+    if rows is None:
+        return None
+    try:
+        return rows(result)
+    except TypeError:
+        return None
+
+
+def server_timing(timings: List[StageTiming]) -> str:
+    """
+    Encode timings as a Server-Timing header value. A stage that ran more
+    than once in the request is reported once with its durations summed.
+    """
+    totals: Dict[str, Tuple[float, Optional[int], Optional[int]]] = {}
+    for timing in timings:
+        seconds, queries, rows = totals.get(timing.name, (0.0, None, None))
+        totals[timing.name] = (
+            seconds + timing.seconds,
+            _add(queries, timing.queries),
+            _add(rows, timing.rows),
+        )
+
+    entries = []
+    for name, (seconds, queries, rows) in totals.items():
+        details = []
+        if queries is not None:
+            details.append(f'queries={queries}')
+        if rows is not None:
+            details.append(f'rows={rows}')
+        entry = f'{name};dur={seconds * 1000:.2f}'
+        if details:
+            entry += f';desc="{" ".join(details)}"'
+        entries.append(entry)
+    return ', '.join(entries)
+
+
+def _add(total: Optional[int], value: Optional[int]) -> Optional[int]:
+    if value is None:
+        return total
+    return (total or 0) + value
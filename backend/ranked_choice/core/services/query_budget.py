@@ -0,0 +1,141 @@
+"""
+Query budgets for the workflows.
+
+A workflow declares the most queries one call may run, and query_budget
+counts the queries the call actually ran. Going over budget raises
+QueryBudgetExceeded when QUERY_BUDGET_STRICT is set, as it is under the test
+suite so a regression fails CI, and is logged otherwise. With
+QUERY_SHAPE_CHECK_ENABLED, the default in DEBUG and under tests, a statement
+shape run more than QUERY_SHAPE_REPEAT_LIMIT times in one call is logged as
+a likely N+1.
+
+Savepoint statements are not counted: atomic() issues them inside an outer
+transaction, as under the test suite, but not at the top level.
+"""
+import functools
+import inspect
+import logging
+import re
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Union
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+# A number of queries, or a function of the call's arguments by name giving one
+QueryBudget = Union[int, Callable[[Dict], int]]
+
+_SAVEPOINT = re.compile(r'(RELEASE |ROLLBACK TO )?SAVEPOINT ', re.IGNORECASE)
+_PLACEHOLDER_RUN = re.compile(r'%s(?:\s*,\s*%s)+')
+_ROW_RUN = re.compile(r'\(%s\)(?:\s*,\s*\(%s\))+')
+
+
+class QueryBudgetExceeded(AssertionError):
+    """
+    Raised in strict mode when a call runs more queries than its budget.
+    """
+
+
+def query_shape(sql: str) -> str:
+    """
+    The statement with its runs of placeholders collapsed, so an IN list or
+    a multi-row VALUES of any length has a single shape.
+    """
+    return _ROW_RUN.sub('(%s)', _PLACEHOLDER_RUN.sub('%s', sql))
+
+
+@dataclass
+class QueryLog:
+    statements: List[str] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def repeated_shapes(self, limit: int) -> Dict[str, int]:
+        """
+        The shapes run more than limit times, with how often they ran.
+        """
+        shapes = Counter(query_shape(sql) for sql in self.statements)
+        return {shape: count for shape, count in shapes.items() if count > limit}
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryLog]:
+    """
+    Log the statements run on this thread's connection in this context.
+    """
+    log = QueryLog()
+
+    def record(execute, sql, params, many, context):
+        if not _SAVEPOINT.match(sql):
+            log.statements.append(sql)
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(record):
+        yield log
+
+
+def check_query_budget(name: str, budget: int, log: QueryLog) -> None:
+    """
+    Report a call that ran more queries than its budget, or repeated a
+    statement shape suspiciously often.
+
+    Raises:
+        QueryBudgetExceeded: If over budget and QUERY_BUDGET_STRICT is set
+    """
+    if settings.QUERY_SHAPE_CHECK_ENABLED:
+        repeated = log.repeated_shapes(settings.QUERY_SHAPE_REPEAT_LIMIT)
+        for shape, count in repeated.items():
+            logger.warning(
+                "%s ran the same query %d times, likely an N+1: %s",
+                name, count, shape
+            )
+
+    if log.count <= budget:
+        return
+    message = f"{name} ran {log.count} queries, over its budget of {budget}"
+    if settings.QUERY_BUDGET_STRICT:
+        raise QueryBudgetExceeded('\n    '.join(
+            [message, *map(query_shape, log.statements)]
+        ))
+    logger.warning(message)
+
+
+def query_budget(budget: QueryBudget):
+    """
+    Decorator holding each call of a sync function to a query budget.
+
+    Async functions are refused: their queries run on other threads'
+    connections, which a budget cannot see.
+
+    Args:
+        budget: The most queries one call may run, or a function of the
+            call's arguments by name giving it
+    """
+    def decorator(fn):
+        if inspect.iscoroutinefunction(fn):
+            raise TypeError(f"query_budget cannot count the queries of {fn!r}")
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not settings.QUERY_BUDGET_ENABLED:
+                return fn(*args, **kwargs)
+
+            with count_queries() as log:
+                result = fn(*args, **kwargs)
+            if callable(budget):
+                arguments = signature.bind(*args, **kwargs)
+                arguments.apply_defaults()
+                limit = budget(arguments.arguments)
+            else:
+                limit = budget
+            check_query_budget(fn.__qualname__, limit, log)
+            return result
+        return wrapper
+    return decorator
@@ -0,0 +1,241 @@
+import asyncio
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from ranked_choice.core.domain.items.ballot_item import BallotResultItem
+from ranked_choice.core.domain.workflows.get_votes_workflow import get_votes_workflow
+from ranked_choice.core.repositories.ballot_repository import BallotRepository
+from ranked_choice.core.repositories.results_cache import ResultsCache
+
+logger = logging.getLogger(__name__)
+
+# Sent when nothing else has been for a while, so proxies keep the
+# connection open and a gone client is noticed on the next write
+KEEPALIVE = ': keep-alive\n\n'
+
+# Messages buffered per subscriber before it is resynced with a full result
+SUBSCRIBER_QUEUE_SIZE = 16
+
+
+def format_event(event: str, event_id: int, data: dict) -> str:
+    """
+    Encode one Server-Sent Events message.
+    """
+    payload = json.dumps(data, separators=(',', ':'))
+    return f'id: {event_id}\nevent: {event}\ndata: {payload}\n\n'
+
+
+def result_payload(result: BallotResultItem) -> dict:
+    """
+    The result in the shape served by BallotResultSerializer.
+    """
+    return {
+        'winner_id': result.winner_id,
+        'winner_name': result.winner_name,
+        'title': result.title,
+        'rounds': [asdict(round_item) for round_item in result.rounds],
+    }
+
+
+def result_delta(previous: BallotResultItem, current: BallotResultItem) -> dict:
+    """
+    The changes from one result to the next.
+
+    Holds the winner fields and title only when they changed, the round items
+    that are new or whose votes changed under "rounds", and the
+    (round_index, name) of round items that disappeared under "removed_rounds".
+    """
+    delta = {
+        name: getattr(current, name)
+        for name in ('winner_id', 'winner_name', 'title')
+        if getattr(current, name) != getattr(previous, name)
+    }
+
+    previous_votes = {
+        (item.round_index, item.name): item.votes for item in previous.rounds
+    }
+    current_keys = {(item.round_index, item.name) for item in current.rounds}
+    rounds = [
+        asdict(item) for item in current.rounds
+        if previous_votes.get((item.round_index, item.name)) != item.votes
+    ]
+    removed_rounds = [
+        {'round_index': round_index, 'name': name}
+        for round_index, name in previous_votes
+        if (round_index, name) not in current_keys
+    ]
+    if rounds:
+        delta['rounds'] = rounds
+    if removed_rounds:
+        delta['removed_rounds'] = removed_rounds
+    return delta
+
+
+@dataclass
+class _Subscriber:
+    queue: asyncio.Queue
+    synced: bool = False
+
+
+@dataclass
+class _BallotChannel:
+    ballot_id: int
+    slug: str
+    loop: asyncio.AbstractEventLoop
+    wake: asyncio.Event = field(default_factory=asyncio.Event)
+    subscribers: List[_Subscriber] = field(default_factory=list)
+    task: Optional[asyncio.Task] = None
+    votes_version: Optional[int] = None
+    result: Optional[BallotResultItem] = None
+    message: Optional[str] = None
+
+
+class ResultsBroadcaster:
+    """
+    Fans the results of a ballot out to every subscriber in this process.
+
+    Each ballot with subscribers gets one channel task that watches the
+    ballot's votes version and tabulates once per change, however many
+    viewers are connected. The task wakes on notify() for votes cast in this
+    process and polls the votes version for votes cast anywhere else.
+    Subscribers receive a full result first and deltas after that.
+    """
+
+    def __init__(
+            self,
+            load_votes_version: Optional[Callable[[int], Optional[int]]] = None,
+            load_result: Optional[Callable[[str], BallotResultItem]] = None,
+            poll_interval: Optional[float] = None,
+            debounce: Optional[float] = None,
+            keepalive: Optional[float] = None
+    ):
+        """
+        Args:
+            load_votes_version: Optional reader of a ballot's votes version by id
+            load_result: Optional tabulator of a ballot's result by slug
+            poll_interval: Optional seconds between votes version checks
+            debounce: Optional seconds to let a burst of votes land after a
+                notify before tabulating
+            keepalive: Optional seconds of silence before a keep-alive comment
+        """
+        self._load_votes_version = (
+            load_votes_version or BallotRepository().get_votes_version
+        )
+        self._load_result = load_result or self._load_cached_result
+        self.poll_interval = (
+            settings.RESULTS_STREAM_POLL_SECONDS
+            if poll_interval is None else poll_interval
+        )
+        self.debounce = (
+            settings.RESULTS_STREAM_DEBOUNCE_SECONDS if debounce is None else debounce
+        )
+        self.keepalive = (
+            settings.RESULTS_STREAM_KEEPALIVE_SECONDS
+            if keepalive is None else keepalive
+        )
+        self._channels: Dict[int, _BallotChannel] = {}
+
+    async def subscribe(self, ballot_id: int, slug: str) -> AsyncIterator[str]:
+        """
+        Yield encoded Server-Sent Events messages with the results of a ballot
+        until the caller stops iterating.
+        """
+        channel = self._channels.get(ballot_id)
+        if channel is None:
+            channel = _BallotChannel(
+                ballot_id=ballot_id, slug=slug, loop=asyncio.get_running_loop()
+            )
+            self._channels[ballot_id] = channel
+            channel.task = asyncio.create_task(self._run(channel))
+
+        subscriber = _Subscriber(queue=asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE))
+        channel.subscribers.append(subscriber)
+        if channel.message is not None:
+            self._send(subscriber, channel.message, channel.message)
+
+        try:
+            while True:
+                try:
+                    yield await asyncio.wait_for(
+                        subscriber.queue.get(), self.keepalive
+                    )
+                except asyncio.TimeoutError:
+                    yield KEEPALIVE
+        finally:
+            channel.subscribers.remove(subscriber)
+            if not channel.subscribers:
+                channel.task.cancel()
+                if self._channels.get(ballot_id) is channel:
+                    del self._channels[ballot_id]
+
+    def notify(self, ballot_id: int) -> None:
+        """
+        Signal that votes were cast on a ballot. Safe to call from any thread.
+        """
+        channel = self._channels.get(ballot_id)
+        if channel is not None and not channel.loop.is_closed():
+            channel.loop.call_soon_threadsafe(channel.wake.set)
+
+    async def _run(self, channel: _BallotChannel) -> None:
+        while True:
+            try:
+                votes_version = await sync_to_async(self._load_votes_version)(
+                    channel.ballot_id
+                )
+                if votes_version is not None and votes_version != channel.votes_version:
+                    result = await sync_to_async(self._load_result)(channel.slug)
+                    self._publish(channel, votes_version, result)
+            except Exception:
+                logger.exception("Could not refresh results of %s", channel.slug)
+
+            try:
+                await asyncio.wait_for(channel.wake.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                continue
+            await asyncio.sleep(self.debounce)
+            channel.wake.clear()
+
+    def _publish(
+            self,
+            channel: _BallotChannel,
+            votes_version: int,
+            result: BallotResultItem
+    ) -> None:
+        message = format_event('result', votes_version, result_payload(result))
+        delta = None
+        if channel.result is not None:
+            changes = result_delta(channel.result, result)
+            if changes:
+                delta = format_event('delta', votes_version, changes)
+
+        channel.votes_version = votes_version
+        channel.result = result
+        channel.message = message
+        for subscriber in channel.subscribers:
+            if not subscriber.synced:
+                self._send(subscriber, message, message)
+            elif delta is not None:
+                self._send(subscriber, delta, message)
+
+    @staticmethod
+    def _send(subscriber: _Subscriber, message: str, full_message: str) -> None:
+        try:
+            subscriber.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # A subscriber this far behind skips to the latest full result
+            while not subscriber.queue.empty():
+                subscriber.queue.get_nowait()
+            subscriber.queue.put_nowait(full_message)
+        subscriber.synced = True
+
+    @staticmethod
+    def _load_cached_result(slug: str) -> BallotResultItem:
+        return get_votes_workflow(slug=slug, results_cache=ResultsCache())
+
+
+results_broadcaster = ResultsBroadcaster()
@@ -0,0 +1,165 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from ranked_choice.core.domain.workflows.create_voters_workflow import (
+    create_voters_workflow,
+)
+from ranked_choice.core.services.results_broadcaster import results_broadcaster
+from ranked_choice.core.services.vote_queue_interface import (
+    VoteQueueFull,
+    VoteQueueInterface,
+)
+
+logger = logging.getLogger(__name__)
+
+_CLOSE = object()
+
+
+def write_voters(voters: List[dict]) -> None:
+    """
+    Write a batch of voters in one transaction and wake the results streams
+    of their ballots.
+    """
+    try:
+        create_voters_workflow(voters=voters)
+    finally:
+        # The flusher thread lives for the whole process, so give its
+        # connection the same lifetime checks a request would
+        close_old_connections()
+    for ballot_id in {voter['ballot_id'] for voter in voters}:
+        results_broadcaster.notify(ballot_id)
+
+
+class VoteQueue(VoteQueueInterface):
+    """
+    In-process write-behind queue of voters.
+
+    A flusher thread writes queued voters in one batch every flush_interval
+    seconds or as soon as max_batch voters are waiting, so the number of
+    commits no longer follows the number of requests. Once max_pending
+    voters are waiting, submit raises VoteQueueFull instead of growing.
+
+    If a batch fails, its voters are retried one at a time so a single bad
+    voter only fails its own future.
+    """
+
+    def __init__(
+            self,
+            flush: Callable[[List[dict]], None] = write_voters,
+            max_batch: int = 500,
+            flush_interval: float = 0.05,
+            max_pending: int = 10000
+    ):
+        """
+        Args:
+            flush: Writes a batch of voters, raising if it could not
+            max_batch: Most voters written per batch
+            flush_interval: Longest wait in seconds before a partial batch is written
+            max_pending: Most voters waiting before submit raises VoteQueueFull
+        """
+        self._flush = flush
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._closed = False
+        # Held over the closed check and the put in submit, and over setting
+        # closed and queueing _CLOSE in close, so no voter lands after _CLOSE
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name='vote-queue-flusher', daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, voter: dict) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise VoteQueueFull("Vote queue is closed")
+            try:
+                self._queue.put_nowait((voter, future))
+            except queue.Full:
+                raise VoteQueueFull("Vote queue is full") from None
+        return future
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_CLOSE)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            batch, closing = self._next_batch()
+            if batch:
+                self._write(batch)
+            if closing:
+                return
+
+    def _next_batch(self) -> Tuple[List[Tuple[dict, Future]], bool]:
+        item = self._queue.get()
+        if item is _CLOSE:
+            return [], True
+
+        batch = [item]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                item = (
+                    self._queue.get(timeout=remaining) if remaining > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if item is _CLOSE:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _write(self, batch: List[Tuple[dict, Future]]) -> None:
+        try:
+            self._flush([voter for voter, _ in batch])
+        except Exception:
+            logger.exception("Vote batch of %s failed, retrying one by one", len(batch))
+            for voter, future in batch:
+                try:
+                    self._flush([voter])
+                except Exception as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(True)
+            return
+
+        for _, future in batch:
+            future.set_result(True)
+
+
+_vote_queue: Optional[VoteQueue] = None
+_vote_queue_lock = threading.Lock()
+
+
+def get_vote_queue() -> VoteQueue:
+    """
+    The process-wide vote queue, started on first use from the VOTE_QUEUE_*
+    settings and drained when the process exits.
+    """
+    global _vote_queue
+    with _vote_queue_lock:
+        if _vote_queue is None:
+            _vote_queue = VoteQueue(
+                max_batch=settings.VOTE_QUEUE_MAX_BATCH,
+                flush_interval=settings.VOTE_QUEUE_FLUSH_MS / 1000,
+                max_pending=settings.VOTE_QUEUE_MAX_PENDING
+            )
+            atexit.register(_vote_queue.close)
+        return _vote_queue
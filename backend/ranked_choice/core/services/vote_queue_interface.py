@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+
+
+class VoteQueueFull(Exception):
+    """
+    Raised when a vote queue is at capacity and cannot accept another voter.
+    """
+    pass
+
+
+class VoteQueueInterface(ABC):
+    """
+    Abstract base class for a write-behind queue of voters.
+    Voters are accepted immediately and written in batches later.
+    """
+
+    @abstractmethod
+    def submit(self, voter: dict) -> Future:
+        """
+        Queue a voter to be written.
+
+        Args:
+            voter: The voter, with a name, ballot_id and votes
+
+        Returns:
+            Future resolved with True once the voter is committed, or with
+            the exception that prevented it
+
+        Raises:
+            VoteQueueFull: If the queue is at capacity
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Stop accepting voters and write every voter already queued.
+        """
+        pass
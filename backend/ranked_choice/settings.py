@@ -38,6 +38,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'ranked_choice.api.middleware.ServerTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -93,6 +94,93 @@ else:
         }
     }
 
+# Caches
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'results': {
+        'BACKEND': os.getenv(
+            'RESULTS_CACHE_BACKEND',
+            'django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': os.getenv('RESULTS_CACHE_LOCATION', 'ballot-results'),
+    },
+}
+
+# Computed ballot results are keyed by votes version, so they only expire
+# to free space
+RESULTS_CACHE_ALIAS = 'results'
+RESULTS_CACHE_TIMEOUT = int(os.getenv('RESULTS_CACHE_TIMEOUT', '86400'))
+
+# Largest number of voters accepted by one bulk vote request
+BULK_VOTE_MAX_VOTERS = int(os.getenv('BULK_VOTE_MAX_VOTERS', '10000'))
+
+# Largest number of ballots accepted by one bulk ballot request
+BULK_BALLOT_MAX_BALLOTS = int(os.getenv('BULK_BALLOT_MAX_BALLOTS', '1000'))
+
+# Ballot list page size, and the most a client may ask for
+BALLOT_LIST_PAGE_SIZE = int(os.getenv('BALLOT_LIST_PAGE_SIZE', '50'))
+BALLOT_LIST_MAX_PAGE_SIZE = int(os.getenv('BALLOT_LIST_MAX_PAGE_SIZE', '200'))
+
+# Seconds browsers and CDNs may serve a ballot definition without revalidating;
+# ballots do not change once created. Lists and results always revalidate.
+BALLOT_CACHE_MAX_AGE_SECONDS = int(os.getenv('BALLOT_CACHE_MAX_AGE_SECONDS', '300'))
+
+# Ballots served from process memory by the ballot views: how many are kept,
+# and for how many seconds before they are read again
+BALLOT_MEMORY_CACHE_SIZE = int(os.getenv('BALLOT_MEMORY_CACHE_SIZE', '1024'))
+BALLOT_MEMORY_CACHE_TTL_SECONDS = float(
+    os.getenv('BALLOT_MEMORY_CACHE_TTL_SECONDS', '60')
+)
+
+# Results streams check each watched ballot's votes version this often, and
+# wait this long after a vote in this process before tabulating
+RESULTS_STREAM_POLL_SECONDS = float(os.getenv('RESULTS_STREAM_POLL_SECONDS', '2'))
+RESULTS_STREAM_DEBOUNCE_SECONDS = float(
+    os.getenv('RESULTS_STREAM_DEBOUNCE_SECONDS', '0.25')
+)
+RESULTS_STREAM_KEEPALIVE_SECONDS = float(
+    os.getenv('RESULTS_STREAM_KEEPALIVE_SECONDS', '15')
+)
+
+# Write-behind voting: single votes are queued and committed in batches of up
+# to VOTE_QUEUE_MAX_BATCH every VOTE_QUEUE_FLUSH_MS. With durable acks the
+# request waits for its batch to commit, otherwise it is answered 202 at once.
+# Votes beyond VOTE_QUEUE_MAX_PENDING are turned away with a 503.
+VOTE_QUEUE_ENABLED = os.getenv('VOTE_QUEUE_ENABLED', 'False') == 'True'
+VOTE_QUEUE_MAX_BATCH = int(os.getenv('VOTE_QUEUE_MAX_BATCH', '500'))
+VOTE_QUEUE_FLUSH_MS = int(os.getenv('VOTE_QUEUE_FLUSH_MS', '50'))
+VOTE_QUEUE_MAX_PENDING = int(os.getenv('VOTE_QUEUE_MAX_PENDING', '10000'))
+VOTE_QUEUE_DURABLE_ACK = os.getenv('VOTE_QUEUE_DURABLE_ACK', 'True') == 'True'
+VOTE_QUEUE_ACK_TIMEOUT_SECONDS = float(
+    os.getenv('VOTE_QUEUE_ACK_TIMEOUT_SECONDS', '5')
+)
+
+# Time the stages of every workflow into the registry served at /api/metrics/
+# to staff users and the addresses in METRICS_ALLOWED_IPS, and, by default
+# only under DEBUG, report each request's stages in a Server-Timing header
+INSTRUMENTATION_ENABLED = os.getenv('INSTRUMENTATION_ENABLED', 'True') == 'True'
+SERVER_TIMING_ENABLED = os.getenv('SERVER_TIMING_ENABLED', str(DEBUG)) == 'True'
+METRICS_ALLOWED_IPS = os.getenv('METRICS_ALLOWED_IPS', '127.0.0.1,::1').split(',')
+
+# Hold each workflow call to its declared query budget. Going over raises
+# under QUERY_BUDGET_STRICT, the default under tests, and is logged otherwise.
+# With QUERY_SHAPE_CHECK_ENABLED a statement run more than
+# QUERY_SHAPE_REPEAT_LIMIT times in one call is logged as a likely N+1
+QUERY_BUDGET_ENABLED = os.getenv('QUERY_BUDGET_ENABLED', 'True') == 'True'
+QUERY_BUDGET_STRICT = os.getenv('QUERY_BUDGET_STRICT', str(TESTING)) == 'True'
+QUERY_SHAPE_CHECK_ENABLED = os.getenv(
+    'QUERY_SHAPE_CHECK_ENABLED', str(DEBUG or TESTING)
+) == 'True'
+QUERY_SHAPE_REPEAT_LIMIT = int(os.getenv('QUERY_SHAPE_REPEAT_LIMIT', '3'))
+
+# Encode ballots and results straight from the domain items with orjson,
+# skipping the DRF serializers; needs the orjson package
+FAST_JSON_RENDERER_ENABLED = os.getenv('FAST_JSON_RENDERER_ENABLED', 'False') == 'True'
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -135,9 +223,15 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # CORS settings
 CORS_ALLOWED_ORIGINS = os.getenv('CORS_ALLOWED_ORIGINS', 'http://localhost:3000,http://127.0.0.1:3000').split(',')
 CORS_ALLOW_CREDENTIALS = True
+# Lets cross-origin clients follow the ballot list's pages
+CORS_EXPOSE_HEADERS = ['X-Next-Cursor']
 
 # REST Framework settings
 REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'ranked_choice.api.renderers.OrjsonRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
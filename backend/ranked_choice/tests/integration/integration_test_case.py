@@ -1,8 +1,13 @@
 import os
 
+from django.core.cache import caches
 from django.db import connections
 from django.test import TestCase
 
+from ranked_choice.core.repositories.cached_ballot_repository import (
+    cached_ballot_repository,
+)
+
 # Configure database settings at module level before any tests run
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ranked_choice.settings')
 
@@ -35,6 +40,12 @@ class IntegrationTestCase(TestCase):
                       or db_name == ':memory:' or 'sqlite' in db_engine)
         if not is_test_db:
             self.fail(f"Not using a test database! Current database: {db_name}")
+
+        # Test database ids are reused after rollback, so cached entries keyed
+        # by them must not leak between tests
+        for cache in caches.all():
+            cache.clear()
+        cached_ballot_repository.clear()
         super().setUp()
 
     @classmethod
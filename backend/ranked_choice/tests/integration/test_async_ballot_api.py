@@ -0,0 +1,144 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from django.test import AsyncClient
+from django.urls import reverse
+
+from ranked_choice.core.repositories.ballot_repository import BallotRepository
+from ranked_choice.tests.integration.integration_test_case import IntegrationTestCase
+
+os.environ['ALLOWED_HOSTS'] = 'localhost,127.0.0.1,testserver'
+
+
+class AsyncBallotAPITests(IntegrationTestCase):
+    """
+    Tests for the async-native ballot, vote and results endpoints.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.client = AsyncClient()
+        self.repository = BallotRepository()
+        self.slug = self.repository.create_ballot(
+            title='Test Ballot',
+            description='This is a test ballot',
+            choices=[
+                {'name': 'Option 1', 'description': 'Description 1'},
+                {'name': 'Option 2', 'description': 'Description 2'},
+            ]
+        )
+        self.ballot_item = self.repository.get_ballot_by_slug(self.slug)
+
+    async def _vote(self, choice_index, name='Voter'):
+        return await self.client.post(
+            reverse('api:async_create_vote'),
+            {
+                'name': name,
+                'ballot_id': self.ballot_item.id,
+                'votes': [
+                    {'rank': 1, 'choice_id': self.ballot_item.choices[choice_index].id}
+                ],
+            },
+            content_type='application/json'
+        )
+
+    async def test_get_ballot(self):
+        response = await self.client.get(
+            reverse('api:async_get_ballot', kwargs={'slug': self.slug})
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            'id': self.ballot_item.id,
+            'title': 'Test Ballot',
+            'slug': self.slug,
+            'description': 'This is a test ballot',
+            'choices': [
+                {
+                    'id': choice.id,
+                    'name': choice.name,
+                    'description': choice.description,
+                }
+                for choice in self.ballot_item.choices
+            ],
+        })
+
+    async def test_get_ballot_not_found(self):
+        response = await self.client.get(
+            reverse('api:async_get_ballot', kwargs={'slug': 'nonexistent-ballot'})
+        )
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {'error': 'Ballot not found'})
+
+    async def test_create_vote_then_get_votes(self):
+        for index, choice_index in enumerate((1, 0, 1)):
+            response = await self._vote(choice_index, name=f'Voter {index}')
+            self.assertEqual(response.status_code, 201)
+            self.assertEqual(response.json(), {'status': 'success'})
+
+        response = await self.client.get(
+            reverse('api:async_get_votes', kwargs={'slug': self.slug})
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            'winner_id': self.ballot_item.choices[1].id,
+            'winner_name': 'Option 2',
+            'title': 'Test Ballot',
+            'rounds': [
+                {'name': 'Option 2', 'votes': 2, 'round_index': 0},
+                {'name': 'Option 1', 'votes': 1, 'round_index': 0},
+            ],
+        })
+        sync_response = await self.client.get(
+            reverse('api:get_votes', kwargs={'slug': self.slug})
+        )
+        self.assertEqual(sync_response.json(), response.json())
+
+        matrix_response = await self.client.get(
+            reverse('api:async_get_votes', kwargs={'slug': self.slug}),
+            {'shape': 'matrix'}
+        )
+        self.assertEqual(matrix_response.json()['rounds'], [[2, 1]])
+
+    async def test_get_votes_hides_error_details(self):
+        with patch(
+            'ranked_choice.api.async_views.aget_votes_workflow',
+            side_effect=RuntimeError('password authentication failed')
+        ):
+            response = await self.client.get(
+                reverse('api:async_get_votes', kwargs={'slug': self.slug})
+            )
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.json(), {'error': 'Internal server error'})
+
+    async def test_create_vote_with_invalid_data(self):
+        response = await self.client.post(
+            reverse('api:async_create_vote'),
+            {'name': 'Voter', 'ballot_id': self.ballot_item.id, 'votes': []},
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('votes', response.json())
+
+        response = await self.client.post(
+            reverse('api:async_create_vote'),
+            'not json',
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': 'Invalid JSON body'})
+
+    async def test_wrong_method(self):
+        response = await self.client.get(reverse('api:async_create_vote'))
+
+        self.assertEqual(response.status_code, 405)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,21 @@
-from ranked_choice.core.repositories.ballot_repository import BallotRepository
+import unittest
+
+from asgiref.sync import sync_to_async
+from django.db import connection
+
+from ranked_choice.core.domain.items.ballot_cursor_item import BallotCursorItem
+from ranked_choice.core.domain.items.packed_voters_item import PackedVotersItem
+from ranked_choice.core.domain.workflows.get_votes_workflow import (
+    calculate_ranked_choice_winner,
+)
+from ranked_choice.core.models import Ballot, Choice
+from ranked_choice.core.repositories.ballot_repository import (
+    BallotRepository,
+    ballot_vote_rows,
+)
+from ranked_choice.core.repositories.ballot_repository_interface import (
+    BallotRepositoryInterface,
+)
 from ranked_choice.tests.integration.integration_test_case import IntegrationTestCase
 
 
@@ -113,6 +130,90 @@ class TestBallotRepository(IntegrationTestCase):
         self.assertEqual(ballot1.choices[0].name, "Option 1")
         self.assertEqual(ballot2.choices[0].name, "Option 2")
 
+    def test_list_ballots_uses_two_queries(self):
+        """
+        Test listing ballots prefetches choices instead of querying per ballot.
+        """
+        for index in range(5):
+            self.repository.create_ballot(
+                title=f"Test Ballot {index}",
+                choices=[{"name": "Option 1"}, {"name": "Option 2"}]
+            )
+
+        with self.assertNumQueries(2):
+            ballots = self.repository.list_ballots()
+
+        self.assertEqual(len(ballots), 5)
+        self.assertTrue(all(len(ballot.choices) == 2 for ballot in ballots))
+
+    def test_list_ballots_pages_with_cursor(self):
+        """
+        Test walking every ballot page by page with a keyset cursor.
+        """
+        slugs = [
+            self.repository.create_ballot(
+                title=f"Test Ballot {index}", choices=[{"name": "Option 1"}]
+            )
+            for index in range(5)
+        ]
+
+        seen = []
+        cursor = None
+        while True:
+            page = self.repository.list_ballots(cursor=cursor, limit=2)
+            seen.extend(ballot.slug for ballot in page)
+            if len(page) < 2:
+                break
+            cursor = BallotCursorItem.from_ballot(page[-1])
+
+        self.assertEqual(seen, slugs)
+
+    def test_list_ballots_pages_ballots_created_at_the_same_time(self):
+        """
+        Test that the cursor breaks ties on created_at by id.
+        """
+        slugs = [
+            self.repository.create_ballot(
+                title=f"Test Ballot {index}", choices=[{"name": "Option 1"}]
+            )
+            for index in range(4)
+        ]
+        Ballot.objects.update(created_at=Ballot.objects.first().created_at)
+
+        seen = []
+        cursor = None
+        while page := self.repository.list_ballots(cursor=cursor, limit=1):
+            seen.append(page[0].slug)
+            cursor = BallotCursorItem.from_ballot(page[0])
+
+        self.assertEqual(seen, slugs)
+
+    def test_ballot_versions_match_ballots(self):
+        """
+        Test reading ballot versions without loading choices.
+        """
+        slugs = [
+            self.repository.create_ballot(
+                title=f"Test Ballot {index}", choices=[{"name": "Option 1"}]
+            )
+            for index in range(3)
+        ]
+        ballots = self.repository.list_ballots()
+
+        with self.assertNumQueries(1):
+            version = self.repository.get_ballot_version(slugs[0])
+        with self.assertNumQueries(1):
+            page = self.repository.list_ballot_versions(
+                cursor=BallotCursorItem.from_ballot(ballots[0]), limit=5
+            )
+
+        self.assertEqual(
+            (version.id, version.votes_version, version.updated_at),
+            (ballots[0].id, ballots[0].votes_version, ballots[0].updated_at)
+        )
+        self.assertEqual([item.id for item in page], [b.id for b in ballots[1:]])
+        self.assertIsNone(self.repository.get_ballot_version("missing-ballot"))
+
     def test_create_ballot_with_choices(self):
         """
         Test creating a ballot with choices.
@@ -149,6 +250,45 @@ class TestBallotRepository(IntegrationTestCase):
         self.assertEqual(option1.description, "Description 1")
         self.assertEqual(option2.description, "Description 2")
 
+    def test_create_ballots_in_bulk(self):
+        """
+        Test creating many ballots writes ballots and choices in one insert each.
+        """
+        ballots = [
+            {
+                "title": f"Naming Contest {index}",
+                "choices": [{"name": f"Name {n}"} for n in range(50)],
+            }
+            for index in range(3)
+        ]
+
+        with self.assertNumQueries(4):
+            created = self.repository.create_ballots(ballots)
+
+        self.assertEqual([b.title for b in created], [b["title"] for b in ballots])
+        for ballot in created:
+            stored = self.repository.get_ballot_by_slug(ballot.slug)
+            self.assertEqual(stored.choices, ballot.choices)
+            self.assertEqual(
+                [choice.name for choice in stored.choices],
+                [f"Name {n}" for n in range(50)]
+            )
+
+    def test_create_ballots_is_atomic(self):
+        """
+        Test a failing ballot leaves none of the batch behind.
+        """
+        ballots = [
+            {"title": "Complete Ballot", "choices": [{"name": "Option 1"}]},
+            {"title": "Broken Ballot", "choices": [{"description": "No name"}]},
+        ]
+
+        with self.assertRaises(KeyError):
+            self.repository.create_ballots(ballots)
+
+        self.assertFalse(Ballot.objects.exists())
+        self.assertFalse(Choice.objects.exists())
+
     def test_create_voter_with_votes(self):
         choices = [
             {"name": "Option 1", "description": "Description 1"},
@@ -178,4 +318,225 @@ class TestBallotRepository(IntegrationTestCase):
         self.assertEqual(vote_items[0].votes[0].rank, 0)
         self.assertEqual(vote_items[0].votes[0].choice_id, ballot_item.choices[0].id)
         self.assertEqual(vote_items[0].votes[1].rank, 1)
-        self.assertEqual(vote_items[0].votes[1].choice_id, ballot_item.choices[1].id)
\ No newline at end of file
+        self.assertEqual(vote_items[0].votes[1].choice_id, ballot_item.choices[1].id)
+
+    def test_create_voter_bumps_votes_version(self):
+        ballot_item = self._create_ballot_with_voters([])
+        self.assertEqual(ballot_item.votes_version, 0)
+
+        self.repository.create_voter(
+            name="voter",
+            ballot_id=ballot_item.id,
+            votes=[{"rank": 1, "choice_id": ballot_item.choices[0].id}]
+        )
+
+        ballot_item = self.repository.get_ballot_by_slug(ballot_item.slug)
+        self.assertEqual(ballot_item.votes_version, 1)
+
+    def test_create_voters_in_bulk(self):
+        ballot_item = self._create_ballot_with_voters([])
+        first, second, _ = ballot_item.choices
+        voters = [
+            {
+                "name": f"voter {index}",
+                "ballot_id": ballot_item.id,
+                "votes": [
+                    {"rank": 1, "choice_id": first.id},
+                    {"rank": 2, "choice_id": second.id},
+                ],
+            }
+            for index in range(50)
+        ]
+
+        # Two INSERTs, one tally upsert and one version bump, inside a savepoint
+        with self.assertNumQueries(6):
+            created = self.repository.create_voters(voters)
+
+        self.assertEqual(created, 50)
+        voter_items = self.repository.get_votes_by_ballot_id(ballot_item.id)
+        self.assertEqual(len(voter_items), 50)
+        self.assertEqual(
+            [(v.rank, v.choice_id) for v in voter_items[-1].votes],
+            [(1, first.id), (2, second.id)]
+        )
+        ballot_item = self.repository.get_ballot_by_slug(ballot_item.slug)
+        self.assertEqual(ballot_item.votes_version, 1)
+
+    @unittest.skipUnless(
+        connection.vendor == 'sqlite', 'EXPLAIN output is vendor specific'
+    )
+    def test_vote_rows_query_plan_uses_read_path_indexes(self):
+        plan = ballot_vote_rows(ballot_id=1).explain()
+
+        self.assertIn('voters_ballot_id_idx', plan)
+        self.assertIn('votes_voter_rank_idx', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+
+    def _create_ballot_with_voters(self, rankings):
+        slug = self.repository.create_ballot(
+            title="Test Ballot",
+            choices=[
+                {"name": "Option 1", "description": "Description 1"},
+                {"name": "Option 2", "description": "Description 2"},
+                {"name": "Option 3", "description": "Description 3"},
+            ]
+        )
+        ballot_item = self.repository.get_ballot_by_slug(slug)
+        for index, ranking in enumerate(rankings):
+            self.repository.create_voter(
+                name=f"voter {index}",
+                ballot_id=ballot_item.id,
+                votes=[
+                    {"rank": rank, "choice_id": ballot_item.choices[choice].id}
+                    for rank, choice in ranking
+                ]
+            )
+        return ballot_item
+
+    def test_get_votes_by_ballot_id_uses_a_single_query(self):
+        ballot_item = self._create_ballot_with_voters([
+            [(2, 1), (1, 0)],
+            [(1, 2), (2, 0), (3, 1)],
+            [],
+            [(1, 1)],
+        ])
+
+        with self.assertNumQueries(1):
+            voter_items = self.repository.get_votes_by_ballot_id(
+                ballot_id=ballot_item.id
+            )
+
+        choice_ids = [choice.id for choice in ballot_item.choices]
+        self.assertEqual(
+            [voter.name for voter in voter_items],
+            ["voter 0", "voter 1", "voter 2", "voter 3"]
+        )
+        self.assertEqual(
+            [[(v.rank, v.choice_id) for v in voter.votes] for voter in voter_items],
+            [
+                [(1, choice_ids[0]), (2, choice_ids[1])],
+                [(1, choice_ids[2]), (2, choice_ids[0]), (3, choice_ids[1])],
+                [],
+                [(1, choice_ids[1])],
+            ]
+        )
+
+    def test_get_votes_by_ballot_id_packs_the_streamed_voters(self):
+        ballot_item = self._create_ballot_with_voters([
+            [(2, 1), (1, 0)],
+            [],
+            [(1, 2)],
+        ])
+
+        voter_items = self.repository.get_votes_by_ballot_id(ballot_id=ballot_item.id)
+
+        self.assertIsInstance(voter_items, PackedVotersItem)
+        self.assertEqual(voter_items.ballot_id, ballot_item.id)
+        self.assertEqual(list(voter_items.lengths()), [2, 0, 1])
+        self.assertEqual(
+            list(voter_items),
+            list(self.repository.iter_votes_by_ballot_id(ballot_id=ballot_item.id))
+        )
+
+    def test_iter_rankings_by_ballot_id_matches_the_interface_default(self):
+        ballot_item = self._create_ballot_with_voters([
+            [(2, 1), (1, 0)],
+            [],
+            [(1, 2), (3, 0), (2, 1)],
+        ])
+        choice_ids = [choice.id for choice in ballot_item.choices]
+
+        rankings = list(self.repository.iter_rankings_by_ballot_id(
+            ballot_id=ballot_item.id, chunk_size=2
+        ))
+
+        self.assertEqual(rankings, [
+            (choice_ids[0], choice_ids[1]),
+            (),
+            (choice_ids[2], choice_ids[1], choice_ids[0]),
+        ])
+        self.assertEqual(
+            rankings,
+            list(BallotRepositoryInterface.iter_rankings_by_ballot_id(
+                self.repository, ballot_id=ballot_item.id
+            ))
+        )
+
+    def test_iter_rankings_by_ballot_id_shuffles_by_seed(self):
+        ballot_item = self._create_ballot_with_voters(
+            [[(1, index % 3)] for index in range(12)] + [[]]
+        )
+        in_cast_order = list(self.repository.iter_rankings_by_ballot_id(
+            ballot_id=ballot_item.id
+        ))
+
+        shuffled = list(self.repository.iter_rankings_by_ballot_id(
+            ballot_id=ballot_item.id, chunk_size=5, shuffle_seed=7
+        ))
+
+        self.assertCountEqual(shuffled, in_cast_order)
+        self.assertNotEqual(shuffled, in_cast_order)
+        self.assertEqual(
+            shuffled,
+            list(self.repository.iter_rankings_by_ballot_id(
+                ballot_id=ballot_item.id, shuffle_seed=7
+            ))
+        )
+
+    async def test_async_reads_match_sync_reads(self):
+        ballot_item = await sync_to_async(self._create_ballot_with_voters)([
+            [(2, 1), (1, 0)],
+            [],
+            [(1, 2), (2, 0)],
+        ])
+
+        self.assertEqual(
+            await self.repository.aget_ballot_by_slug(ballot_item.slug),
+            await sync_to_async(self.repository.get_ballot_by_slug)(ballot_item.slug)
+        )
+        self.assertEqual(
+            await self.repository.aget_votes_by_ballot_id(ballot_item.id),
+            await sync_to_async(self.repository.get_votes_by_ballot_id)(
+                ballot_item.id
+            )
+        )
+        self.assertIsNone(
+            await self.repository.aget_ballot_by_slug("nonexistent-ballot")
+        )
+
+    async def test_acreate_voter(self):
+        ballot_item = await sync_to_async(self._create_ballot_with_voters)([])
+
+        await self.repository.acreate_voter(
+            name="voter",
+            ballot_id=ballot_item.id,
+            votes=[{"rank": 1, "choice_id": ballot_item.choices[2].id}]
+        )
+
+        voter_items = await self.repository.aget_votes_by_ballot_id(ballot_item.id)
+        self.assertEqual(len(voter_items), 1)
+        self.assertEqual(voter_items[0].votes[0].choice_id, ballot_item.choices[2].id)
+        ballot_item = await self.repository.aget_ballot_by_slug(ballot_item.slug)
+        self.assertEqual(ballot_item.votes_version, 1)
+
+    def test_iter_votes_by_ballot_id_feeds_tabulation(self):
+        ballot_item = self._create_ballot_with_voters([
+            [(1, 0), (2, 1)],
+            [(1, 1), (2, 0)],
+            [(1, 2), (2, 0)],
+        ])
+        choice_name_map = {choice.id: choice.name for choice in ballot_item.choices}
+
+        streamed = calculate_ranked_choice_winner(
+            self.repository.iter_votes_by_ballot_id(
+                ballot_id=ballot_item.id, chunk_size=2
+            ),
+            choice_name_map
+        )
+        loaded = calculate_ranked_choice_winner(
+            self.repository.get_votes_by_ballot_id(ballot_id=ballot_item.id),
+            choice_name_map
+        )
+
+        self.assertEqual(streamed, loaded)
+        self.assertEqual(streamed.winner_name, "Option 2")
@@ -1,6 +1,7 @@
 import os
 import unittest
 
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -138,5 +139,59 @@ class CreateBallotAPITests(IntegrationTestCase):
         self.assertEqual(option2.description, 'Description 2')
 
 
+
+class CreateBallotsAPITests(IntegrationTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.create_ballots_url = reverse('api:create_ballots')
+
+    def test_create_ballots_returns_choice_ids(self):
+        data = [
+            {
+                'title': f'Ballot {index}',
+                'choices': [{'name': 'Option 1'}, {'name': 'Option 2'}],
+            }
+            for index in range(3)
+        ]
+
+        response = self.client.post(self.create_ballots_url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [ballot['title'] for ballot in response.data],
+            ['Ballot 0', 'Ballot 1', 'Ballot 2']
+        )
+        for ballot in response.data:
+            stored = Choice.objects.filter(ballot__slug=ballot['slug'])
+            self.assertEqual(
+                [choice['id'] for choice in ballot['choices']],
+                sorted(stored.values_list('id', flat=True))
+            )
+
+    def test_create_ballots_with_an_invalid_ballot(self):
+        data = [
+            {'title': 'Ballot 1', 'choices': [{'name': 'Option 1'}]},
+            {'title': 'Ballot 2', 'choices': []},
+        ]
+
+        response = self.client.post(self.create_ballots_url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Ballot.objects.exists())
+
+    @override_settings(BULK_BALLOT_MAX_BALLOTS=2)
+    def test_create_ballots_over_limit(self):
+        data = [
+            {'title': f'Ballot {index}', 'choices': [{'name': 'Option 1'}]}
+            for index in range(3)
+        ]
+
+        response = self.client.post(self.create_ballots_url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Ballot.objects.exists())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,12 +1,19 @@
 import os
 import unittest
+from unittest.mock import Mock, patch
 
+from django.test import override_settings
 from django.urls import reverse
 from faker import Faker
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from ranked_choice.core.repositories.ballot_repository import BallotRepository
+from ranked_choice.core.services.vote_queue import VoteQueue
+from ranked_choice.core.services.vote_queue_interface import (
+    VoteQueueFull,
+    VoteQueueInterface,
+)
 from ranked_choice.tests.integration.integration_test_case import IntegrationTestCase
 
 os.environ['ALLOWED_HOSTS'] = 'localhost,127.0.0.1,testserver'
@@ -50,5 +57,64 @@ class CreateVoteAPITests(IntegrationTestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
 
+@override_settings(VOTE_QUEUE_ENABLED=True)
+class CreateVoteQueuedAPITests(IntegrationTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.create_vote_url = reverse('api:create_vote')
+        self.fake = Faker()
+        self.flushed = []
+        # The flusher runs on its own thread, which cannot see this test's
+        # in-memory database, so batches are recorded instead of written
+        self.vote_queue = VoteQueue(
+            flush=self.flushed.extend, max_batch=10, flush_interval=0.01
+        )
+        self.addCleanup(self.vote_queue.close)
+        self.data = {
+            'name': self.fake.name(),
+            'ballot_id': self.fake.pyint(),
+            'votes': [{'rank': 1, 'choice_id': self.fake.pyint()}],
+        }
+
+    def post(self, vote_queue):
+        with patch('ranked_choice.api.views.get_vote_queue', return_value=vote_queue):
+            return self.client.post(self.create_vote_url, self.data, format='json')
+
+    def test_durable_ack_waits_for_commit(self):
+        response = self.post(self.vote_queue)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.flushed, [self.data])
+
+    @override_settings(VOTE_QUEUE_DURABLE_ACK=False)
+    def test_without_durable_ack_accepts_queued_vote(self):
+        response = self.post(self.vote_queue)
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data, {'status': 'queued'})
+
+    def test_full_queue_is_unavailable(self):
+        full_queue = Mock(spec=VoteQueueInterface)
+        full_queue.submit.side_effect = VoteQueueFull("Vote queue is full")
+
+        response = self.post(full_queue)
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response['Retry-After'], '1')
+
+    def test_failed_write_is_reported(self):
+        def flush(voters):
+            raise ValueError("Ballot not found")
+
+        failing_queue = VoteQueue(flush=flush, max_batch=10, flush_interval=0.01)
+        self.addCleanup(failing_queue.close)
+
+        response = self.post(failing_queue)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {'error': 'Ballot not found'})
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,81 @@
+import os
+import unittest
+
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from ranked_choice.core.repositories.ballot_repository import BallotRepository
+from ranked_choice.tests.integration.integration_test_case import IntegrationTestCase
+
+os.environ['ALLOWED_HOSTS'] = 'localhost,127.0.0.1,testserver'
+
+
+class CreateVotesAPITests(IntegrationTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.create_votes_url = reverse('api:create_votes')
+        self.repository = BallotRepository()
+        slug = self.repository.create_ballot(
+            title='Test Ballot',
+            choices=[
+                {'name': 'Option 1', 'description': 'Description 1'},
+                {'name': 'Option 2', 'description': 'Description 2'},
+            ]
+        )
+        self.ballot_item = self.repository.get_ballot_by_slug(slug)
+
+    def _voters(self, count):
+        first, second = self.ballot_item.choices
+        return [
+            {
+                'name': f'voter {index}',
+                'ballot_id': self.ballot_item.id,
+                'votes': [
+                    {'rank': 1, 'choice_id': first.id},
+                    {'rank': 2, 'choice_id': second.id},
+                ]
+            }
+            for index in range(count)
+        ]
+
+    def test_create_votes_with_valid_data(self):
+        response = self.client.post(
+            self.create_votes_url, self._voters(25), format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['created'], 25)
+        voter_items = self.repository.get_votes_by_ballot_id(self.ballot_item.id)
+        self.assertEqual(len(voter_items), 25)
+        self.assertEqual(len(voter_items[0].votes), 2)
+
+    def test_create_votes_with_empty_list(self):
+        response = self.client.post(self.create_votes_url, [], format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_create_votes_with_invalid_voter(self):
+        voters = self._voters(2)
+        voters[1]['votes'] = []
+
+        response = self.client.post(self.create_votes_url, voters, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            self.repository.get_votes_by_ballot_id(self.ballot_item.id), []
+        )
+
+    @override_settings(BULK_VOTE_MAX_VOTERS=3)
+    def test_create_votes_over_limit(self):
+        response = self.client.post(
+            self.create_votes_url, self._voters(4), format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+if __name__ == "__main__":
+    unittest.main()
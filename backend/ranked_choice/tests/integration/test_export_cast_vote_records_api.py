@@ -0,0 +1,136 @@
+import json
+import os
+from unittest.mock import patch
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from ranked_choice.core.repositories.ballot_repository import BallotRepository
+from ranked_choice.tests.integration.integration_test_case import IntegrationTestCase
+
+os.environ['ALLOWED_HOSTS'] = 'localhost,127.0.0.1,testserver'
+
+
+class ExportCastVoteRecordsAPITests(IntegrationTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.repository = BallotRepository()
+        self.slug = self.repository.create_ballot(
+            title='Published Ballot',
+            choices=[{'name': 'Option 1'}, {'name': 'Option 2'}]
+        )
+        ballot = self.repository.get_ballot_by_slug(self.slug)
+        self.first, self.second = (choice.id for choice in ballot.choices)
+        self.repository.create_voters([
+            {
+                'name': 'Alice',
+                'ballot_id': ballot.id,
+                'votes': [
+                    {'rank': 2, 'choice_id': self.first},
+                    {'rank': 1, 'choice_id': self.second},
+                ],
+            },
+            {
+                'name': 'Bob',
+                'ballot_id': ballot.id,
+                'votes': [{'rank': 1, 'choice_id': self.first}],
+            },
+        ])
+        self.url = reverse('api:export_cast_vote_records', kwargs={'slug': self.slug})
+
+    def test_exports_ndjson_by_default(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        self.assertIn(f'{self.slug}-cvr.ndjson', response['Content-Disposition'])
+        content = b''.join(response.streaming_content).decode()
+        records = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual([record['record'] for record in records], [1, 2])
+        self.assertCountEqual(
+            [record['ranking'] for record in records],
+            [[self.second, self.first], [self.first]]
+        )
+        self.assertNotIn('Alice', content)
+
+    def test_exports_csv(self):
+        response = self.client.get(self.url, {'format': 'csv'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0], 'record,rank,choice_id')
+        rankings = {}
+        for line in lines[1:]:
+            record, rank, choice_id = line.split(',')
+            rankings.setdefault(record, []).append((int(rank), int(choice_id)))
+        self.assertEqual(sorted(rankings), ['1', '2'])
+        self.assertCountEqual(
+            rankings.values(),
+            [[(1, self.second), (2, self.first)], [(1, self.first)]]
+        )
+
+    def test_records_are_not_in_cast_order(self):
+        ballot = self.repository.get_ballot_by_slug(self.slug)
+        self.repository.create_voters([
+            {
+                'name': f'Voter {index}',
+                'ballot_id': ballot.id,
+                'votes': [{'rank': 1, 'choice_id': choice_id}],
+            }
+            for index, choice_id in enumerate([self.second] * 20 + [self.first] * 20)
+        ])
+
+        first = b''.join(self.client.get(self.url).streaming_content)
+        again = b''.join(self.client.get(self.url).streaming_content)
+
+        rankings = [
+            json.loads(line)['ranking'] for line in first.decode().splitlines()
+        ]
+        cast_order = (
+            [[self.second, self.first], [self.first]]
+            + [[self.second]] * 20 + [[self.first]] * 20
+        )
+        self.assertCountEqual(rankings, cast_order)
+        self.assertNotEqual(rankings, cast_order)
+        self.assertEqual(again, first)
+
+    def test_streams_records_in_chunks(self):
+        with patch('ranked_choice.api.cvr_export.CVR_CHUNK_RECORDS', 1):
+            response = self.client.get(self.url)
+
+            self.assertEqual(len(list(response.streaming_content)), 2)
+
+    def test_new_votes_change_the_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        self.assertEqual(
+            self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code,
+            status.HTTP_304_NOT_MODIFIED
+        )
+
+        ballot = self.repository.get_ballot_by_slug(self.slug)
+        self.repository.create_voter(
+            name='Carol',
+            ballot_id=ballot.id,
+            votes=[{'rank': 1, 'choice_id': self.second}]
+        )
+
+        self.assertEqual(
+            self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code,
+            status.HTTP_200_OK
+        )
+
+    def test_unknown_format(self):
+        response = self.client.get(self.url, {'format': 'xml'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_unknown_ballot(self):
+        url = reverse(
+            'api:export_cast_vote_records', kwargs={'slug': 'nonexistent-ballot'}
+        )
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,113 @@
+import csv
+import io
+import os
+from unittest.mock import patch
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from ranked_choice.core.repositories.ballot_repository import BallotRepository
+from ranked_choice.tests.integration.integration_test_case import IntegrationTestCase
+
+os.environ['ALLOWED_HOSTS'] = 'localhost,127.0.0.1,testserver'
+
+
+class ExportResultsAPITests(IntegrationTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.repository = BallotRepository()
+        self.slug = self.repository.create_ballot(
+            title='Audited Ballot',
+            choices=[{'name': 'Option 1'}, {'name': 'Option 2'}, {'name': 'Option 3'}]
+        )
+        ballot = self.repository.get_ballot_by_slug(self.slug)
+        self.choice_ids = [choice.id for choice in ballot.choices]
+        first, second, third = self.choice_ids
+        for index, ranking in enumerate([
+            (first,), (first,), (second,), (second,), (third, second)
+        ]):
+            self.repository.create_voter(
+                name=f'Voter {index}',
+                ballot_id=ballot.id,
+                votes=[
+                    {'rank': rank, 'choice_id': choice_id}
+                    for rank, choice_id in enumerate(ranking, start=1)
+                ]
+            )
+        self.url = reverse('api:export_results', kwargs={'slug': self.slug})
+
+    def test_exports_csv_by_default(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertIn(f'{self.slug}-results.csv', response['Content-Disposition'])
+        rows = list(csv.reader(io.StringIO(
+            b''.join(response.streaming_content).decode()
+        )))
+        first, second, third = map(str, self.choice_ids)
+        self.assertEqual(rows, [
+            ['round_index', 'choice_id', 'choice_name', 'votes', 'transfer'],
+            ['0', first, 'Option 1', '2', '0'],
+            ['0', second, 'Option 2', '2', '0'],
+            ['0', third, 'Option 3', '1', '0'],
+            ['1', first, 'Option 1', '2', '0'],
+            ['1', second, 'Option 2', '3', '1'],
+            ['1', third, 'Option 3', '0', '-1'],
+        ])
+
+    def test_matching_etag_is_not_modified(self):
+        response = self.client.get(self.url, {'format': 'csv'})
+
+        response = self.client.get(
+            self.url, {'format': 'csv'}, HTTP_IF_NONE_MATCH=response['ETag']
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_unknown_format(self):
+        response = self.client.get(self.url, {'format': 'xlsx'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_unknown_ballot(self):
+        url = reverse('api:export_results', kwargs={'slug': 'nonexistent-ballot'})
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_columnar_formats_need_pyarrow(self):
+        for export_format in ('arrow', 'parquet'):
+            # A None entry makes importing pyarrow raise ImportError
+            with patch.dict('sys.modules', {'pyarrow': None}):
+                response = self.client.get(self.url, {'format': export_format})
+
+            self.assertEqual(
+                response.status_code, status.HTTP_501_NOT_IMPLEMENTED
+            )
+
+    def test_columnar_formats_match_csv(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        expected = list(csv.DictReader(io.StringIO(
+            b''.join(self.client.get(self.url).streaming_content).decode()
+        )))
+        for export_format, read in (
+            ('arrow', lambda data: pa.ipc.open_stream(data).read_all()),
+            ('parquet', lambda data: pq.read_table(pa.BufferReader(data))),
+        ):
+            response = self.client.get(self.url, {'format': export_format})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            table = read(b''.join(response.streaming_content))
+            self.assertEqual(
+                [
+                    {name: str(value) for name, value in row.items()}
+                    for row in table.to_pylist()
+                ],
+                expected
+            )
@@ -0,0 +1,91 @@
+import unittest
+
+from django.core.cache import caches
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from ranked_choice.core.repositories.ballot_repository import BallotRepository
+from ranked_choice.core.repositories.cached_ballot_repository import (
+    cached_ballot_repository,
+)
+from ranked_choice.tests.integration.integration_test_case import IntegrationTestCase
+
+
+class FastJSONRendererTests(IntegrationTestCase):
+    """
+    The fetch views serve the same bytes with the fast renderer on or off.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.repository = BallotRepository()
+        self.slug = self.repository.create_ballot(
+            title='Caf\u00e9 "ballot"\u2028',
+            description='Line one\nline two',
+            choices=[
+                {'name': 'Option \U0001F34E', 'description': None},
+                {'name': 'Option\tB', 'description': 'Tab\tseparated'},
+                {'name': 'Option C', 'description': ''},
+            ]
+        )
+        ballot_item = self.repository.get_ballot_by_slug(self.slug)
+        choice_ids = [choice.id for choice in ballot_item.choices]
+        for index, order in enumerate([(0, 1), (1, 2), (2, 0), (0,), (1, 0)]):
+            self.repository.create_voter(
+                name=f'Voter {index}',
+                ballot_id=ballot_item.id,
+                votes=[
+                    {'rank': rank, 'choice_id': choice_ids[position]}
+                    for rank, position in enumerate(order, start=1)
+                ]
+            )
+
+    def get_both_ways(self, url, data=None, **extra):
+        responses = []
+        for enabled in (False, True):
+            for cache in caches.all():
+                cache.clear()
+            cached_ballot_repository.clear()
+            with override_settings(FAST_JSON_RENDERER_ENABLED=enabled):
+                responses.append(self.client.get(url, data, **extra))
+        return responses
+
+    def assertSameResponses(self, url, data=None, **extra):
+        slow, fast = self.get_both_ways(url, data, **extra)
+
+        self.assertEqual(slow.status_code, status.HTTP_200_OK)
+        self.assertEqual(fast.status_code, status.HTTP_200_OK)
+        self.assertEqual(fast['Content-Type'], slow['Content-Type'])
+        self.assertEqual(fast.content, slow.content)
+
+    def test_get_votes_bytes_match(self):
+        self.assertSameResponses(reverse('api:get_votes', kwargs={'slug': self.slug}))
+
+    def test_get_votes_matrix_bytes_match(self):
+        self.assertSameResponses(
+            reverse('api:get_votes', kwargs={'slug': self.slug}), {'shape': 'matrix'}
+        )
+
+    def test_get_provisional_votes_bytes_match(self):
+        self.assertSameResponses(
+            reverse('api:get_provisional_votes', kwargs={'slug': self.slug})
+        )
+
+    def test_get_ballot_bytes_match(self):
+        self.assertSameResponses(reverse('api:get_ballot', kwargs={'slug': self.slug}))
+
+    def test_list_ballots_bytes_match(self):
+        self.assertSameResponses(reverse('api:list_ballots'))
+
+    def test_indented_response_bytes_match(self):
+        self.assertSameResponses(
+            reverse('api:get_votes', kwargs={'slug': self.slug}),
+            HTTP_ACCEPT='application/json; indent=2'
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
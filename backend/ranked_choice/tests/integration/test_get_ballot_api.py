@@ -1,12 +1,17 @@
 import os
 import unittest
+from datetime import timedelta
 
 from django.urls import reverse
+from django.utils.http import http_date
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from ranked_choice.core.models import Ballot, Choice
 from ranked_choice.core.repositories.ballot_repository import BallotRepository
+from ranked_choice.core.repositories.cached_ballot_repository import (
+    cached_ballot_repository,
+)
 from ranked_choice.tests.integration.integration_test_case import IntegrationTestCase
 
 os.environ['ALLOWED_HOSTS'] = 'localhost,127.0.0.1,testserver'
@@ -94,6 +99,64 @@ class GetBallotAPITests(IntegrationTestCase):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         self.assertIn('error', response.data)
 
+    def test_get_ballot_sets_validators_and_cache_control(self):
+        response = self.client.get(self.get_ballot_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('ETag', response)
+        self.assertEqual(
+            response['Last-Modified'],
+            http_date(self.test_ballot.updated_at.timestamp())
+        )
+        self.assertEqual(response['Cache-Control'], 'public, max-age=300')
+
+    def test_get_ballot_not_modified_from_memory(self):
+        etag = self.client.get(self.get_ballot_url)['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.get_ballot_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response['Cache-Control'], 'public, max-age=300')
+
+    def test_get_ballot_modified_since_update(self):
+        last_modified = self.client.get(self.get_ballot_url)['Last-Modified']
+
+        not_modified = self.client.get(
+            self.get_ballot_url, HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+        Ballot.objects.filter(id=self.test_ballot.id).update(
+            updated_at=self.test_ballot.updated_at + timedelta(minutes=1)
+        )
+        # update() sends no signal, so drop the cached copy as its TTL would
+        cached_ballot_repository.clear()
+        modified = self.client.get(
+            self.get_ballot_url, HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(modified.status_code, status.HTTP_200_OK)
+
+    def test_get_nonexistent_ballot_is_not_cached(self):
+        response = self.client.get(self.nonexistent_ballot_url)
+
+        self.assertNotIn('ETag', response)
+        self.assertNotIn('Cache-Control', response)
+
+    def test_get_ballot_served_from_memory_until_edited(self):
+        self.client.get(self.get_ballot_url)
+
+        # Validators and view all read the cached ballot
+        with self.assertNumQueries(0):
+            cached = self.client.get(self.get_ballot_url)
+        self.test_ballot.title = "Edited Ballot"
+        self.test_ballot.save()
+        edited = self.client.get(self.get_ballot_url)
+
+        self.assertEqual(cached.data['title'], "Test Ballot")
+        self.assertEqual(edited.data['title'], "Edited Ballot")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,78 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from ranked_choice.core.repositories.ballot_repository import BallotRepository
+from ranked_choice.tests.integration.integration_test_case import IntegrationTestCase
+
+os.environ['ALLOWED_HOSTS'] = 'localhost,127.0.0.1,testserver'
+
+
+class GetProvisionalVotesAPITests(IntegrationTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.repository = BallotRepository()
+
+    def test_get_provisional_votes_with_valid_slug(self):
+        slug = self.repository.create_ballot(
+            title='Test Ballot for Votes',
+            choices=[
+                {'name': 'Option 1', 'description': 'Description 1'},
+                {'name': 'Option 2', 'description': 'Description 2'},
+            ]
+        )
+        ballot_item = self.repository.get_ballot_by_slug(slug)
+        for choice in (0, 1, 1):
+            self.repository.create_voter(
+                name='Voter',
+                ballot_id=ballot_item.id,
+                votes=[{'rank': 1, 'choice_id': ballot_item.choices[choice].id}]
+            )
+
+        url = reverse('api:get_provisional_votes', kwargs={'slug': slug})
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['winner_name'], 'Option 2')
+        self.assertEqual(response.data['title'], 'Test Ballot for Votes')
+        self.assertEqual(
+            response.data,
+            self.client.get(reverse('api:get_votes', kwargs={'slug': slug})).data
+        )
+        self.assertEqual(
+            self.client.get(url, {'shape': 'matrix'}).json(),
+            self.client.get(
+                reverse('api:get_votes', kwargs={'slug': slug}), {'shape': 'matrix'}
+            ).json()
+        )
+
+    def test_get_provisional_votes_with_invalid_slug(self):
+        url = reverse(
+            'api:get_provisional_votes', kwargs={'slug': 'nonexistent-ballot'}
+        )
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['winner_name'], 'No ballot found')
+
+    def test_get_provisional_votes_hides_error_details(self):
+        url = reverse('api:get_provisional_votes', kwargs={'slug': 'some-ballot'})
+        with patch(
+            'ranked_choice.api.views.get_provisional_votes_workflow',
+            side_effect=RuntimeError('password authentication failed')
+        ):
+            response = self.client.get(url)
+
+        self.assertEqual(
+            response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+        self.assertEqual(response.data, {'error': 'Internal server error'})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,6 +13,7 @@ os.environ['ALLOWED_HOSTS'] = 'localhost,127.0.0.1,testserver'
 
 class GetVotesAPITests(IntegrationTestCase):
     def setUp(self):
+        super().setUp()
         self.client = APIClient()
         self.repository = BallotRepository()
         self.fake_ballot_slug = 'nonexistent-ballot'
@@ -61,6 +62,39 @@ class GetVotesAPITests(IntegrationTestCase):
 
         self.assertTrue(len(response.data['rounds']) > 0)
 
+    def test_get_votes_recomputes_only_after_new_votes(self):
+        slug = self.repository.create_ballot(
+            title='Test Ballot for Cached Votes',
+            choices=[
+                {'name': 'Option 1', 'description': 'Description 1'},
+                {'name': 'Option 2', 'description': 'Description 2'},
+            ]
+        )
+        ballot_item = self.repository.get_ballot_by_slug(slug)
+        self.repository.create_voter(
+            name='Voter 1',
+            ballot_id=ballot_item.id,
+            votes=[{'rank': 1, 'choice_id': ballot_item.choices[0].id}]
+        )
+        url = reverse('api:get_votes', kwargs={'slug': slug})
+
+        first = self.client.get(url)
+        with self.assertNumQueries(2):
+            cached = self.client.get(url)
+
+        self.assertEqual(cached.data, first.data)
+        self.assertEqual(first.data['winner_name'], 'Option 1')
+
+        for name in ('Voter 2', 'Voter 3'):
+            self.repository.create_voter(
+                name=name,
+                ballot_id=ballot_item.id,
+                votes=[{'rank': 1, 'choice_id': ballot_item.choices[1].id}]
+            )
+        recomputed = self.client.get(url)
+
+        self.assertEqual(recomputed.data['winner_name'], 'Option 2')
+
     def test_get_votes_with_invalid_slug(self):
         url = reverse('api:get_votes', kwargs={'slug': self.fake_ballot_slug})
         response = self.client.get(url)
@@ -71,6 +105,112 @@ class GetVotesAPITests(IntegrationTestCase):
         self.assertEqual(response.data['title'], '')
         self.assertEqual(response.data['rounds'], [])
 
+    def test_get_votes_not_modified_until_new_votes(self):
+        slug = self.repository.create_ballot(
+            title='Test Ballot for Votes ETag',
+            choices=[{'name': 'Option 1', 'description': 'Description 1'}]
+        )
+        ballot_item = self.repository.get_ballot_by_slug(slug)
+        url = reverse('api:get_votes', kwargs={'slug': slug})
+        vote = {'rank': 1, 'choice_id': ballot_item.choices[0].id}
+        self.repository.create_voter(
+            name='Voter 1', ballot_id=ballot_item.id, votes=[vote]
+        )
+
+        first = self.client.get(url)
+        with self.assertNumQueries(1):
+            not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.repository.create_voter(
+            name='Voter 2', ballot_id=ballot_item.id, votes=[vote]
+        )
+        modified = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+
+        self.assertEqual(first['Cache-Control'], 'public, no-cache')
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(modified.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(modified['ETag'], first['ETag'])
+
+    def create_three_way_ballot(self):
+        slug = self.repository.create_ballot(
+            title='Test Ballot for Matrix Votes',
+            choices=[
+                {'name': 'Option 1', 'description': 'Description 1'},
+                {'name': 'Option 2', 'description': 'Description 2'},
+                {'name': 'Option 3', 'description': 'Description 3'},
+            ]
+        )
+        ballot_item = self.repository.get_ballot_by_slug(slug)
+        first, second, third = (choice.id for choice in ballot_item.choices)
+        for index, ranking in enumerate([
+            (first, second), (first, third), (second, first),
+            (second, third), (third, second),
+        ]):
+            self.repository.create_voter(
+                name=f'Voter {index}',
+                ballot_id=ballot_item.id,
+                votes=[
+                    {'rank': rank, 'choice_id': choice_id}
+                    for rank, choice_id in enumerate(ranking, start=1)
+                ]
+            )
+        return slug, (first, second, third)
+
+    def test_get_votes_matrix_shape(self):
+        slug, (first, second, third) = self.create_three_way_ballot()
+        url = reverse('api:get_votes', kwargs={'slug': slug})
+
+        rounds = self.client.get(url)
+        matrix = self.client.get(url, {'shape': 'matrix'})
+
+        self.assertEqual(matrix.status_code, status.HTTP_200_OK)
+        self.assertEqual(matrix.json(), {
+            'winner_id': second,
+            'winner_name': 'Option 2',
+            'title': 'Test Ballot for Matrix Votes',
+            'choices': [
+                {'id': first, 'name': 'Option 1'},
+                {'id': second, 'name': 'Option 2'},
+                {'id': third, 'name': 'Option 3'},
+            ],
+            'rounds': [[2, 2, 1], [2, 3, 0]],
+            'transfers': [[0, 0, 0], [0, 1, -1]],
+            'eliminated': [[third], []],
+        })
+        self.assertEqual(
+            [
+                (item['round_index'], item['name'], item['votes'])
+                for item in rounds.json()['rounds']
+            ],
+            [
+                (0, 'Option 1', 2), (0, 'Option 2', 2), (0, 'Option 3', 1),
+                (1, 'Option 1', 2), (1, 'Option 2', 3),
+            ]
+        )
+        self.assertNotEqual(matrix['ETag'], rounds['ETag'])
+
+    def test_get_votes_matrix_shape_without_votes(self):
+        slug = self.repository.create_ballot(
+            title='Test Ballot without Votes',
+            choices=[{'name': 'Option 1', 'description': 'Description 1'}]
+        )
+        url = reverse('api:get_votes', kwargs={'slug': slug})
+
+        response = self.client.get(url, {'shape': 'matrix'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['choices'], [])
+        self.assertEqual(response.json()['rounds'], [])
+        self.assertEqual(response.json()['eliminated'], [])
+
+    def test_get_votes_with_unknown_shape(self):
+        slug, _ = self.create_three_way_ballot()
+        url = reverse('api:get_votes', kwargs={'slug': slug})
+
+        response = self.client.get(url, {'shape': 'columns'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error'], 'Shape must be one of rounds, matrix')
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,125 @@
+import json
+import tempfile
+import unittest
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from ranked_choice.core.repositories.ballot_repository import BallotRepository
+from ranked_choice.tests.integration.integration_test_case import IntegrationTestCase
+
+
+class ImportVotesCommandTests(IntegrationTestCase):
+    def setUp(self):
+        super().setUp()
+        self.repository = BallotRepository()
+        self.slug = self.repository.create_ballot(
+            title='Test Ballot',
+            choices=[
+                {'name': 'Option 1', 'description': 'Description 1'},
+                {'name': 'Option 2', 'description': 'Description 2'},
+                {'name': 'Option 3', 'description': 'Description 3'},
+            ]
+        )
+        self.ballot_item = self.repository.get_ballot_by_slug(self.slug)
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def _write(self, filename, content):
+        path = Path(self.directory.name) / filename
+        path.write_text(content, encoding='utf-8')
+        return str(path)
+
+    def _rankings(self):
+        names = {choice.id: choice.name for choice in self.ballot_item.choices}
+        return [
+            (voter.name, [names[vote.choice_id] for vote in voter.votes])
+            for voter in self.repository.get_votes_by_ballot_id(self.ballot_item.id)
+        ]
+
+    def test_import_csv(self):
+        path = self._write('ballots.csv', (
+            'name,first,second,third\n'
+            'Voter 1,Option 2,Option 1,\n'
+            'Voter 2,Option 3,Option 2,Option 1\n'
+            'Voter 3,Option 1,,\n'
+        ))
+        out = StringIO()
+
+        call_command('import_votes', self.slug, path, batch_size=2, stdout=out)
+
+        self.assertIn('Imported 3 voters', out.getvalue())
+        self.assertEqual(self._rankings(), [
+            ('Voter 1', ['Option 2', 'Option 1']),
+            ('Voter 2', ['Option 3', 'Option 2', 'Option 1']),
+            ('Voter 3', ['Option 1']),
+        ])
+        ballot_item = self.repository.get_ballot_by_slug(self.slug)
+        self.assertGreater(ballot_item.votes_version, 0)
+
+    def test_import_ndjson(self):
+        records = [
+            {'name': 'Voter 1', 'ranking': ['Option 3', 'Option 1']},
+            {'name': 'Voter 2', 'ranking': ['Option 2']},
+        ]
+        path = self._write(
+            'ballots.ndjson', '\n'.join(json.dumps(record) for record in records)
+        )
+
+        call_command('import_votes', self.slug, path, stdout=StringIO())
+
+        self.assertEqual(self._rankings(), [
+            ('Voter 1', ['Option 3', 'Option 1']),
+            ('Voter 2', ['Option 2']),
+        ])
+
+    def test_import_unknown_choice_imports_nothing(self):
+        path = self._write('ballots.csv', (
+            'name,first\n'
+            'Voter 1,Option 1\n'
+            'Voter 2,Option 9\n'
+        ))
+
+        with self.assertRaisesMessage(CommandError, "Line 3: unknown choice"):
+            call_command('import_votes', self.slug, path, batch_size=1)
+
+        self.assertEqual(self._rankings(), [])
+
+    def test_import_skips_voters_without_ranking(self):
+        records = [
+            {'name': 'Voter 1', 'ranking': []},
+            {'name': 'Voter 2', 'ranking': ['Option 2']},
+        ]
+        path = self._write(
+            'ballots.ndjson', '\n'.join(json.dumps(record) for record in records)
+        )
+        out = StringIO()
+
+        call_command('import_votes', self.slug, path, stdout=out)
+
+        self.assertIn('Imported 1 voters', out.getvalue())
+        self.assertEqual(self._rankings(), [('Voter 2', ['Option 2'])])
+
+    def test_import_rejects_batch_size_below_one(self):
+        path = self._write('ballots.csv', 'name,first\nVoter 1,Option 1\n')
+
+        for batch_size in ('0', '-1'):
+            with self.subTest(batch_size=batch_size):
+                with self.assertRaisesMessage(CommandError, "must be at least 1"):
+                    call_command(
+                        'import_votes', self.slug, path, '--batch-size', batch_size
+                    )
+
+        self.assertEqual(self._rankings(), [])
+
+    def test_import_unknown_ballot(self):
+        path = self._write('ballots.csv', 'name,first\n')
+
+        with self.assertRaisesMessage(CommandError, "Ballot not found"):
+            call_command('import_votes', 'nonexistent-ballot', path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import os
 import unittest
 
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -97,5 +98,115 @@ class ListBallotsAPITests(IntegrationTestCase):
         self.assertEqual(len(response.data), 0)
 
 
+    def test_list_ballots_pages_with_next_cursor(self):
+        response = self.client.get(self.list_ballots_url, {'limit': 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [ballot['slug'] for ballot in response.data], ["test-ballot-1"]
+        )
+        self.assertIn('X-Next-Cursor', response)
+
+        response = self.client.get(
+            self.list_ballots_url,
+            {'limit': 1, 'cursor': response['X-Next-Cursor']}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [ballot['slug'] for ballot in response.data], ["test-ballot-2"]
+        )
+
+        response = self.client.get(
+            self.list_ballots_url,
+            {'limit': 1, 'cursor': response['X-Next-Cursor']}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 0)
+        self.assertNotIn('X-Next-Cursor', response)
+
+    @override_settings(BALLOT_LIST_PAGE_SIZE=1)
+    def test_list_ballots_without_page_params_lists_every_ballot(self):
+        response = self.client.get(self.list_ballots_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [ballot['slug'] for ballot in response.data],
+            ["test-ballot-1", "test-ballot-2"]
+        )
+        self.assertNotIn('X-Next-Cursor', response)
+
+    @override_settings(BALLOT_LIST_PAGE_SIZE=1)
+    def test_list_ballots_cursor_without_limit_uses_page_size(self):
+        first_page = self.client.get(self.list_ballots_url, {'limit': 1})
+
+        response = self.client.get(
+            self.list_ballots_url, {'cursor': first_page['X-Next-Cursor']}
+        )
+
+        self.assertEqual(
+            [ballot['slug'] for ballot in response.data], ["test-ballot-2"]
+        )
+        self.assertIn('X-Next-Cursor', response)
+
+    def test_list_ballots_exposes_next_cursor_to_cross_origin_clients(self):
+        response = self.client.get(
+            self.list_ballots_url, {'limit': 1}, HTTP_ORIGIN='http://localhost:3000'
+        )
+
+        self.assertIn(
+            'X-Next-Cursor', response['Access-Control-Expose-Headers'].split(', ')
+        )
+
+    def test_list_ballots_last_page_has_no_next_cursor(self):
+        response = self.client.get(self.list_ballots_url, {'limit': 3})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('X-Next-Cursor', response)
+
+    def test_list_ballots_invalid_cursor(self):
+        response = self.client.get(self.list_ballots_url, {'cursor': 'not-a-cursor'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error'], "Invalid cursor")
+
+    def test_list_ballots_invalid_limit(self):
+        for limit in ('abc', '0', '-3'):
+            response = self.client.get(self.list_ballots_url, {'limit': limit})
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn('error', response.data)
+
+    def test_list_ballots_not_modified_until_ballots_change(self):
+        first = self.client.get(self.list_ballots_url)
+
+        with self.assertNumQueries(1):
+            not_modified = self.client.get(
+                self.list_ballots_url, HTTP_IF_NONE_MATCH=first['ETag']
+            )
+        self.repository.create_ballot(
+            title="Test Ballot 3",
+            choices=[{'name': 'Option 1', 'description': 'Description 1'}]
+        )
+        modified = self.client.get(
+            self.list_ballots_url, HTTP_IF_NONE_MATCH=first['ETag']
+        )
+
+        self.assertEqual(first['Cache-Control'], 'public, no-cache')
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(modified.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(modified['ETag'], first['ETag'])
+
+    def test_list_ballots_etag_depends_on_page(self):
+        first_page = self.client.get(self.list_ballots_url, {'limit': 1})
+        second_page = self.client.get(
+            self.list_ballots_url,
+            {'limit': 1, 'cursor': first_page['X-Next-Cursor']}
+        )
+
+        self.assertNotEqual(first_page['ETag'], second_page['ETag'])
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,99 @@
+import os
+
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from ranked_choice.core.repositories.ballot_repository import BallotRepository
+from ranked_choice.core.services.instrumentation import metrics_registry
+from ranked_choice.tests.integration.integration_test_case import IntegrationTestCase
+
+os.environ['ALLOWED_HOSTS'] = 'localhost,127.0.0.1,testserver'
+
+
+class MetricsAPITests(IntegrationTestCase):
+    def setUp(self):
+        super().setUp()
+        metrics_registry.reset()
+        self.client = APIClient()
+        self.repository = BallotRepository()
+        self.slug = self.repository.create_ballot(
+            title='Instrumented Ballot',
+            choices=[{'name': 'Option 1'}, {'name': 'Option 2'}]
+        )
+        ballot_item = self.repository.get_ballot_by_slug(self.slug)
+        self.repository.create_voter(
+            name='Voter 1',
+            ballot_id=ballot_item.id,
+            votes=[{'rank': 1, 'choice_id': ballot_item.choices[0].id}]
+        )
+
+    @override_settings(SERVER_TIMING_ENABLED=True)
+    def test_get_votes_reports_server_timing(self):
+        url = reverse('api:get_votes', kwargs={'slug': self.slug})
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        entries = [
+            entry.split(';')[0] for entry in response['Server-Timing'].split(', ')
+        ]
+        self.assertEqual(entries, [
+            'get_ballot_version',
+            'results_cache',
+            'get_ballot_by_slug',
+            'get_votes_by_ballot_id',
+            'tabulate',
+            'get_votes',
+            'serialize',
+        ])
+        self.assertRegex(
+            response['Server-Timing'],
+            r'get_votes_by_ballot_id;dur=\d+\.\d\d;desc="queries=1 rows=1"'
+        )
+
+    def test_metrics_exposes_stage_timings_and_cache_counters(self):
+        self.client.get(reverse('api:get_votes', kwargs={'slug': self.slug}))
+        self.client.get(reverse('api:get_ballot', kwargs={'slug': self.slug}))
+        self.client.get(reverse('api:get_ballot', kwargs={'slug': self.slug}))
+
+        response = self.client.get(reverse('api:metrics'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        lines = response.content.decode().splitlines()
+        self.assertIn(
+            'ranked_choice_stage_duration_seconds_count{stage="get_votes"} 1', lines
+        )
+        self.assertIn(
+            'ranked_choice_stage_queries_total{stage="get_votes_by_ballot_id"} 1',
+            lines
+        )
+        self.assertIn('ranked_choice_cache_size{cache="ballot"} 1', lines)
+
+    @override_settings(SERVER_TIMING_ENABLED=False)
+    def test_server_timing_can_be_turned_off(self):
+        url = reverse('api:get_votes', kwargs={'slug': self.slug})
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('Server-Timing', response)
+
+    def test_metrics_forbidden_to_other_addresses(self):
+        response = self.client.get(
+            reverse('api:metrics'), REMOTE_ADDR='203.0.113.7'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_metrics_allowed_to_staff_from_any_address(self):
+        self.client.force_authenticate(User.objects.create_user(
+            username='operator', password='unused', is_staff=True
+        ))
+
+        response = self.client.get(
+            reverse('api:metrics'), REMOTE_ADDR='203.0.113.7'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,104 @@
+from django.test import override_settings
+
+from ranked_choice.core.domain.workflows.create_voters_workflow import (
+    create_voters_workflow,
+)
+from ranked_choice.core.domain.workflows.get_votes_workflow import get_votes_workflow
+from ranked_choice.core.domain.workflows.list_ballots_workflow import (
+    list_ballots_workflow,
+)
+from ranked_choice.core.models import Ballot
+from ranked_choice.core.repositories.ballot_repository import BallotRepository
+from ranked_choice.core.services.query_budget import (
+    QueryBudgetExceeded,
+    count_queries,
+    query_budget,
+    query_shape,
+)
+from ranked_choice.tests.integration.integration_test_case import IntegrationTestCase
+
+
+@query_budget(1)
+def load_ballots_one_by_one(ballot_ids):
+    return [Ballot.objects.get(id=ballot_id) for ballot_id in ballot_ids]
+
+
+class QueryBudgetTests(IntegrationTestCase):
+    def setUp(self):
+        super().setUp()
+        self.repository = BallotRepository()
+        self.ballots = self.repository.create_ballots([
+            {
+                'title': f'Ballot {index}',
+                'choices': [{'name': f'Option {n}'} for n in range(1, 6)],
+            }
+            for index in range(12)
+        ])
+
+    def test_workflow_queries_do_not_grow_with_the_data(self):
+        ballot = self.ballots[0]
+        voters = [
+            {
+                'name': f'Voter {index}',
+                'ballot_id': ballot.id,
+                'votes': [
+                    {'rank': rank, 'choice_id': choice.id}
+                    for rank, choice in enumerate(ballot.choices, start=1)
+                ],
+            }
+            for index in range(40)
+        ]
+
+        # Each call raises QueryBudgetExceeded under the test settings if it
+        # runs more queries than its declared budget
+        self.assertEqual(create_voters_workflow(voters=voters), 40)
+        self.assertEqual(len(list_ballots_workflow(limit=12)), 12)
+        self.assertEqual(
+            get_votes_workflow(slug=ballot.slug).winner_name, 'Option 1'
+        )
+
+    def test_votes_of_many_ballots_are_written_in_one_pass(self):
+        voters = [
+            {
+                'name': f'Voter {ballot.id}',
+                'ballot_id': ballot.id,
+                'votes': [{'rank': 1, 'choice_id': ballot.choices[0].id}],
+            }
+            for ballot in self.ballots
+        ]
+
+        with count_queries() as log:
+            create_voters_workflow(voters=voters)
+
+        self.assertEqual(log.count, 4)
+        self.assertEqual(
+            set(Ballot.objects.values_list('votes_version', flat=True)), {1}
+        )
+
+    def test_over_budget_raises_in_strict_mode(self):
+        with self.assertRaises(QueryBudgetExceeded) as raised:
+            load_ballots_one_by_one([ballot.id for ballot in self.ballots[:3]])
+
+        self.assertIn('ran 3 queries, over its budget of 1', str(raised.exception))
+
+    @override_settings(QUERY_BUDGET_STRICT=False)
+    def test_over_budget_and_repeated_shapes_are_logged_otherwise(self):
+        with self.assertLogs('ranked_choice.core.services.query_budget') as logs:
+            loaded = load_ballots_one_by_one(
+                [ballot.id for ballot in self.ballots[:4]]
+            )
+
+        self.assertEqual(len(loaded), 4)
+        self.assertEqual(len(logs.records), 2)
+        self.assertIn('ran the same query 4 times', logs.output[0])
+        self.assertIn('ran 4 queries, over its budget of 1', logs.output[1])
+
+    def test_query_shape_collapses_placeholder_runs(self):
+        self.assertEqual(
+            query_shape('SELECT * FROM ballots WHERE id IN (%s, %s, %s)'),
+            'SELECT * FROM ballots WHERE id IN (%s)'
+        )
+        self.assertEqual(
+            query_shape('INSERT INTO votes VALUES (%s, %s), (%s, %s)'),
+            'INSERT INTO votes VALUES (%s)'
+        )
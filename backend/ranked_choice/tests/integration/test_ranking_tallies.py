@@ -0,0 +1,157 @@
+import importlib
+import random
+import unittest
+
+from django.apps import apps
+
+from ranked_choice.core.domain.items.ballot_profile_item import BallotProfileItem
+from ranked_choice.core.domain.tabulation.instant_runoff import voter_rankings
+from ranked_choice.core.domain.workflows.get_provisional_votes_workflow import (
+    get_provisional_votes_workflow,
+)
+from ranked_choice.core.domain.workflows.get_votes_workflow import (
+    get_votes_workflow,
+)
+from ranked_choice.core.models import RankingTally
+from ranked_choice.core.repositories.ballot_repository import BallotRepository
+from ranked_choice.tests.integration.integration_test_case import IntegrationTestCase
+
+ranking_tally_migration = importlib.import_module(
+    'ranked_choice.core.migrations.0010_ranking_tally'
+)
+
+
+class RankingTallyTests(IntegrationTestCase):
+    def setUp(self):
+        super().setUp()
+        self.repository = BallotRepository()
+        self.slug = self.repository.create_ballot(
+            title='Test Ballot',
+            choices=[
+                {'name': 'Option 1', 'description': 'Description 1'},
+                {'name': 'Option 2', 'description': 'Description 2'},
+                {'name': 'Option 3', 'description': 'Description 3'},
+            ]
+        )
+        self.ballot_item = self.repository.get_ballot_by_slug(self.slug)
+        self.choice_ids = [choice.id for choice in self.ballot_item.choices]
+
+    def _profile_from_votes(self):
+        return BallotProfileItem.from_rankings(voter_rankings(
+            self.repository.get_votes_by_ballot_id(self.ballot_item.id)
+        ))
+
+    def test_create_voter_updates_tallies_in_first_cast_order(self):
+        first, second, third = self.choice_ids
+        for ranking in ([second, first], [first], [second, first], [third]):
+            self.repository.create_voter(
+                name='Voter',
+                ballot_id=self.ballot_item.id,
+                votes=[
+                    {'rank': rank, 'choice_id': choice_id}
+                    for rank, choice_id in enumerate(ranking, start=1)
+                ]
+            )
+
+        profile = self.repository.get_ballot_profile(self.ballot_item.id)
+
+        self.assertEqual(list(profile.rankings.items()), [
+            ((second, first), 2),
+            ((first,), 1),
+            ((third,), 1),
+        ])
+        self.assertEqual(profile, self._profile_from_votes())
+
+    def test_create_voters_orders_votes_by_rank(self):
+        first, second, _ = self.choice_ids
+        self.repository.create_voters([
+            {
+                'name': f'Voter {index}',
+                'ballot_id': self.ballot_item.id,
+                'votes': [
+                    {'rank': 2, 'choice_id': first},
+                    {'rank': 1, 'choice_id': second},
+                ],
+            }
+            for index in range(3)
+        ])
+
+        profile = self.repository.get_ballot_profile(self.ballot_item.id)
+
+        self.assertEqual(profile.rankings, {(second, first): 3})
+
+    def test_import_voters_updates_tallies(self):
+        first, second, third = self.choice_ids
+        self.repository.import_voters(
+            ballot_id=self.ballot_item.id,
+            voters=[
+                ('Voter 1', [third, first]),
+                ('Voter 2', []),
+                ('Voter 3', [third, first]),
+                ('Voter 4', [second]),
+            ],
+            batch_size=2
+        )
+
+        profile = self.repository.get_ballot_profile(self.ballot_item.id)
+
+        self.assertEqual(list(profile.rankings.items()), [
+            ((third, first), 2),
+            ((), 1),
+            ((second,), 1),
+        ])
+        self.assertEqual(profile.total_votes, 4)
+
+    def test_get_ballot_profile_reads_only_the_tallies(self):
+        self.repository.import_voters(
+            ballot_id=self.ballot_item.id,
+            voters=[('Voter', [choice_id]) for choice_id in self.choice_ids]
+        )
+
+        with self.assertNumQueries(1) as context:
+            self.repository.get_ballot_profile(self.ballot_item.id)
+
+        self.assertNotIn('"votes"', context.captured_queries[0]['sql'])
+
+    def test_provisional_results_match_full_tabulation(self):
+        rng = random.Random(5150)
+        for _ in range(10):
+            self.repository.import_voters(
+                ballot_id=self.ballot_item.id,
+                voters=[
+                    (
+                        'Voter',
+                        rng.sample(self.choice_ids, rng.randint(0, 3))
+                    )
+                    for _ in range(rng.randint(1, 15))
+                ]
+            )
+
+            self.assertEqual(
+                get_provisional_votes_workflow(self.slug),
+                get_votes_workflow(self.slug)
+            )
+
+    def test_backfill_migration_rebuilds_tallies(self):
+        first, second, third = self.choice_ids
+        self.repository.import_voters(
+            ballot_id=self.ballot_item.id,
+            voters=[
+                ('Voter 1', [second, third]),
+                ('Voter 2', [first]),
+                ('Voter 3', [second, third]),
+                ('Voter 4', []),
+            ]
+        )
+        expected = self.repository.get_ballot_profile(self.ballot_item.id)
+        RankingTally.objects.all().delete()
+
+        ranking_tally_migration.backfill_ranking_tallies(apps, None)
+
+        profile = self.repository.get_ballot_profile(self.ballot_item.id)
+        self.assertEqual(profile, expected)
+        self.assertEqual(profile, self._profile_from_votes())
+
+
+if __name__ == "__main__":
+    unittest.main()
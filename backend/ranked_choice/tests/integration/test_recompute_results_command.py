@@ -0,0 +1,78 @@
+import unittest
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from ranked_choice.core.domain.workflows.get_votes_workflow import (
+    get_votes_workflow,
+)
+from ranked_choice.core.repositories.ballot_repository import BallotRepository
+from ranked_choice.core.repositories.results_cache import ResultsCache
+from ranked_choice.tests.integration.integration_test_case import IntegrationTestCase
+
+
+class RecomputeResultsCommandTests(IntegrationTestCase):
+    def setUp(self):
+        super().setUp()
+        self.repository = BallotRepository()
+        self.ballots = []
+        for title, rankings in (
+            ('First Ballot', [(0, 1), (1, 0), (0,)]),
+            ('Second Ballot', [(1,), (1, 0), (0, 1)]),
+        ):
+            slug = self.repository.create_ballot(
+                title=title,
+                choices=[{'name': 'Option 1'}, {'name': 'Option 2'}]
+            )
+            ballot = self.repository.get_ballot_by_slug(slug)
+            self.repository.import_voters(
+                ballot_id=ballot.id,
+                voters=[
+                    (f'Voter {index}', [ballot.choices[i].id for i in ranking])
+                    for index, ranking in enumerate(rankings)
+                ]
+            )
+            self.ballots.append(self.repository.get_ballot_by_slug(slug))
+
+    def test_recompute_every_ballot_warms_the_cache(self):
+        out = StringIO()
+
+        call_command('recompute_results', workers=1, stdout=out)
+
+        output = out.getvalue()
+        self.assertIn('Recomputed 2 ballots', output)
+        self.assertIn(f'{self.ballots[0].slug}: 3 votes', output)
+        self.assertIn('winner Option 1', output)
+        self.assertIn('winner Option 2', output)
+
+        results_cache = ResultsCache()
+        for ballot in self.ballots:
+            cached = results_cache.get_result(ballot.id, ballot.votes_version)
+            self.assertIsNotNone(cached)
+            self.assertEqual(cached, get_votes_workflow(ballot.slug))
+
+    def test_recompute_selected_ballots_without_cache(self):
+        out = StringIO()
+        err = StringIO()
+
+        call_command(
+            'recompute_results', str(self.ballots[1].id), '999999',
+            workers=1, no_cache=True, stdout=out, stderr=err
+        )
+
+        self.assertIn('Recomputed 1 ballots', out.getvalue())
+        self.assertIn(self.ballots[1].slug, out.getvalue())
+        self.assertNotIn(self.ballots[0].slug, out.getvalue())
+        self.assertIn('Ballot not found: 999999', err.getvalue())
+        self.assertIsNone(ResultsCache().get_result(
+            self.ballots[1].id, self.ballots[1].votes_version
+        ))
+
+    def test_recompute_rejects_zero_workers(self):
+        with self.assertRaises(CommandError):
+            call_command('recompute_results', workers=0, stdout=StringIO())
+
+
+if __name__ == "__main__":
+    unittest.main()
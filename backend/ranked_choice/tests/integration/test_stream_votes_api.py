@@ -0,0 +1,103 @@
+import json
+import os
+import unittest
+
+from django.test import AsyncClient, Client
+from django.urls import reverse
+
+from ranked_choice.core.repositories.ballot_repository import BallotRepository
+from ranked_choice.tests.integration.integration_test_case import IntegrationTestCase
+
+os.environ['ALLOWED_HOSTS'] = 'localhost,127.0.0.1,testserver'
+
+
+def parse_event(chunk):
+    fields = dict(
+        line.split(': ', 1) for line in chunk.decode().strip().split('\n')
+    )
+    return fields['event'], int(fields['id']), json.loads(fields['data'])
+
+
+class StreamVotesAPITests(IntegrationTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = AsyncClient()
+        self.repository = BallotRepository()
+        self.slug = self.repository.create_ballot(
+            title='Test Ballot',
+            choices=[
+                {'name': 'Option 1', 'description': 'Description 1'},
+                {'name': 'Option 2', 'description': 'Description 2'},
+            ]
+        )
+        self.ballot_item = self.repository.get_ballot_by_slug(self.slug)
+        self.repository.create_voter(
+            name='Voter 1',
+            ballot_id=self.ballot_item.id,
+            votes=[{'rank': 1, 'choice_id': self.ballot_item.choices[1].id}]
+        )
+
+    async def test_stream_votes_pushes_result_then_deltas(self):
+        url = reverse('api:stream_votes', kwargs={'slug': self.slug})
+
+        response = await self.client.get(url)
+        events = aiter(response.streaming_content)
+        try:
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response['Content-Type'], 'text/event-stream')
+            self.assertEqual(response['Cache-Control'], 'no-cache')
+
+            event, votes_version, data = parse_event(await anext(events))
+            self.assertEqual(event, 'result')
+            self.assertEqual(votes_version, 1)
+            self.assertEqual(data, {
+                'winner_id': self.ballot_item.choices[1].id,
+                'winner_name': 'Option 2',
+                'title': 'Test Ballot',
+                'rounds': [{'name': 'Option 2', 'votes': 1, 'round_index': 0}],
+            })
+
+            vote = await self.client.post(
+                reverse('api:create_vote'),
+                {
+                    'name': 'Voter 2',
+                    'ballot_id': self.ballot_item.id,
+                    'votes': [
+                        {'rank': 1, 'choice_id': self.ballot_item.choices[1].id}
+                    ],
+                },
+                content_type='application/json'
+            )
+            self.assertEqual(vote.status_code, 201)
+
+            event, votes_version, data = parse_event(await anext(events))
+            self.assertEqual(event, 'delta')
+            self.assertEqual(votes_version, 2)
+            self.assertEqual(
+                data, {'rounds': [{'name': 'Option 2', 'votes': 2, 'round_index': 0}]}
+            )
+        finally:
+            await events.aclose()
+
+    async def test_stream_votes_with_invalid_slug(self):
+        url = reverse('api:stream_votes', kwargs={'slug': 'nonexistent-ballot'})
+
+        response = await self.client.get(url)
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {'error': 'Ballot not found'})
+
+    def test_stream_votes_refused_under_wsgi(self):
+        url = reverse('api:stream_votes', kwargs={'slug': self.slug})
+
+        response = Client().get(url)
+
+        self.assertEqual(response.status_code, 501)
+        self.assertEqual(
+            response.json(),
+            {'error': 'Streaming results needs the ASGI application'}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
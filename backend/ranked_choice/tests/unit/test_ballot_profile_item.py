@@ -0,0 +1,96 @@
+import random
+import unittest
+from unittest.mock import Mock
+
+from faker import Faker
+
+from ranked_choice.core.domain.items.ballot_item import BallotItem, ChoiceItem
+from ranked_choice.core.domain.items.ballot_profile_item import BallotProfileItem
+from ranked_choice.core.domain.items.voter_item import VoteItem, VoterItem
+from ranked_choice.core.domain.tabulation.incremental_counter import (
+    IncrementalRoundCounter,
+)
+from ranked_choice.core.domain.workflows.get_votes_workflow import (
+    calculate_ranked_choice_winner,
+    calculate_ranked_choice_winner_compressed,
+    get_votes_workflow,
+)
+from ranked_choice.core.repositories.ballot_repository_interface import (
+    BallotRepositoryInterface,
+)
+from ranked_choice.tests.unit.test_incremental_round_counter import (
+    random_electorate,
+)
+
+
+class TestBallotProfileItem(unittest.TestCase):
+    def setUp(self):
+        self.fake = Faker()
+
+    def test_from_rankings_counts_in_first_cast_order(self):
+        profile = BallotProfileItem.from_rankings([(2, 1), (1,), (2, 1), ()])
+
+        self.assertEqual(list(profile.rankings.items()), [
+            ((2, 1), 2),
+            ((1,), 1),
+            ((), 1),
+        ])
+        self.assertEqual(profile.total_votes, 4)
+
+    def test_weighted_counter_tallies_weights(self):
+        counter = IncrementalRoundCounter([(1, 2), (2,), (3, 1)], [5, 4, 2])
+
+        self.assertEqual(counter.total_votes, 11)
+        self.assertEqual(counter.count_round(), {1: 5, 2: 4, 3: 2})
+
+        counter.eliminate(3)
+        self.assertEqual(counter.count_round(), {1: 7, 2: 4})
+
+    def test_compressed_matches_uncompressed_tabulation(self):
+        rng = random.Random(4242)
+        choice_name_map = {
+            choice_id: f"Choice {choice_id}" for choice_id in range(1, 5)
+        }
+
+        for _ in range(300):
+            voter_items = random_electorate(
+                rng, rng.randint(0, 60), rng.randint(1, 4)
+            )
+
+            self.assertEqual(
+                calculate_ranked_choice_winner_compressed(
+                    voter_items, choice_name_map
+                ),
+                calculate_ranked_choice_winner(voter_items, choice_name_map)
+            )
+
+    def test_get_votes_workflow_with_compressed_tabulator(self):
+        mock_repository = Mock(spec=BallotRepositoryInterface)
+        ballot_id = self.fake.pyint()
+        mock_repository.get_ballot_by_slug.return_value = BallotItem(
+            id=ballot_id,
+            title=self.fake.sentence(nb_words=3),
+            slug=self.fake.slug(),
+            choices=[
+                ChoiceItem(id=1, name="Choice 1"),
+                ChoiceItem(id=2, name="Choice 2"),
+            ]
+        )
+        mock_repository.get_votes_by_ballot_id.return_value = [
+            VoterItem(name=self.fake.name(), ballot_id=ballot_id, votes=[
+                VoteItem(rank=1, choice_id=choice_id),
+            ])
+            for choice_id in (1, 2, 1)
+        ]
+
+        result = get_votes_workflow(
+            self.fake.slug(),
+            mock_repository,
+            tabulator=calculate_ranked_choice_winner_compressed
+        )
+
+        self.assertEqual(result.winner_name, "Choice 1")
+        self.assertEqual(
+            [(item.name, item.votes) for item in result.rounds],
+            [("Choice 1", 2), ("Choice 2", 1)]
+        )
@@ -0,0 +1,74 @@
+import unittest
+from collections import Counter
+
+from benchmarks.electorates import KINDS, ElectorateSpec, generate_electorate
+from benchmarks.runner import compare
+
+
+class TestBenchmarkElectorates(unittest.TestCase):
+    def test_rankings_are_valid(self):
+        for kind in KINDS:
+            for choices in (3, 10, 60):
+                spec = ElectorateSpec(kind, 500, choices, max_rank=5)
+                voters = generate_electorate(spec)
+
+                self.assertEqual(len(voters), 500)
+                for ranking in voters.rankings():
+                    self.assertTrue(1 <= len(ranking) <= min(5, choices))
+                    self.assertEqual(len(set(ranking)), len(ranking))
+                    self.assertTrue(set(ranking) <= set(range(1, choices + 1)))
+                self.assertEqual(
+                    [vote.rank for vote in voters[0].votes],
+                    list(range(1, len(voters[0].votes) + 1))
+                )
+
+    def test_same_spec_same_voters(self):
+        spec = ElectorateSpec('zipf', 1000, 10, seed=7)
+
+        self.assertEqual(generate_electorate(spec), generate_electorate(spec))
+        self.assertNotEqual(
+            generate_electorate(spec),
+            generate_electorate(ElectorateSpec('zipf', 1000, 10, seed=8))
+        )
+
+    def test_kinds_shape_first_preferences(self):
+        def first_preferences(kind):
+            voters = generate_electorate(ElectorateSpec(kind, 20000, 10))
+            return Counter(ranking[0] for ranking in voters.rankings())
+
+        zipf = first_preferences('zipf')
+        near_tie = first_preferences('near_tie')
+        truncated = generate_electorate(ElectorateSpec('truncated', 20000, 10))
+
+        self.assertEqual(zipf.most_common(1)[0][0], 1)
+        self.assertGreater(zipf[1], 2 * zipf[3])
+        self.assertLess(abs(near_tie[1] - near_tie[2]), 0.05 * near_tie[1])
+        self.assertLess(len(truncated.choice_ids), 2.5 * len(truncated))
+
+    def test_choice_ids_are_mapped(self):
+        voters = generate_electorate(
+            ElectorateSpec('uniform', 100, 3), choice_ids=[11, 12, 13], ballot_id=4
+        )
+
+        self.assertEqual(set(voters.choice_ids), {11, 12, 13})
+        self.assertEqual(voters[0].ballot_id, 4)
+
+    def test_compare_reports_slower_timings(self):
+        def timing(name, seconds):
+            return {
+                'group': 'tabulation', 'name': name, 'electorate': 'zipf-1000v-10c',
+                'min': seconds, 'median': seconds,
+            }
+
+        regressions = compare(
+            [timing('vectorized', 0.013), timing('incremental', 0.011)],
+            [timing('vectorized', 0.010), timing('incremental', 0.010)],
+            threshold=0.2
+        )
+
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith('tabulation/vectorized/'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import unittest
+from unittest.mock import Mock
+
+from faker import Faker
+
+from ranked_choice.core.domain.items.ballot_item import BallotItem, ChoiceItem
+from ranked_choice.core.repositories.ballot_repository_interface import (
+    BallotRepositoryInterface,
+)
+from ranked_choice.core.repositories.cached_ballot_repository import (
+    CachedBallotRepository,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCachedBallotRepository(unittest.TestCase):
+    def setUp(self):
+        self.fake = Faker()
+        self.mock_repository = Mock(spec=BallotRepositoryInterface)
+        self.mock_repository.get_ballot_by_slug.side_effect = self.ballot
+        self.clock = FakeClock()
+        self.repository = CachedBallotRepository(
+            self.mock_repository, max_size=2, ttl=10, clock=self.clock
+        )
+
+    def ballot(self, slug):
+        return BallotItem(
+            id=self.fake.pyint(),
+            title=self.fake.sentence(nb_words=3),
+            slug=slug,
+            choices=[ChoiceItem(id=1, name="Choice 1")]
+        )
+
+    def test_serves_repeated_reads_from_memory(self):
+        first = self.repository.get_ballot_by_slug('ballot-a')
+        second = self.repository.get_ballot_by_slug('ballot-a')
+
+        self.assertIs(second, first)
+        self.mock_repository.get_ballot_by_slug.assert_called_once_with(
+            slug='ballot-a'
+        )
+        stats = self.repository.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size), (1, 1, 1))
+
+    def test_evicts_least_recently_used(self):
+        self.repository.get_ballot_by_slug('ballot-a')
+        self.repository.get_ballot_by_slug('ballot-b')
+        self.repository.get_ballot_by_slug('ballot-a')
+        self.repository.get_ballot_by_slug('ballot-c')
+
+        self.repository.get_ballot_by_slug('ballot-a')
+        self.repository.get_ballot_by_slug('ballot-b')
+
+        self.assertEqual(
+            [call.kwargs['slug'] for call in
+             self.mock_repository.get_ballot_by_slug.call_args_list],
+            ['ballot-a', 'ballot-b', 'ballot-c', 'ballot-b']
+        )
+        self.assertEqual(self.repository.stats().evictions, 2)
+
+    def test_expires_after_ttl(self):
+        first = self.repository.get_ballot_by_slug('ballot-a')
+        self.clock.now = 9.9
+        self.assertIs(self.repository.get_ballot_by_slug('ballot-a'), first)
+
+        self.clock.now = 10
+        second = self.repository.get_ballot_by_slug('ballot-a')
+
+        self.assertIsNot(second, first)
+        self.assertEqual(self.repository.stats().expirations, 1)
+
+    def test_missing_ballot_is_not_cached(self):
+        self.mock_repository.get_ballot_by_slug.side_effect = None
+        self.mock_repository.get_ballot_by_slug.return_value = None
+
+        self.assertIsNone(self.repository.get_ballot_by_slug('missing'))
+        self.assertIsNone(self.repository.get_ballot_by_slug('missing'))
+
+        self.assertEqual(self.mock_repository.get_ballot_by_slug.call_count, 2)
+        self.assertEqual(self.repository.stats().size, 0)
+
+    def test_invalidate(self):
+        ballot_a = self.repository.get_ballot_by_slug('ballot-a')
+        self.repository.get_ballot_by_slug('ballot-b')
+
+        self.repository.invalidate('ballot-b')
+        self.repository.invalidate_ballot(ballot_a.id)
+
+        self.assertEqual(self.repository.stats().size, 0)
+        self.repository.get_ballot_by_slug('ballot-a')
+        self.assertEqual(self.mock_repository.get_ballot_by_slug.call_count, 3)
+
+    def test_passes_other_methods_through(self):
+        ballot_id = self.fake.pyint()
+        votes = [{'rank': 1, 'choice_id': 1}]
+
+        self.repository.create_voter(name='Voter', ballot_id=ballot_id, votes=votes)
+        version = self.repository.get_votes_version(ballot_id)
+
+        self.mock_repository.create_voter.assert_called_once_with(
+            name='Voter', ballot_id=ballot_id, votes=votes
+        )
+        self.assertIs(version, self.mock_repository.get_votes_version.return_value)
+
+
+class TestAsyncCachedBallotRepository(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.mock_repository = Mock(spec=BallotRepositoryInterface)
+        self.mock_repository.aget_ballot_by_slug.return_value = BallotItem(
+            id=1, title='Ballot', slug='ballot-a'
+        )
+        self.repository = CachedBallotRepository(self.mock_repository)
+
+    async def test_shares_cache_with_sync_reads(self):
+        first = await self.repository.aget_ballot_by_slug('ballot-a')
+
+        self.assertIs(self.repository.get_ballot_by_slug('ballot-a'), first)
+        self.assertIs(await self.repository.aget_ballot_by_slug('ballot-a'), first)
+        self.mock_repository.aget_ballot_by_slug.assert_awaited_once_with(
+            slug='ballot-a'
+        )
+        self.mock_repository.get_ballot_by_slug.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
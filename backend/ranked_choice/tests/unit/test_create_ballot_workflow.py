@@ -7,6 +7,9 @@ from faker import Faker
 from ranked_choice.core.domain.workflows.create_ballot_workflow import (
     create_ballot_workflow,
 )
+from ranked_choice.core.domain.workflows.create_ballots_workflow import (
+    create_ballots_workflow,
+)
 from ranked_choice.core.repositories.ballot_repository import BallotRepositoryInterface
 
 
@@ -125,5 +128,41 @@ class TestCreateBallotWorkflow(unittest.TestCase):
         self.mock_repository.create_ballot.assert_not_called()
 
 
+    def test_create_ballots(self):
+        """
+        Test creating many ballots at once.
+        """
+        ballots = [
+            {"title": self.fake.sentence(nb_words=3), "choices": self.mock_choices}
+            for _ in range(3)
+        ]
+
+        created = create_ballots_workflow(
+            ballots=ballots, ballot_repository=self.mock_repository
+        )
+
+        self.mock_repository.create_ballots.assert_called_once_with(ballots=ballots)
+        self.assertIs(created, self.mock_repository.create_ballots.return_value)
+
+    def test_create_ballots_rejects_any_invalid_ballot(self):
+        """
+        Test one invalid ballot stops the whole batch.
+        """
+        for ballots in (
+            [],
+            [
+                {"title": self.mock_ballot_title, "choices": self.mock_choices},
+                {"title": "", "choices": self.mock_choices},
+            ],
+            [{"title": self.mock_ballot_title, "choices": []}],
+        ):
+            with self.assertRaises(ValueError):
+                create_ballots_workflow(
+                    ballots=ballots, ballot_repository=self.mock_repository
+                )
+
+        self.mock_repository.create_ballots.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
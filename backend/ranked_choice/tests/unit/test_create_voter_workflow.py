@@ -4,9 +4,11 @@ from unittest.mock import Mock
 from faker import Faker
 
 from ranked_choice.core.domain.workflows.create_vote_workflow import (
+    acreate_vote_workflow,
     create_vote_workflow,
 )
 from ranked_choice.core.repositories.ballot_repository import BallotRepositoryInterface
+from ranked_choice.core.services.vote_queue_interface import VoteQueueInterface
 
 
 class TestGetBallotWorkflow(unittest.TestCase):
@@ -47,3 +49,57 @@ class TestGetBallotWorkflow(unittest.TestCase):
         )
 
         self.mock_repository.create_voter.assert_not_called()
+
+    def test_create_voter_with_vote_queue(self):
+        mock_queue = Mock(spec=VoteQueueInterface)
+        name = self.fake.name()
+        ballot_id = self.fake.pyint()
+        votes = [{"rank": 1, "choice_id": self.fake.pyint()}]
+
+        future = create_vote_workflow(
+            name=name,
+            ballot_id=ballot_id,
+            votes=votes,
+            ballot_repository=self.mock_repository,
+            vote_queue=mock_queue
+        )
+
+        self.assertIs(future, mock_queue.submit.return_value)
+        mock_queue.submit.assert_called_once_with(
+            {'name': name, 'ballot_id': ballot_id, 'votes': votes}
+        )
+        self.mock_repository.create_voter.assert_not_called()
+
+
+class TestAcreateVoteWorkflow(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.fake = Faker()
+        self.mock_repository = Mock(spec=BallotRepositoryInterface)
+
+    async def test_acreate_voter(self):
+        name = self.fake.name()
+        ballot_id = self.fake.pyint()
+        votes = [{"rank": 1, "choice_id": self.fake.pyint()}]
+
+        await acreate_vote_workflow(
+            name=name,
+            ballot_id=ballot_id,
+            votes=votes,
+            ballot_repository=self.mock_repository
+        )
+
+        self.mock_repository.acreate_voter.assert_awaited_once_with(
+            name=name,
+            ballot_id=ballot_id,
+            votes=votes,
+        )
+
+    async def test_acreate_voter_with_no_votes(self):
+        await acreate_vote_workflow(
+            name=self.fake.name(),
+            ballot_id=self.fake.pyint(),
+            votes=[],
+            ballot_repository=self.mock_repository
+        )
+
+        self.mock_repository.acreate_voter.assert_not_awaited()
@@ -0,0 +1,57 @@
+import unittest
+from unittest.mock import Mock
+
+from faker import Faker
+
+from ranked_choice.core.domain.workflows.create_voters_workflow import (
+    create_voters_workflow,
+)
+from ranked_choice.core.repositories.ballot_repository import BallotRepositoryInterface
+
+
+class TestCreateVotersWorkflow(unittest.TestCase):
+    def setUp(self):
+        self.fake = Faker()
+        self.mock_repository = Mock(spec=BallotRepositoryInterface)
+
+    def _voter(self, votes):
+        return {
+            "name": self.fake.name(),
+            "ballot_id": self.fake.pyint(),
+            "votes": votes,
+        }
+
+    def test_create_voters(self):
+        voters = [
+            self._voter([{"rank": 1, "choice_id": self.fake.pyint()}]),
+            self._voter([{"rank": 1, "choice_id": self.fake.pyint()}]),
+        ]
+        self.mock_repository.create_voters.return_value = 2
+
+        created = create_voters_workflow(
+            voters=voters,
+            ballot_repository=self.mock_repository
+        )
+
+        self.assertEqual(created, 2)
+        self.mock_repository.create_voters.assert_called_once_with(voters=voters)
+
+    def test_create_voters_skips_voters_without_votes(self):
+        voter = self._voter([{"rank": 1, "choice_id": self.fake.pyint()}])
+        self.mock_repository.create_voters.return_value = 1
+
+        create_voters_workflow(
+            voters=[self._voter([]), voter],
+            ballot_repository=self.mock_repository
+        )
+
+        self.mock_repository.create_voters.assert_called_once_with(voters=[voter])
+
+    def test_create_voters_with_no_votes(self):
+        created = create_voters_workflow(
+            voters=[self._voter([])],
+            ballot_repository=self.mock_repository
+        )
+
+        self.assertEqual(created, 0)
+        self.mock_repository.create_voters.assert_not_called()
@@ -5,7 +5,10 @@ from django.utils.text import slugify
 from faker import Faker
 
 from ranked_choice.core.domain.items.ballot_item import BallotItem, ChoiceItem
-from ranked_choice.core.domain.workflows.get_ballot_workflow import get_ballot_workflow
+from ranked_choice.core.domain.workflows.get_ballot_workflow import (
+    aget_ballot_workflow,
+    get_ballot_workflow,
+)
 from ranked_choice.core.repositories.ballot_repository import BallotRepositoryInterface
 
 
@@ -49,3 +52,26 @@ class TestGetBallotWorkflow(unittest.TestCase):
 
         self.mock_repository.get_ballot_by_slug.assert_called_once_with(slug=slug)
         self.assertIsNone(result)
+
+
+class TestAgetBallotWorkflow(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.fake = Faker()
+        self.mock_repository = Mock(spec=BallotRepositoryInterface)
+
+    async def test_aget_ballot_return_item(self):
+        slug = self.fake.slug()
+        ballot_item = BallotItem(
+            id=self.fake.pyint(),
+            title=self.fake.sentence(nb_words=3),
+            slug=slug
+        )
+        self.mock_repository.aget_ballot_by_slug.return_value = ballot_item
+
+        result = await aget_ballot_workflow(
+            slug=slug, ballot_repository=self.mock_repository
+        )
+
+        self.mock_repository.aget_ballot_by_slug.assert_awaited_once_with(slug=slug)
+        self.mock_repository.get_ballot_by_slug.assert_not_called()
+        self.assertEqual(result, ballot_item)
@@ -0,0 +1,65 @@
+import unittest
+from unittest.mock import Mock
+
+from faker import Faker
+
+from ranked_choice.core.domain.items.ballot_item import BallotItem, ChoiceItem
+from ranked_choice.core.domain.items.ballot_profile_item import BallotProfileItem
+from ranked_choice.core.domain.workflows.get_provisional_votes_workflow import (
+    get_provisional_votes_workflow,
+)
+from ranked_choice.core.repositories.ballot_repository_interface import (
+    BallotRepositoryInterface,
+)
+
+
+class TestGetProvisionalVotesWorkflow(unittest.TestCase):
+    def setUp(self):
+        self.fake = Faker()
+        self.mock_repository = Mock(spec=BallotRepositoryInterface)
+
+    def test_tabulates_the_ballot_profile(self):
+        ballot_id = self.fake.pyint()
+        title = self.fake.sentence(nb_words=3)
+        self.mock_repository.get_ballot_by_slug.return_value = BallotItem(
+            id=ballot_id,
+            title=title,
+            slug=self.fake.slug(),
+            choices=[
+                ChoiceItem(id=1, name="Choice 1"),
+                ChoiceItem(id=2, name="Choice 2"),
+                ChoiceItem(id=3, name="Choice 3"),
+            ]
+        )
+        self.mock_repository.get_ballot_profile.return_value = BallotProfileItem(
+            rankings={(1, 2): 2, (3, 2): 1, (2,): 2}
+        )
+
+        result = get_provisional_votes_workflow(
+            self.fake.slug(), self.mock_repository
+        )
+
+        self.mock_repository.get_ballot_profile.assert_called_once_with(
+            ballot_id=ballot_id
+        )
+        self.mock_repository.get_votes_by_ballot_id.assert_not_called()
+        self.assertEqual(result.winner_name, "Choice 2")
+        self.assertEqual(result.title, title)
+        self.assertEqual(
+            [(item.name, item.votes, item.round_index) for item in result.rounds],
+            [
+                ("Choice 1", 2, 0), ("Choice 3", 1, 0), ("Choice 2", 2, 0),
+                ("Choice 1", 2, 1), ("Choice 2", 3, 1),
+            ]
+        )
+
+    def test_ballot_not_found(self):
+        self.mock_repository.get_ballot_by_slug.return_value = None
+
+        result = get_provisional_votes_workflow(
+            self.fake.slug(), self.mock_repository
+        )
+
+        self.assertEqual(result.winner_id, -1)
+        self.assertEqual(result.winner_name, "No ballot found")
+        self.mock_repository.get_ballot_profile.assert_not_called()
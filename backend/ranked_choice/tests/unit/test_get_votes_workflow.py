@@ -8,11 +8,18 @@ from ranked_choice.core.domain.items.ballot_item import (
     BallotResultItem,
     ChoiceItem,
 )
+from ranked_choice.core.domain.items.ballot_version_item import BallotVersionItem
 from ranked_choice.core.domain.items.voter_item import VoteItem, VoterItem
-from ranked_choice.core.domain.workflows.get_votes_workflow import get_votes_workflow
+from ranked_choice.core.domain.workflows.get_votes_workflow import (
+    aget_votes_workflow,
+    get_votes_workflow,
+)
 from ranked_choice.core.repositories.ballot_repository_interface import (
     BallotRepositoryInterface,
 )
+from ranked_choice.core.repositories.results_cache_interface import (
+    ResultsCacheInterface,
+)
 
 
 class TestGetVotesWorkflow(unittest.TestCase):
@@ -320,3 +327,125 @@ class TestGetVotesWorkflow(unittest.TestCase):
         self.assertEqual(result.winner_id, -1)
         self.assertEqual(result.winner_name, "No ballot found")
         self.assertEqual(result.rounds, [])
+
+    def _ballot_with_votes(self, votes_version):
+        ballot_item = BallotItem(
+            id=self.fake.pyint(),
+            title=self.fake.sentence(nb_words=3),
+            slug=self.fake.slug(),
+            choices=[ChoiceItem(id=1, name="Choice 1")],
+            votes_version=votes_version
+        )
+        self.mock_repository.get_ballot_by_slug.return_value = ballot_item
+        self.mock_repository.get_ballot_version.return_value = BallotVersionItem(
+            id=ballot_item.id,
+            votes_version=votes_version,
+            updated_at=self.fake.date_time()
+        )
+        self.mock_repository.get_votes_by_ballot_id.return_value = [
+            VoterItem(name=self.fake.name(), ballot_id=ballot_item.id, votes=[
+                VoteItem(rank=1, choice_id=1),
+            ]),
+        ]
+        return ballot_item
+
+    def test_cached_result_skips_tabulation(self):
+        ballot_item = self._ballot_with_votes(votes_version=3)
+        cached = BallotResultItem(
+            winner_id=1, winner_name="Choice 1", rounds=[], title=ballot_item.title
+        )
+        results_cache = Mock(spec=ResultsCacheInterface)
+        results_cache.get_result.return_value = cached
+
+        result = get_votes_workflow(
+            ballot_item.slug, self.mock_repository, results_cache=results_cache
+        )
+
+        self.assertIs(result, cached)
+        results_cache.get_result.assert_called_once_with(ballot_item.id, 3)
+        self.mock_repository.get_ballot_by_slug.assert_not_called()
+        self.mock_repository.get_votes_by_ballot_id.assert_not_called()
+        results_cache.set_result.assert_not_called()
+
+    def test_cache_miss_stores_result_under_votes_version(self):
+        ballot_item = self._ballot_with_votes(votes_version=7)
+        results_cache = Mock(spec=ResultsCacheInterface)
+        results_cache.get_result.return_value = None
+
+        result = get_votes_workflow(
+            ballot_item.slug, self.mock_repository, results_cache=results_cache
+        )
+
+        self.assertEqual(result.winner_name, "Choice 1")
+        self.assertEqual(result.title, ballot_item.title)
+        results_cache.set_result.assert_called_once_with(ballot_item.id, 7, result)
+
+
+class TestAgetVotesWorkflow(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.fake = Faker()
+        self.mock_repository = Mock(spec=BallotRepositoryInterface)
+        self.ballot_item = BallotItem(
+            id=self.fake.pyint(),
+            title=self.fake.sentence(nb_words=3),
+            slug=self.fake.slug(),
+            choices=[
+                ChoiceItem(id=1, name="Choice 1"),
+                ChoiceItem(id=2, name="Choice 2"),
+            ],
+            votes_version=4
+        )
+        self.mock_repository.aget_ballot_by_slug.return_value = self.ballot_item
+        self.mock_repository.aget_votes_by_ballot_id.return_value = [
+            VoterItem(name=self.fake.name(), ballot_id=self.ballot_item.id, votes=[
+                VoteItem(rank=1, choice_id=choice_id),
+            ])
+            for choice_id in (2, 1, 2)
+        ]
+
+    async def test_matches_sync_workflow(self):
+        self.mock_repository.get_ballot_by_slug.return_value = self.ballot_item
+        self.mock_repository.get_votes_by_ballot_id.return_value = (
+            self.mock_repository.aget_votes_by_ballot_id.return_value
+        )
+
+        result = await aget_votes_workflow(self.ballot_item.slug, self.mock_repository)
+
+        self.mock_repository.aget_votes_by_ballot_id.assert_awaited_once_with(
+            ballot_id=self.ballot_item.id
+        )
+        self.assertEqual(result.winner_name, "Choice 2")
+        self.assertEqual(
+            result,
+            get_votes_workflow(self.ballot_item.slug, self.mock_repository)
+        )
+
+    async def test_cache_hit_and_miss(self):
+        results_cache = Mock(spec=ResultsCacheInterface)
+        results_cache.aget_result.return_value = None
+
+        result = await aget_votes_workflow(
+            self.ballot_item.slug, self.mock_repository, results_cache=results_cache
+        )
+
+        results_cache.aset_result.assert_awaited_once_with(
+            self.ballot_item.id, 4, result
+        )
+
+        results_cache.aget_result.return_value = result
+        self.mock_repository.aget_votes_by_ballot_id.reset_mock()
+
+        cached = await aget_votes_workflow(
+            self.ballot_item.slug, self.mock_repository, results_cache=results_cache
+        )
+
+        self.assertIs(cached, result)
+        self.mock_repository.aget_votes_by_ballot_id.assert_not_awaited()
+
+    async def test_ballot_not_found(self):
+        self.mock_repository.aget_ballot_by_slug.return_value = None
+
+        result = await aget_votes_workflow(self.fake.slug(), self.mock_repository)
+
+        self.assertEqual(result.winner_name, "No ballot found")
+        self.mock_repository.aget_votes_by_ballot_id.assert_not_awaited()
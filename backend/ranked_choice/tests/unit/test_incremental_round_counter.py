@@ -0,0 +1,119 @@
+import random
+import unittest
+from collections import defaultdict
+
+from ranked_choice.core.domain.items.ballot_item import BallotResultItem
+from ranked_choice.core.domain.items.voter_item import VoteItem, VoterItem
+from ranked_choice.core.domain.tabulation.incremental_counter import (
+    IncrementalRoundCounter,
+)
+from ranked_choice.core.domain.tabulation.instant_runoff import (
+    map_rounds_to_round_items,
+)
+from ranked_choice.core.domain.workflows.get_votes_workflow import (
+    calculate_ranked_choice_winner,
+)
+
+
+def reference_ranked_choice_winner(voter_items, choice_name_map):
+    """
+    The original per-round re-sort tabulation, kept as an oracle.
+    """
+    if not voter_items:
+        return BallotResultItem(
+            winner_id=-1, winner_name="No votes found", rounds=[], title=""
+        )
+
+    def result(winner_id, rounds):
+        return BallotResultItem(
+            winner_id=winner_id,
+            winner_name=choice_name_map.get(winner_id, "Unknown"),
+            rounds=map_rounds_to_round_items(rounds, choice_name_map),
+            title=""
+        )
+
+    rounds = []
+    remaining_choices = {v.choice_id for voter in voter_items for v in voter.votes}
+    while remaining_choices:
+        vote_counts = defaultdict(int)
+        for voter in voter_items:
+            active_votes = sorted(
+                [v for v in voter.votes if v.choice_id in remaining_choices],
+                key=lambda v: v.rank
+            )
+            if active_votes:
+                vote_counts[active_votes[0].choice_id] += 1
+        if not vote_counts:
+            break
+
+        rounds.append(dict(vote_counts))
+        max_votes = max(vote_counts.values())
+        winners = [c for c, n in vote_counts.items() if n == max_votes]
+        if max_votes > len(voter_items) / 2 or len(remaining_choices) <= 1:
+            return result(winners[0], rounds)
+
+        min_votes = min(vote_counts.values())
+        losers = [c for c, n in vote_counts.items() if n == min_votes]
+        if len(losers) == len(vote_counts) and len(remaining_choices) <= 2:
+            return result(winners[0], rounds)
+        remaining_choices.remove(losers[0])
+
+    if rounds:
+        max_votes = max(rounds[-1].values())
+        return result(
+            [c for c, n in rounds[-1].items() if n == max_votes][0], rounds
+        )
+    return BallotResultItem(winner_id=-1, winner_name="No winner", rounds=[], title="")
+
+
+def random_electorate(rng, voter_count, choice_count):
+    voter_items = []
+    for _ in range(voter_count):
+        choices = rng.sample(range(1, choice_count + 1), rng.randint(0, choice_count))
+        ranks = [rng.randint(1, choice_count) for _ in choices]
+        voter_items.append(VoterItem(name="voter", ballot_id=1, votes=[
+            VoteItem(rank=rank, choice_id=choice_id)
+            for rank, choice_id in zip(ranks, choices, strict=True)
+        ]))
+    return voter_items
+
+
+class TestIncrementalRoundCounter(unittest.TestCase):
+    def test_first_round_counts_top_preferences_in_cast_order(self):
+        counter = IncrementalRoundCounter([(2, 1), (1, 2), (2,), ()])
+
+        self.assertEqual(counter.total_votes, 4)
+        self.assertEqual(counter.choice_ids, {1, 2})
+        self.assertEqual(list(counter.count_round().items()), [(2, 2), (1, 1)])
+
+    def test_eliminate_transfers_only_to_active_preferences(self):
+        counter = IncrementalRoundCounter([(3, 2, 1), (2, 1), (1, 3)])
+
+        counter.eliminate(2)
+        self.assertEqual(counter.count_round(), {3: 1, 1: 2})
+
+        counter.eliminate(3)
+        self.assertEqual(counter.count_round(), {1: 3})
+
+    def test_eliminate_exhausts_ballots_without_further_preferences(self):
+        counter = IncrementalRoundCounter([(1,), (2, 1)])
+
+        counter.eliminate(1)
+
+        self.assertEqual(counter.count_round(), {2: 1})
+
+    def test_matches_reference_tabulation(self):
+        rng = random.Random(20240611)
+        choice_name_map = {
+            choice_id: f"Choice {choice_id}" for choice_id in range(1, 7)
+        }
+
+        for _ in range(300):
+            voter_items = random_electorate(
+                rng, rng.randint(0, 40), rng.randint(1, 6)
+            )
+
+            self.assertEqual(
+                calculate_ranked_choice_winner(voter_items, choice_name_map),
+                reference_ranked_choice_winner(voter_items, choice_name_map)
+            )
@@ -0,0 +1,124 @@
+import asyncio
+import unittest
+
+from django.test import override_settings
+
+from ranked_choice.core.domain.items.cache_stats_item import CacheStatsItem
+from ranked_choice.core.services.instrumentation import (
+    MetricsRegistry,
+    StageTiming,
+    cache_stats_metrics,
+    collect_request_timings,
+    instrumented,
+    metrics_registry,
+    server_timing,
+    stage,
+)
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        metrics_registry.reset()
+
+    def test_registry_renders_histogram_and_counters(self):
+        registry = MetricsRegistry()
+        registry.observe(StageTiming(name='tabulate', seconds=0.003, rows=10))
+        registry.observe(StageTiming(name='tabulate', seconds=0.2, queries=2))
+
+        lines = registry.render().splitlines()
+
+        self.assertIn(
+            'ranked_choice_stage_duration_seconds_bucket'
+            '{stage="tabulate",le="0.0025"} 0',
+            lines
+        )
+        self.assertIn(
+            'ranked_choice_stage_duration_seconds_bucket'
+            '{stage="tabulate",le="0.005"} 1',
+            lines
+        )
+        self.assertIn(
+            'ranked_choice_stage_duration_seconds_bucket'
+            '{stage="tabulate",le="+Inf"} 2',
+            lines
+        )
+        self.assertIn(
+            'ranked_choice_stage_duration_seconds_count{stage="tabulate"} 2', lines
+        )
+        self.assertIn('ranked_choice_stage_queries_total{stage="tabulate"} 2', lines)
+        self.assertIn('ranked_choice_stage_rows_total{stage="tabulate"} 10', lines)
+
+    def test_registry_appends_collector_lines(self):
+        registry = MetricsRegistry()
+        stats = CacheStatsItem(
+            hits=3, misses=1, evictions=0, expirations=0, size=1, max_size=8
+        )
+        registry.add_collector(lambda: cache_stats_metrics('ballot', stats))
+
+        lines = registry.render().splitlines()
+
+        self.assertIn('ranked_choice_cache_hits_total{cache="ballot"} 3', lines)
+        self.assertIn('ranked_choice_cache_max_size{cache="ballot"} 8', lines)
+
+    def test_instrumented_records_sync_and_async_calls(self):
+        @instrumented(rows=len)
+        def load_workflow():
+            return [1, 2, 3]
+
+        @instrumented(name='async_load')
+        async def aload_workflow():
+            return None
+
+        with collect_request_timings() as timings:
+            load_workflow()
+            asyncio.run(aload_workflow())
+
+        self.assertEqual(
+            [(timing.name, timing.queries, timing.rows) for timing in timings],
+            [('load', 0, 3), ('async_load', None, None)]
+        )
+
+    def test_instrumented_leaves_unmeasurable_rows_uncounted(self):
+        @instrumented(rows=len)
+        def load():
+            return 42
+
+        with collect_request_timings() as timings:
+            self.assertEqual(load(), 42)
+
+        self.assertIsNone(timings[0].rows)
+
+    def test_nested_stages_finish_inner_first(self):
+        with collect_request_timings() as timings:
+            with stage('outer'):
+                with stage('inner'):
+                    pass
+
+        self.assertEqual([timing.name for timing in timings], ['inner', 'outer'])
+        self.assertGreaterEqual(timings[1].seconds, timings[0].seconds)
+
+    @override_settings(INSTRUMENTATION_ENABLED=False)
+    def test_disabled_stages_record_nothing(self):
+        with collect_request_timings() as timings:
+            with stage('tabulate'):
+                pass
+
+        self.assertEqual(timings, [])
+        self.assertNotIn('stage="tabulate"', metrics_registry.render())
+
+    def test_server_timing_sums_repeated_stages(self):
+        header = server_timing([
+            StageTiming(name='get_votes_by_ballot_id', seconds=0.004, queries=1),
+            StageTiming(name='tabulate', seconds=0.0015, queries=None, rows=7),
+            StageTiming(name='get_votes_by_ballot_id', seconds=0.002, queries=2),
+        ])
+
+        self.assertEqual(
+            header,
+            'get_votes_by_ballot_id;dur=6.00;desc="queries=3", '
+            'tabulate;dur=1.50;desc="rows=7"'
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,10 @@
 import unittest
+from datetime import timezone
 from unittest.mock import Mock
 
 from faker import Faker
 
+from ranked_choice.core.domain.items.ballot_cursor_item import BallotCursorItem
 from ranked_choice.core.domain.items.ballot_item import BallotItem, ChoiceItem
 from ranked_choice.core.domain.workflows.list_ballots_workflow import (
     list_ballots_workflow,
@@ -56,4 +58,35 @@ class TestListBallotsWorkflow(unittest.TestCase):
         result = list_ballots_workflow(ballot_repository=self.mock_repository)
 
         self.mock_repository.list_ballots.assert_called_once()
-        self.assertEqual(result, [])
\ No newline at end of file
+        self.assertEqual(result, [])
+
+    def test_list_ballots_decodes_cursor(self):
+        cursor = BallotCursorItem(
+            created_at=self.fake.date_time(tzinfo=timezone.utc),
+            id=self.fake.pyint()
+        )
+        self.mock_repository.list_ballots.return_value = []
+
+        list_ballots_workflow(
+            cursor=cursor.encode(),
+            limit=10,
+            ballot_repository=self.mock_repository
+        )
+
+        self.mock_repository.list_ballots.assert_called_once_with(
+            cursor=cursor, limit=10
+        )
+
+    def test_list_ballots_invalid_cursor(self):
+        with self.assertRaises(ValueError):
+            list_ballots_workflow(
+                cursor="not-a-cursor", ballot_repository=self.mock_repository
+            )
+
+        self.mock_repository.list_ballots.assert_not_called()
+
+    def test_list_ballots_invalid_limit(self):
+        with self.assertRaises(ValueError):
+            list_ballots_workflow(limit=0, ballot_repository=self.mock_repository)
+
+        self.mock_repository.list_ballots.assert_not_called()
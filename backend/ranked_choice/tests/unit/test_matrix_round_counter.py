@@ -0,0 +1,69 @@
+import random
+import unittest
+
+import numpy as np
+
+from ranked_choice.core.domain.tabulation.matrix_counter import MatrixRoundCounter
+from ranked_choice.core.domain.workflows.get_votes_workflow import (
+    calculate_ranked_choice_winner,
+    calculate_ranked_choice_winner_vectorized,
+)
+from ranked_choice.tests.unit.test_incremental_round_counter import (
+    random_electorate,
+)
+
+
+class TestMatrixRoundCounter(unittest.TestCase):
+    def test_from_rankings_matches_packed_arrays(self):
+        rankings = [(2, 1), (1, 2), (2,), ()]
+        counter = MatrixRoundCounter.from_rankings(rankings)
+        packed = MatrixRoundCounter(np.array([2, 1, 1, 2, 2]), np.array([2, 2, 1, 0]))
+
+        self.assertEqual(counter.total_votes, 4)
+        self.assertEqual(counter.choice_ids, {1, 2})
+        self.assertEqual(list(counter.count_round().items()), [(2, 2), (1, 1)])
+        self.assertEqual(
+            list(packed.count_round().items()),
+            list(counter.count_round().items())
+        )
+
+    def test_eliminate_transfers_only_to_active_preferences(self):
+        counter = MatrixRoundCounter.from_rankings([(3, 2, 1), (2, 1), (1, 3)])
+
+        counter.eliminate(2)
+        self.assertEqual(counter.count_round(), {3: 1, 1: 2})
+
+        counter.eliminate(3)
+        self.assertEqual(counter.count_round(), {1: 3})
+
+    def test_duplicate_choice_counts_at_best_position(self):
+        counter = MatrixRoundCounter.from_rankings([(1, 2, 1), (2, 1)])
+
+        counter.eliminate(1)
+
+        self.assertEqual(counter.count_round(), {2: 2})
+
+    def test_ballots_without_rankings(self):
+        counter = MatrixRoundCounter.from_rankings([(), ()])
+
+        self.assertEqual(counter.total_votes, 2)
+        self.assertEqual(counter.choice_ids, set())
+        self.assertEqual(counter.count_round(), {})
+
+    def test_matches_incremental_tabulation(self):
+        rng = random.Random(8675309)
+        choice_name_map = {
+            choice_id: f"Choice {choice_id}" for choice_id in range(1, 7)
+        }
+
+        for _ in range(300):
+            voter_items = random_electorate(
+                rng, rng.randint(0, 40), rng.randint(1, 6)
+            )
+
+            self.assertEqual(
+                calculate_ranked_choice_winner_vectorized(
+                    voter_items, choice_name_map
+                ),
+                calculate_ranked_choice_winner(voter_items, choice_name_map)
+            )
@@ -0,0 +1,104 @@
+import random
+import unittest
+
+from faker import Faker
+
+from ranked_choice.core.domain.items.packed_voters_item import PackedVotersItem
+from ranked_choice.core.domain.items.voter_item import VoteItem, VoterItem
+from ranked_choice.core.domain.tabulation.instant_runoff import voter_rankings
+from ranked_choice.core.domain.workflows.get_votes_workflow import (
+    calculate_ranked_choice_winner,
+    calculate_ranked_choice_winner_vectorized,
+)
+from ranked_choice.tests.unit.test_incremental_round_counter import (
+    random_electorate,
+)
+
+
+class TestPackedVotersItem(unittest.TestCase):
+    def setUp(self):
+        self.fake = Faker()
+        self.ballot_id = self.fake.pyint()
+        self.voter_items = [
+            VoterItem(name=self.fake.name(), ballot_id=self.ballot_id, votes=[
+                VoteItem(rank=1, choice_id=3),
+                VoteItem(rank=2, choice_id=1),
+            ]),
+            VoterItem(name=self.fake.name(), ballot_id=self.ballot_id, votes=[]),
+            VoterItem(name=self.fake.name(), ballot_id=self.ballot_id, votes=[
+                VoteItem(rank=1, choice_id=2),
+            ]),
+        ]
+
+    def test_vote_items_have_no_instance_dict(self):
+        self.assertFalse(hasattr(VoteItem(rank=1, choice_id=1), '__dict__'))
+        self.assertFalse(hasattr(self.voter_items[0], '__dict__'))
+
+    def test_from_voters_packs_into_flat_arrays(self):
+        packed = PackedVotersItem.from_voters(self.ballot_id, self.voter_items)
+
+        self.assertEqual(list(packed.choice_ids), [3, 1, 2])
+        self.assertEqual(list(packed.ranks), [1, 2, 1])
+        self.assertEqual(list(packed.offsets), [0, 2, 2, 3])
+        self.assertEqual(list(packed.lengths()), [2, 0, 1])
+        self.assertEqual(list(packed.rankings()), [(3, 1), (), (2,)])
+
+    def test_behaves_as_a_sequence_of_voter_items(self):
+        packed = PackedVotersItem.from_voters(self.ballot_id, self.voter_items)
+
+        self.assertEqual(len(packed), 3)
+        self.assertEqual(list(packed), self.voter_items)
+        self.assertEqual(packed, self.voter_items)
+        self.assertEqual(packed[-1], self.voter_items[-1])
+        self.assertEqual(packed[1:], self.voter_items[1:])
+        with self.assertRaises(IndexError):
+            packed[3]
+
+    def test_packs_splitting_votes_differently_are_not_equal(self):
+        packed = PackedVotersItem.from_voters(self.ballot_id, self.voter_items)
+        resplit = PackedVotersItem.from_voters(self.ballot_id, self.voter_items)
+        resplit.offsets[1] = 1
+
+        self.assertEqual(
+            PackedVotersItem.from_voters(self.ballot_id, self.voter_items), packed
+        )
+        self.assertNotEqual(resplit, packed)
+
+    def test_append_orders_votes_by_rank(self):
+        packed = PackedVotersItem(ballot_id=self.ballot_id)
+
+        packed.append("Voter", [(2, 5), (1, 7), (2, 4)])
+
+        self.assertEqual(packed[0].votes, [
+            VoteItem(rank=1, choice_id=7),
+            VoteItem(rank=2, choice_id=5),
+            VoteItem(rank=2, choice_id=4),
+        ])
+
+    def test_rankings_match_voter_rankings(self):
+        rng = random.Random(2024)
+        for _ in range(100):
+            voter_items = random_electorate(rng, rng.randint(0, 30), 5)
+            packed = PackedVotersItem.from_voters(self.ballot_id, voter_items)
+
+            self.assertEqual(
+                list(voter_rankings(packed)), list(voter_rankings(voter_items))
+            )
+
+    def test_tabulators_accept_packed_voters(self):
+        rng = random.Random(31337)
+        choice_name_map = {
+            choice_id: f"Choice {choice_id}" for choice_id in range(1, 6)
+        }
+        for _ in range(100):
+            voter_items = random_electorate(rng, rng.randint(0, 40), 5)
+            packed = PackedVotersItem.from_voters(self.ballot_id, voter_items)
+            expected = calculate_ranked_choice_winner(voter_items, choice_name_map)
+
+            self.assertEqual(
+                calculate_ranked_choice_winner(packed, choice_name_map), expected
+            )
+            self.assertEqual(
+                calculate_ranked_choice_winner_vectorized(packed, choice_name_map),
+                expected
+            )
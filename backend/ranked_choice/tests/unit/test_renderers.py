@@ -0,0 +1,113 @@
+import random
+import unittest
+
+from faker import Faker
+from rest_framework.renderers import JSONRenderer
+
+from ranked_choice.api.renderers import (
+    FastJSONList,
+    OrjsonRenderer,
+    ballot_detail_payload,
+    ballot_result_payload,
+)
+from ranked_choice.api.serializers import BallotDetailSerializer, BallotResultSerializer
+from ranked_choice.core.domain.items.ballot_item import (
+    BallotItem,
+    BallotResultItem,
+    ChoiceItem,
+    RoundItem,
+)
+
+# Characters JSON encoders are most likely to disagree on
+AWKWARD_TEXT = ['"quoted"', 'back\\slash', 'tab\tnew\nline', '\x00\x1f\x7f',
+                'line\u2028para\u2029', 'caf\u00e9 \U0001F5F3', '']
+
+
+class TestOrjsonRenderer(unittest.TestCase):
+    def setUp(self):
+        self.fake = Faker()
+        self.rng = random.Random(2024)
+
+    def text(self):
+        if self.rng.random() < 0.5:
+            return self.rng.choice(AWKWARD_TEXT)
+        return self.fake.sentence(nb_words=3)
+
+    def ballot(self):
+        return BallotItem(
+            id=self.fake.pyint(),
+            title=self.text(),
+            slug=self.fake.slug(),
+            description=self.rng.choice([None, self.text()]),
+            choices=[
+                ChoiceItem(
+                    id=self.fake.pyint(),
+                    name=self.text(),
+                    description=self.rng.choice([None, self.text()])
+                )
+                for _ in range(self.rng.randint(0, 6))
+            ],
+            votes_version=self.fake.pyint()
+        )
+
+    def result(self):
+        return BallotResultItem(
+            winner_id=self.rng.choice([-1, self.fake.pyint()]),
+            winner_name=self.text(),
+            title=self.text(),
+            rounds=[
+                RoundItem(
+                    name=self.text(),
+                    votes=self.rng.randint(0, 2 ** 40),
+                    round_index=round_index
+                )
+                for round_index in range(self.rng.randint(0, 5))
+                for _ in range(self.rng.randint(1, 4))
+            ]
+        )
+
+    def assertSameBytes(self, payload, serializer_data, **render_kwargs):
+        self.assertEqual(
+            OrjsonRenderer().render(payload, **render_kwargs),
+            JSONRenderer().render(serializer_data, **render_kwargs)
+        )
+
+    def test_results_match_the_serializer_byte_for_byte(self):
+        for _ in range(200):
+            result = self.result()
+
+            self.assertSameBytes(
+                ballot_result_payload(result), BallotResultSerializer(result).data
+            )
+
+    def test_ballots_match_the_serializer_byte_for_byte(self):
+        for _ in range(100):
+            ballots = [self.ballot() for _ in range(self.rng.randint(0, 4))]
+
+            self.assertSameBytes(
+                FastJSONList(map(ballot_detail_payload, ballots)),
+                BallotDetailSerializer(ballots, many=True).data
+            )
+            for ballot in ballots:
+                self.assertSameBytes(
+                    ballot_detail_payload(ballot),
+                    BallotDetailSerializer(ballot).data
+                )
+
+    def test_indented_output_matches_the_serializer(self):
+        result = self.result()
+
+        self.assertSameBytes(
+            ballot_result_payload(result),
+            BallotResultSerializer(result).data,
+            accepted_media_type='application/json; indent=4'
+        )
+
+    def test_other_data_renders_as_json_renderer_does(self):
+        data = {"error": "Ballot not found", "values": [1.5, None]}
+
+        self.assertSameBytes(data, data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+import asyncio
+import json
+import unittest
+
+from ranked_choice.core.domain.items.ballot_item import BallotResultItem, RoundItem
+from ranked_choice.core.services.results_broadcaster import (
+    KEEPALIVE,
+    SUBSCRIBER_QUEUE_SIZE,
+    ResultsBroadcaster,
+    result_delta,
+)
+
+
+def parse_event(message):
+    fields = dict(line.split(': ', 1) for line in message.strip().split('\n'))
+    return fields['event'], int(fields['id']), json.loads(fields['data'])
+
+
+class FakeBallot:
+    """
+    Ballot whose first-round tallies are set by the test.
+    """
+
+    def __init__(self):
+        self.votes_version = 1
+        self.tallies = {"Choice 1": 1}
+        self.tabulations = 0
+
+    def load_votes_version(self, ballot_id):
+        return self.votes_version
+
+    def load_result(self, slug):
+        self.tabulations += 1
+        winner = max(self.tallies, key=self.tallies.get)
+        return BallotResultItem(
+            winner_id=int(winner.split()[-1]),
+            winner_name=winner,
+            rounds=[
+                RoundItem(name=name, votes=votes, round_index=0)
+                for name, votes in self.tallies.items()
+            ],
+            title="Ballot"
+        )
+
+    def cast(self, name):
+        self.tallies[name] = self.tallies.get(name, 0) + 1
+        self.votes_version += 1
+
+
+class TestResultDelta(unittest.TestCase):
+    def test_only_changes_are_included(self):
+        previous = BallotResultItem(
+            winner_id=1, winner_name="Choice 1", title="Ballot", rounds=[
+                RoundItem(name="Choice 1", votes=2, round_index=0),
+                RoundItem(name="Choice 2", votes=1, round_index=0),
+                RoundItem(name="Choice 1", votes=3, round_index=1),
+            ]
+        )
+        current = BallotResultItem(
+            winner_id=2, winner_name="Choice 2", title="Ballot", rounds=[
+                RoundItem(name="Choice 1", votes=2, round_index=0),
+                RoundItem(name="Choice 2", votes=3, round_index=0),
+            ]
+        )
+
+        self.assertEqual(result_delta(previous, current), {
+            'winner_id': 2,
+            'winner_name': "Choice 2",
+            'rounds': [{'name': "Choice 2", 'votes': 3, 'round_index': 0}],
+            'removed_rounds': [{'round_index': 1, 'name': "Choice 1"}],
+        })
+        self.assertEqual(result_delta(current, current), {})
+
+
+class TestResultsBroadcaster(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.ballot = FakeBallot()
+        self.broadcaster = ResultsBroadcaster(
+            load_votes_version=self.ballot.load_votes_version,
+            load_result=self.ballot.load_result,
+            poll_interval=60,
+            debounce=0.01,
+            keepalive=60
+        )
+
+    async def _subscribe(self, count):
+        streams = [self.broadcaster.subscribe(7, "ballot") for _ in range(count)]
+        for stream in streams:
+            self.addAsyncCleanup(stream.aclose)
+        return streams
+
+    async def _next(self, stream):
+        return await asyncio.wait_for(anext(stream), 1)
+
+    async def test_one_tabulation_fans_out_to_every_subscriber(self):
+        streams = await self._subscribe(5)
+
+        messages = await asyncio.gather(*(self._next(s) for s in streams))
+
+        self.assertEqual(self.ballot.tabulations, 1)
+        self.assertEqual(len(set(messages)), 1)
+        event, votes_version, data = parse_event(messages[0])
+        self.assertEqual((event, votes_version), ('result', 1))
+        self.assertEqual(data['winner_name'], "Choice 1")
+
+    async def test_notify_pushes_one_delta_per_burst(self):
+        streams = await self._subscribe(3)
+        await asyncio.gather(*(self._next(s) for s in streams))
+
+        for _ in range(4):
+            self.ballot.cast("Choice 2")
+            self.broadcaster.notify(7)
+        messages = await asyncio.gather(*(self._next(s) for s in streams))
+
+        self.assertEqual(self.ballot.tabulations, 2)
+        event, votes_version, data = parse_event(messages[0])
+        self.assertEqual((event, votes_version), ('delta', 5))
+        self.assertEqual(data, {
+            'winner_id': 2,
+            'winner_name': "Choice 2",
+            'rounds': [{'name': "Choice 2", 'votes': 4, 'round_index': 0}],
+        })
+
+    async def test_late_subscriber_gets_the_full_result(self):
+        first, = await self._subscribe(1)
+        await self._next(first)
+        self.ballot.cast("Choice 2")
+        self.broadcaster.notify(7)
+        await self._next(first)
+
+        late, = await self._subscribe(1)
+        event, votes_version, data = parse_event(await self._next(late))
+
+        self.assertEqual((event, votes_version), ('result', 2))
+        self.assertEqual(len(data['rounds']), 2)
+        self.assertEqual(self.ballot.tabulations, 2)
+
+    async def test_polls_for_votes_cast_elsewhere(self):
+        self.broadcaster.poll_interval = 0.01
+        stream, = await self._subscribe(1)
+        await self._next(stream)
+
+        self.ballot.cast("Choice 1")
+        event, votes_version, _ = parse_event(await self._next(stream))
+
+        self.assertEqual((event, votes_version), ('delta', 2))
+
+    async def test_idle_stream_sends_keepalive(self):
+        self.broadcaster.keepalive = 0.01
+        stream, = await self._subscribe(1)
+        await self._next(stream)
+
+        self.assertEqual(await self._next(stream), KEEPALIVE)
+
+    async def test_lagging_subscriber_is_resynced_with_full_result(self):
+        self.broadcaster.poll_interval = 0.001
+        self.broadcaster.keepalive = 0.05
+        stream, = await self._subscribe(1)
+        await self._next(stream)
+
+        for _ in range(SUBSCRIBER_QUEUE_SIZE + 2):
+            self.ballot.cast("Choice 1")
+            await asyncio.sleep(0.01)
+        messages = []
+        while (message := await self._next(stream)) != KEEPALIVE:
+            messages.append(message)
+
+        self.assertLessEqual(len(messages), SUBSCRIBER_QUEUE_SIZE)
+        self.assertEqual(parse_event(messages[0])[0], 'result')
+        self.assertEqual(parse_event(messages[-1])[1], self.ballot.votes_version)
+
+    async def test_last_unsubscribe_stops_the_channel(self):
+        stream, = await self._subscribe(1)
+        await self._next(stream)
+        channel = self.broadcaster._channels[7]
+
+        await stream.aclose()
+        await asyncio.gather(channel.task, return_exceptions=True)
+
+        self.assertNotIn(7, self.broadcaster._channels)
+        self.assertTrue(channel.task.cancelled())
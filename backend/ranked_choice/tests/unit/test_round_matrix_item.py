@@ -0,0 +1,79 @@
+import unittest
+from array import array
+
+from ranked_choice.api.results_export import csv_chunks
+from ranked_choice.core.domain.items.round_matrix_item import RoundMatrixItem
+
+
+class TestRoundMatrixItem(unittest.TestCase):
+    def setUp(self):
+        self.matrix = RoundMatrixItem.from_rounds(
+            [{2: 4, 1: 3, 3: 2}, {2: 5, 1: 4}],
+            {1: "Choice 1", 2: "Choice 2", 3: "Choice 3"}
+        )
+
+    def test_from_rounds_orders_choices_by_first_appearance(self):
+        self.assertEqual(self.matrix.choice_ids, array('q', [2, 1, 3]))
+        self.assertEqual(
+            self.matrix.choice_names, ["Choice 2", "Choice 1", "Choice 3"]
+        )
+        self.assertEqual(self.matrix.round_count, 2)
+        self.assertEqual(self.matrix.round_votes(1), array('q', [5, 4, 0]))
+
+    def test_transfers_are_changes_since_the_round_before(self):
+        self.assertEqual(
+            self.matrix.transfers(), array('q', [0, 0, 0, 1, 1, -2])
+        )
+
+    def test_eliminated_are_the_choices_dropped_after_each_round(self):
+        matrix = RoundMatrixItem.from_rounds(
+            [{1: 4, 2: 3, 3: 2, 4: 1}, {1: 4, 2: 4, 3: 2}, {1: 5, 2: 5}],
+            {}
+        )
+
+        self.assertEqual(self.matrix.eliminated(), [[3], []])
+        self.assertEqual(matrix.eliminated(), [[4], [3], []])
+
+    def test_empty_matrix(self):
+        matrix = RoundMatrixItem.from_rounds([], {})
+
+        self.assertEqual(matrix.round_count, 0)
+        self.assertEqual(matrix.transfers(), array('q'))
+        self.assertEqual(matrix.eliminated(), [])
+
+    def test_csv_chunks_write_a_header_then_a_chunk_per_round(self):
+        chunks = list(csv_chunks(self.matrix))
+
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(b''.join(chunks).decode().splitlines(), [
+            'round_index,choice_id,choice_name,votes,transfer',
+            '0,2,Choice 2,4,0',
+            '0,1,Choice 1,3,0',
+            '0,3,Choice 3,2,0',
+            '1,2,Choice 2,5,1',
+            '1,1,Choice 1,4,1',
+            '1,3,Choice 3,0,-2',
+        ])
+
+    def test_csv_chunks_escape_names_read_as_formulas(self):
+        matrix = RoundMatrixItem.from_rounds(
+            [{1: 3, 2: 2, 3: 1, 4: 1, 5: 1}],
+            {
+                1: '=HYPERLINK("http://example.com")', 2: '+1', 3: '-1',
+                4: '@SUM(A1)', 5: 'Plain - name',
+            }
+        )
+
+        rows = b''.join(csv_chunks(matrix)).decode().splitlines()[1:]
+
+        self.assertEqual(rows, [
+            '0,1,"\'=HYPERLINK(""http://example.com"")",3,0',
+            "0,2,'+1,2,0",
+            "0,3,'-1,1,0",
+            "0,4,'@SUM(A1),1,0",
+            '0,5,Plain - name,1,0',
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+import random
+import unittest
+from unittest.mock import Mock
+
+from faker import Faker
+
+from ranked_choice.core.domain.items.ballot_item import BallotItem, ChoiceItem
+from ranked_choice.core.domain.items.packed_voters_item import PackedVotersItem
+from ranked_choice.core.domain.tabulation.instant_runoff import voter_rankings
+from ranked_choice.core.domain.tabulation.packed_rankings import (
+    pack_rankings,
+    unpack_rankings,
+)
+from ranked_choice.core.domain.workflows.get_votes_workflow import (
+    calculate_ranked_choice_winner,
+)
+from ranked_choice.core.domain.workflows.tabulate_many_workflow import (
+    tabulate_many_workflow,
+)
+from ranked_choice.core.repositories.ballot_repository_interface import (
+    BallotRepositoryInterface,
+)
+from ranked_choice.core.repositories.results_cache_interface import (
+    ResultsCacheInterface,
+)
+from ranked_choice.tests.unit.test_incremental_round_counter import (
+    random_electorate,
+)
+
+
+class TestTabulateManyWorkflow(unittest.TestCase):
+    def setUp(self):
+        self.fake = Faker()
+        self.rng = random.Random(1234)
+        self.mock_repository = Mock(spec=BallotRepositoryInterface)
+        self.ballots = {}
+        self.voters = {}
+        for ballot_id in range(1, 7):
+            self.ballots[ballot_id] = BallotItem(
+                id=ballot_id,
+                title=self.fake.sentence(nb_words=3),
+                slug=self.fake.slug(),
+                choices=[
+                    ChoiceItem(id=choice_id, name=f"Choice {choice_id}")
+                    for choice_id in range(1, 5)
+                ],
+                votes_version=self.fake.pyint()
+            )
+            self.voters[ballot_id] = random_electorate(
+                self.rng, self.rng.randint(0, 50), 4
+            )
+
+        self.mock_repository.get_ballot_by_id.side_effect = (
+            lambda ballot_id: self.ballots.get(ballot_id)
+        )
+        self.mock_repository.get_votes_by_ballot_id.side_effect = (
+            lambda ballot_id: PackedVotersItem.from_voters(
+                ballot_id, self.voters[ballot_id]
+            )
+        )
+
+    def _expected(self, ballot_id):
+        ballot = self.ballots[ballot_id]
+        result = calculate_ranked_choice_winner(
+            self.voters[ballot_id],
+            {choice.id: choice.name for choice in ballot.choices}
+        )
+        result.title = ballot.title
+        return result
+
+    def test_pack_rankings_round_trips(self):
+        rankings = [(3, 1, 2), (), (2,), (1, 2)]
+
+        flat_choice_ids, lengths = pack_rankings(rankings)
+
+        self.assertEqual(list(flat_choice_ids), [3, 1, 2, 2, 1, 2])
+        self.assertEqual(list(lengths), [3, 0, 1, 2])
+        self.assertEqual(list(unpack_rankings(flat_choice_ids, lengths)), rankings)
+
+    def test_tabulate_many_in_process(self):
+        items = tabulate_many_workflow(
+            [3, 1, 2],
+            max_workers=1,
+            ballot_repository=self.mock_repository
+        )
+
+        self.assertEqual([item.ballot_id for item in items], [3, 1, 2])
+        for item in items:
+            self.assertEqual(item.slug, self.ballots[item.ballot_id].slug)
+            self.assertEqual(item.total_votes, len(self.voters[item.ballot_id]))
+            self.assertEqual(item.result, self._expected(item.ballot_id))
+            self.assertGreaterEqual(item.load_seconds, 0)
+            self.assertGreaterEqual(item.tabulate_seconds, 0)
+
+    def test_tabulate_many_across_processes(self):
+        ballot_ids = list(self.ballots)
+
+        items = tabulate_many_workflow(
+            ballot_ids,
+            max_workers=2,
+            ballot_repository=self.mock_repository
+        )
+
+        self.assertEqual([item.ballot_id for item in items], ballot_ids)
+        for item in items:
+            self.assertEqual(item.result, self._expected(item.ballot_id))
+
+    def test_tabulate_many_skips_missing_ballots(self):
+        items = tabulate_many_workflow(
+            [1, 404],
+            max_workers=1,
+            ballot_repository=self.mock_repository
+        )
+
+        self.assertEqual([item.ballot_id for item in items], [1])
+        self.mock_repository.get_votes_by_ballot_id.assert_called_once_with(
+            ballot_id=1
+        )
+
+    def test_tabulate_many_warms_results_cache(self):
+        results_cache = Mock(spec=ResultsCacheInterface)
+
+        items = tabulate_many_workflow(
+            [1, 2],
+            max_workers=1,
+            ballot_repository=self.mock_repository,
+            results_cache=results_cache
+        )
+
+        self.assertEqual(results_cache.set_result.call_count, 2)
+        for item in items:
+            results_cache.set_result.assert_any_call(
+                item.ballot_id,
+                self.ballots[item.ballot_id].votes_version,
+                item.result
+            )
+
+    def test_packed_rankings_match_voter_rankings(self):
+        voter_items = self.voters[1]
+
+        flat_choice_ids, lengths = pack_rankings(voter_rankings(voter_items))
+
+        self.assertEqual(
+            list(unpack_rankings(flat_choice_ids, lengths)),
+            list(voter_rankings(voter_items))
+        )
@@ -0,0 +1,121 @@
+import threading
+import unittest
+
+from faker import Faker
+
+from ranked_choice.core.services.vote_queue import VoteQueue
+from ranked_choice.core.services.vote_queue_interface import VoteQueueFull
+
+
+class TestVoteQueue(unittest.TestCase):
+    def setUp(self):
+        self.fake = Faker()
+        self.batches = []
+
+    def voter(self):
+        return {
+            'name': self.fake.name(),
+            'ballot_id': self.fake.pyint(),
+            'votes': [{'rank': 1, 'choice_id': self.fake.pyint()}],
+        }
+
+    def flush(self, voters):
+        self.batches.append(list(voters))
+
+    def test_writes_full_batches_without_waiting(self):
+        vote_queue = VoteQueue(flush=self.flush, max_batch=3, flush_interval=60)
+        voters = [self.voter() for _ in range(6)]
+
+        futures = [vote_queue.submit(voter) for voter in voters]
+
+        for future in futures:
+            self.assertTrue(future.result(timeout=5))
+        self.assertEqual(self.batches, [voters[:3], voters[3:]])
+        vote_queue.close()
+
+    def test_writes_partial_batch_after_interval(self):
+        vote_queue = VoteQueue(flush=self.flush, max_batch=100, flush_interval=0.01)
+        voters = [self.voter() for _ in range(2)]
+
+        futures = [vote_queue.submit(voter) for voter in voters]
+
+        for future in futures:
+            self.assertTrue(future.result(timeout=5))
+        self.assertEqual(sum(self.batches, []), voters)
+        vote_queue.close()
+
+    def test_retries_failed_batch_one_voter_at_a_time(self):
+        bad_voter = self.voter()
+
+        def flush(voters):
+            if bad_voter in voters:
+                raise ValueError("Invalid choice")
+            self.batches.append(list(voters))
+
+        vote_queue = VoteQueue(flush=flush, max_batch=3, flush_interval=60)
+        voters = [self.voter(), bad_voter, self.voter()]
+
+        futures = [vote_queue.submit(voter) for voter in voters]
+
+        self.assertTrue(futures[0].result(timeout=5))
+        self.assertIsInstance(futures[1].exception(timeout=5), ValueError)
+        self.assertTrue(futures[2].result(timeout=5))
+        self.assertEqual(self.batches, [[voters[0]], [voters[2]]])
+        vote_queue.close()
+
+    def test_rejects_voters_beyond_max_pending(self):
+        release = threading.Event()
+        writing = threading.Event()
+
+        def flush(voters):
+            writing.set()
+            release.wait()
+
+        vote_queue = VoteQueue(
+            flush=flush, max_batch=1, flush_interval=60, max_pending=2
+        )
+        vote_queue.submit(self.voter())
+        writing.wait(timeout=5)
+        vote_queue.submit(self.voter())
+        vote_queue.submit(self.voter())
+
+        with self.assertRaises(VoteQueueFull):
+            vote_queue.submit(self.voter())
+
+        release.set()
+        vote_queue.close()
+
+    def test_close_writes_queued_voters(self):
+        vote_queue = VoteQueue(flush=self.flush, max_batch=100, flush_interval=60)
+        voters = [self.voter() for _ in range(5)]
+        futures = [vote_queue.submit(voter) for voter in voters]
+
+        vote_queue.close()
+
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertEqual(sum(self.batches, []), voters)
+        with self.assertRaises(VoteQueueFull):
+            vote_queue.submit(self.voter())
+
+    def test_close_during_submit_still_writes_the_voter(self):
+        vote_queue = VoteQueue(flush=self.flush, max_batch=100, flush_interval=60)
+        voter = self.voter()
+        put_nowait = vote_queue._queue.put_nowait
+        closer = threading.Thread(target=vote_queue.close)
+
+        def put_after_close_starts(item):
+            # Give close every chance to queue _CLOSE ahead of this voter
+            closer.start()
+            closer.join(timeout=0.2)
+            put_nowait(item)
+
+        vote_queue._queue.put_nowait = put_after_close_starts
+        future = vote_queue.submit(voter)
+        closer.join(timeout=5)
+
+        self.assertTrue(future.result(timeout=5))
+        self.assertEqual(self.batches, [[voter]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,9 +9,17 @@ setup(
         "djangorestframework>=3.14.0,<4.0.0",
         "psycopg2-binary>=2.9.6,<3.0.0",
         "gunicorn>=20.1.0,<21.0.0",
+        "uvicorn>=0.29.0,<1.0.0",
+        "uvicorn-worker>=0.2.0,<1.0.0",
         "django-cors-headers>=4.0.0,<5.0.0",
         "python-dotenv>=1.0.0,<2.0.0",
+        "numpy>=1.26.0,<3.0.0",
+        "orjson>=3.8.0,<4.0.0",
         "pytest>=7.0.0,<8.0.0",
         "pytest-django>=4.5.2,<5.0.0",
     ],
+    extras_require={
+        # Arrow and Parquet results exports
+        "export": ["pyarrow>=14.0.0"],
+    },
 )